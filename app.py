@@ -1,3 +1,4 @@
+import logging
 from flask import Flask, jsonify
 from config.config import Config
 from utils.db import init_db, db
@@ -6,14 +7,60 @@ def create_app(config_class=Config):
 
     app = Flask(__name__)
     app.config.from_object(config_class)
+    
+    logging.basicConfig(
+        level=app.config.get('LOG_LEVEL', 'INFO'),
+        format='%(asctime)s %(levelname)s %(name)s: %(message)s'
+    )
 
     #init extension
     init_db(app)
     
+    from services.response_cache import init_response_cache
+    init_response_cache(app)
+    
+    from services.negative_cache import init_negative_cache
+    init_negative_cache(app)
+    
+    from services.name_index import init_name_index
+    init_name_index(app)
+    
+    from services.stat_matrix import init_stat_matrix
+    init_stat_matrix(app)
+    
+    from services.job_queue import init_job_queue
+    init_job_queue(app)
+    
     # Register blueprints
     from routes.pokemon_routes import pokemon_bp 
     app.register_blueprint(pokemon_bp, url_prefix='/api/pokemon')
     
+    from routes.analytics_routes import analytics_bp
+    app.register_blueprint(analytics_bp, url_prefix='/api/pokemon/analytics')
+    
+    # Instrumentation: /metrics, Server-Timing, slow-request log
+    from utils.metrics import init_metrics, metrics
+    from services.response_cache import pokemon_response_cache
+    from services.negative_cache import unknown_pokemon_names
+    from services.pokeapi_cache import get_pokeapi_cache
+    with app.app_context():
+        init_metrics(app, db.engines.values())
+    metrics.register_cache('response', pokemon_response_cache.stats)
+    metrics.register_cache('unknown_names', unknown_pokemon_names.stats)
+    
+    def pokeapi_cache_stats():
+        cache = get_pokeapi_cache(app.config, app.instance_path)
+        return cache.stats() if cache else None
+    metrics.register_cache('pokeapi', pokeapi_cache_stats)
+    
+    # Gzip buffered responses (registered after metrics so its time is measured)
+    from utils.compression import init_compression
+    init_compression(app)
+    
+    # Register CLI commands
+    from commands import pokescouter_cli
+    app.cli.add_command(pokescouter_cli)
+    
     #---------general routes------------
     @app.route('/health', methods=['GET'])
     def health_check():
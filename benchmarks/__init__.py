@@ -0,0 +1,5 @@
+"""
+Description: Performance benchmarks package.
+Author: Bryan Vela
+Created: 2026-10-17
+"""
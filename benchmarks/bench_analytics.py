@@ -0,0 +1,114 @@
+"""
+Description: Stat analytics latency, NumPy stat matrix vs SQL-only queries.
+Author: Bryan Vela
+Created: 2026-10-17
+
+Usage:
+    python -m benchmarks.bench_analytics [--size 1300] [--repeat 50]
+"""
+import argparse
+import os
+import statistics
+import time
+
+from sqlalchemy import text
+
+from benchmarks.bench_batch_save import fresh_app, make_pokemon
+from services.analytics_service import StatAnalyticsService
+from services.pokemon_service import PokemonService
+from services.stat_matrix import StatMatrix, stat_matrix
+from utils.db import db
+
+PERCENTILES = (10, 25, 50, 75, 90)
+SUMMARY_COLUMNS = ('hp', 'attack', 'defense', 'special_attack', 'special_defense', 'speed', 'total')
+
+
+def sql_percentiles():
+    """Nearest-rank percentiles, one ORDER BY ... OFFSET query per stat and percentile."""
+    count = db.session.execute(text('SELECT COUNT(*) FROM pokemon_stat_summary')).scalar()
+    return {
+        column: {
+            p: db.session.execute(
+                text(f'SELECT {column} FROM pokemon_stat_summary ORDER BY {column} LIMIT 1 OFFSET :k'),
+                {'k': max(0, int(round(p / 100 * (count - 1))))}
+            ).scalar()
+            for p in PERCENTILES
+        }
+        for column in SUMMARY_COLUMNS
+    }
+
+
+def sql_top_by_total(n=10):
+    return db.session.execute(text('''
+        SELECT type_name, pokemon_id, total FROM (
+            SELECT t.name AS type_name, s.pokemon_id, s.total,
+                   ROW_NUMBER() OVER (PARTITION BY pt.type_id ORDER BY s.total DESC, s.pokemon_id) AS position
+            FROM pokemon_stat_summary s
+            JOIN pokemon_types pt ON pt.pokemon_id = s.pokemon_id
+            JOIN pokemon_type t ON t.id = pt.type_id
+        ) WHERE position <= :n
+    '''), {'n': n}).all()
+
+
+def sql_means_by_type():
+    averages = ', '.join(f'AVG(s.{column})' for column in SUMMARY_COLUMNS)
+    return db.session.execute(text(f'''
+        SELECT t.name, COUNT(*), {averages}
+        FROM pokemon_stat_summary s
+        JOIN pokemon_types pt ON pt.pokemon_id = s.pokemon_id
+        JOIN pokemon_type t ON t.id = pt.type_id
+        GROUP BY t.name
+    ''')).all()
+
+
+def timed(fn, repeat):
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--size', type=int, default=1300)
+    parser.add_argument('--repeat', type=int, default=50)
+    args = parser.parse_args()
+
+    app, path = fresh_app()
+    with app.app_context():
+        PokemonService().save_pokemon_batch([make_pokemon(number) for number in range(1, args.size + 1)])
+
+        started = time.perf_counter()
+        stat_matrix.reset()
+        matrix = stat_matrix.snapshot()
+        build_ms = (time.perf_counter() - started) * 1000
+
+        changed = list(range(1, 51))
+        started = time.perf_counter()
+        matrix.merge(StatMatrix.load(db.session, changed), changed)
+        merge_ms = (time.perf_counter() - started) * 1000
+
+        service = StatAnalyticsService(matrix)
+        cases = (
+            ('percentiles', lambda: service.percentiles(PERCENTILES), sql_percentiles),
+            ('top_by_total', lambda: service.top_by_total(10), sql_top_by_total),
+            ('means_by_type', service.means_by_type, sql_means_by_type)
+        )
+
+        print(f"pokemon: {len(matrix)}, stat matrix {matrix.stats.nbytes / 1024:.1f} KiB")
+        print(f"snapshot build: {build_ms:.1f} ms, incremental merge of 50 rows: {merge_ms:.1f} ms")
+        print(f"{'query':>14} {'numpy ms':>9} {'sql ms':>9} {'speedup':>8}")
+        for label, numpy_fn, sql_fn in cases:
+            numpy_ms = timed(numpy_fn, args.repeat)
+            sql_ms = timed(sql_fn, args.repeat)
+            print(f"{label:>14} {numpy_ms:>9.3f} {sql_ms:>9.3f} {sql_ms / numpy_ms:>7.1f}x")
+
+        db.session.remove()
+        db.engine.dispose()
+    os.remove(path)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,129 @@
+"""
+Description: Compare the per-row ORM save path with the batch insert path.
+Author: Bryan Vela
+Created: 2026-10-17
+
+Usage:
+    python -m benchmarks.bench_batch_save [--sizes 100 1000]
+"""
+import argparse
+import os
+import tempfile
+import time
+
+from app import create_app
+from config.config import Config
+from models.pokemon import Pokemon
+from models.pokemonType import PokemonType
+from models.pokemontypes import PokemonTypeLink
+from models.pokemonStat import PokemonStat
+from models.pokemonAbility import PokemonAbility
+from services.pokemon_service import PokemonService
+from utils.db import db
+
+TYPES = [
+    'normal', 'fire', 'water', 'grass', 'electric', 'ice', 'fighting', 'poison', 'ground',
+    'flying', 'psychic', 'bug', 'rock', 'ghost', 'dragon', 'dark', 'steel', 'fairy'
+]
+STATS = ['hp', 'attack', 'defense', 'special-attack', 'special-defense', 'speed']
+
+
+def make_pokemon(number):
+    """Synthetic transformed Pokemon dict (same shape as PokeAPITransformer output)."""
+    types = [{'name': TYPES[number % 18], 'slot': 1}]
+    if number % 2:
+        types.append({'name': TYPES[(number + 7) % 18], 'slot': 2})
+    return {
+        'name': f'bench-{number}',
+        'pokedex_number': number,
+        'height': number % 30 + 1,
+        'weight': number % 900 + 1,
+        'sprite_front_default': f'https://example.invalid/{number}.png',
+        'sprite_front_shiny': None,
+        'types': types,
+        'stats': [{'name': stat, 'value': (number * (i + 3)) % 200 + 5} for i, stat in enumerate(STATS)],
+        'abilities': [
+            {'name': f'ability-{number % 50}', 'is_hidden': False, 'slot': 1},
+            {'name': f'ability-{number % 17}', 'is_hidden': True, 'slot': 3}
+        ]
+    }
+
+
+def save_orm_per_row(data):
+    """The previous write path: ORM adds per row, ilike lookup + commit per type."""
+    pokemon = Pokemon(
+        name=data['name'],
+        pokedex_number=data['pokedex_number'],
+        height=data['height'],
+        weight=data['weight'],
+        sprite_front_default=data.get('sprite_front_default'),
+        sprite_front_shiny=data.get('sprite_front_shiny')
+    )
+    db.session.add(pokemon)
+    db.session.flush()
+    for type_data in data['types']:
+        pokemon_type = PokemonType.query.filter(PokemonType.name.ilike(type_data['name'])).first()
+        if not pokemon_type:
+            pokemon_type = PokemonType.create({'name': type_data['name'].lower()})
+        pokemon.type_links.append(PokemonTypeLink(type=pokemon_type, slot=type_data['slot']))
+    for stat_data in data['stats']:
+        db.session.add(PokemonStat(pokemon_id=pokemon.id, name=stat_data['name'], value=stat_data['value']))
+    for ability_data in data['abilities']:
+        db.session.add(PokemonAbility(
+            pokemon_id=pokemon.id,
+            name=ability_data['name'],
+            is_hidden=1 if ability_data['is_hidden'] else 0,
+            slot=ability_data['slot']
+        ))
+    db.session.commit()
+
+
+def fresh_app():
+    """App bound to an empty temporary SQLite file."""
+    path = tempfile.mktemp(suffix='.db')
+
+    class BenchConfig(Config):
+        SQLALCHEMY_DATABASE_URI = f'sqlite:///{path}'
+        POKEAPI_CACHE_PATH = ''
+
+    return create_app(BenchConfig), path
+
+
+def run(size):
+    items = [make_pokemon(number) for number in range(1, size + 1)]
+    results = {}
+
+    for label in ('orm_per_row', 'batch_insert'):
+        app, path = fresh_app()
+        with app.app_context():
+            service = PokemonService()
+            started = time.perf_counter()
+            if label == 'orm_per_row':
+                for item in items:
+                    save_orm_per_row(item)
+            else:
+                service.save_pokemon_batch(items)
+            elapsed = time.perf_counter() - started
+            assert Pokemon.count() == size
+            db.session.remove()
+            db.engine.dispose()
+        os.remove(path)
+        results[label] = size / elapsed
+
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[100, 1000])
+    args = parser.parse_args()
+
+    print(f"{'size':>6} {'orm_per_row/s':>15} {'batch_insert/s':>15} {'speedup':>8}")
+    for size in args.sizes:
+        results = run(size)
+        speedup = results['batch_insert'] / results['orm_per_row']
+        print(f"{size:>6} {results['orm_per_row']:>15.0f} {results['batch_insert']:>15.0f} {speedup:>7.1f}x")
+
+
+if __name__ == '__main__':
+    main()
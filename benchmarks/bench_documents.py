@@ -0,0 +1,101 @@
+"""
+Description: List latency, stored JSON documents vs loading relationships and to_dict.
+Author: Bryan Vela
+Created: 2026-10-17
+
+Usage:
+    python -m benchmarks.bench_documents [--size 500] [--limit 500] [--repeat 30]
+"""
+import argparse
+import os
+import statistics
+import time
+
+from flask import jsonify
+from sqlalchemy import event
+
+from benchmarks.datasets import seeded_app
+from services.response_cache import pokemon_response_cache
+from utils.db import db
+
+
+def rebuilt_list(service, limit):
+    """The previous list path: ORM page with selectin loads, to_dict, jsonify."""
+    pokemon_list, next_cursor = service.get_all_pokemon(limit=limit)
+    return jsonify({
+        'success': True,
+        'count': len(pokemon_list),
+        'next_cursor': next_cursor,
+        'data': [p.to_dict() for p in pokemon_list]
+    }).get_data()
+
+
+def rebuilt_single(service, pokemon_id):
+    return jsonify({'success': True, 'data': service.get_pokemon_by_id(pokemon_id).to_dict()}).get_data()
+
+
+def timed(call, repeat, counter):
+    samples, queries = [], []
+    for step in range(repeat):
+        db.session.remove()
+        pokemon_response_cache.clear()
+        before = counter[0]
+        started = time.perf_counter()
+        call(step)
+        samples.append((time.perf_counter() - started) * 1000)
+        queries.append(counter[0] - before)
+    return statistics.median(samples), max(samples), statistics.mean(queries)
+
+
+def run(size, limit, repeat):
+    from services.pokemon_service import PokemonService
+
+    app, path = seeded_app(size)
+    counter = [0]
+    try:
+        with app.app_context():
+            for engine in db.engines.values():
+                event.listen(engine, 'before_cursor_execute', lambda *args: counter.__setitem__(0, counter[0] + 1))
+            client = app.test_client()
+
+            def old_list(step):
+                with app.test_request_context('/api/pokemon/'):
+                    rebuilt_list(PokemonService(), limit)
+
+            def old_single(step):
+                with app.test_request_context('/api/pokemon/1'):
+                    rebuilt_single(PokemonService(), step % size + 1)
+
+            # Same bytes either way
+            with app.test_request_context('/api/pokemon/'):
+                assert rebuilt_list(PokemonService(), limit) == client.get(f'/api/pokemon/?limit={limit}').get_data()
+
+            cases = (
+                (f'list limit={limit}, to_dict', old_list),
+                (f'list limit={limit}, documents', lambda step: client.get(f'/api/pokemon/?limit={limit}')),
+                ('single by id, to_dict', old_single),
+                ('single by id, document', lambda step: client.get(f'/api/pokemon/{step % size + 1}')),
+            )
+            for label, call in cases:
+                call(-1)
+                median, worst, queries = timed(call, repeat, counter)
+                print(f"{label:<32} median {median:8.2f} ms  max {worst:8.2f} ms  {queries:4.1f} queries")
+
+            db.session.remove()
+            for engine in db.engines.values():
+                engine.dispose()
+    finally:
+        os.remove(path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--size', type=int, default=500)
+    parser.add_argument('--limit', type=int, default=500)
+    parser.add_argument('--repeat', type=int, default=30)
+    args = parser.parse_args()
+    run(args.size, args.limit, args.repeat)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,95 @@
+"""
+Description: Memory use and lookup latency of the typeahead name index.
+Author: Bryan Vela
+Created: 2026-10-17
+
+Usage:
+    python -m benchmarks.bench_suggest [--names 1300] [--queries 2000]
+"""
+import argparse
+import itertools
+import random
+import statistics
+import time
+import tracemalloc
+
+from services.name_index import NameIndex
+
+SYLLABLES = [
+    'char', 'iz', 'ard', 'pi', 'ka', 'chu', 'bul', 'ba', 'saur', 'squir', 'tle', 'gar',
+    'chomp', 'dra', 'go', 'nite', 'mew', 'two', 'eev', 'ee', 'lu', 'cario', 'gen', 'gar',
+    'snor', 'lax', 'gya', 'ra', 'dos', 'zap', 'mol', 'tres', 'vul', 'pix', 'gren', 'in'
+]
+
+
+def make_names(count, seed=7):
+    """Deterministic pseudo Pokemon names (plus a few real ones)."""
+    rng = random.Random(seed)
+    names = {'charizard', 'pikachu', 'garchomp', 'bulbasaur', 'dragonite', 'lucario'}
+    for parts in itertools.count(2):
+        for combo in itertools.product(SYLLABLES, repeat=parts):
+            if len(names) >= count:
+                return sorted(names)
+            if rng.random() < 0.5:
+                names.add(''.join(combo))
+            if rng.random() < 0.05:
+                names.add(''.join(combo) + '-mega')
+
+
+def typo(name, rng):
+    """Drop, swap or replace one character."""
+    i = rng.randrange(len(name))
+    kind = rng.choice(('drop', 'swap', 'replace'))
+    if kind == 'drop':
+        return name[:i] + name[i + 1:]
+    if kind == 'swap' and i < len(name) - 1:
+        return name[:i] + name[i + 1] + name[i] + name[i + 2:]
+    return name[:i] + rng.choice('aeioubcdr') + name[i + 1:]
+
+
+def percentile(samples, q):
+    return statistics.quantiles(samples, n=100)[q - 1] if len(samples) > 1 else samples[0]
+
+
+def timed(index, queries):
+    samples = []
+    for query in queries:
+        started = time.perf_counter()
+        index.suggest(query, 10)
+        samples.append((time.perf_counter() - started) * 1e6)
+    return samples
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--names', type=int, default=1300)
+    parser.add_argument('--queries', type=int, default=2000)
+    args = parser.parse_args()
+
+    rng = random.Random(11)
+    names = make_names(args.names)
+
+    tracemalloc.start()
+    started = time.perf_counter()
+    index = NameIndex()
+    index.build(enumerate(names, 1))
+    build_ms = (time.perf_counter() - started) * 1000
+    traced, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    prefix_queries = [rng.choice(names)[:rng.randint(1, 5)] for _ in range(args.queries)]
+    fuzzy_queries = [typo(rng.choice(names), rng) for _ in range(args.queries)]
+
+    print(f"names: {len(index)}, build: {build_ms:.1f} ms")
+    print(f"memory: {index.memory_bytes() / 1024:.0f} KiB (structures), {traced / 1024:.0f} KiB (traced)")
+    print(f"'charizrd' -> {[s['name'] for s in index.suggest('charizrd', 3)]}")
+    for label, queries in (('prefix', prefix_queries), ('fuzzy', fuzzy_queries)):
+        samples = timed(index, queries)
+        print(
+            f"{label:>6}: p50 {percentile(samples, 50):.0f} us, "
+            f"p95 {percentile(samples, 95):.0f} us, p99 {percentile(samples, 99):.0f} us"
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,110 @@
+"""
+Description: Seeded SQLite datasets of synthetic Pokemon for benchmarks.
+Author: Bryan Vela
+Created: 2026-10-17
+
+Usage:
+    python -m benchmarks.datasets [--sizes 100 1000 10000] [--force]
+"""
+import argparse
+import os
+import shutil
+import tempfile
+import time
+
+from app import create_app
+from benchmarks.bench_batch_save import make_pokemon
+from config.config import Config
+from utils.db import db
+
+# Seeded databases are built once and copied for every run
+DATA_DIR = os.path.join(os.path.dirname(__file__), '.data')
+
+DEFAULT_SIZES = (100, 1000, 10000)
+
+# Bump when the schema or seeding changes so cached datasets are rebuilt
+DATASET_VERSION = 2
+
+
+def bench_config(database_path, pokeapi_url=None, **overrides):
+    """Config for a benchmark app: no disk cache, quiet logs, no slow-request log."""
+
+    class BenchConfig(Config):
+        SQLALCHEMY_DATABASE_URI = f'sqlite:///{database_path}'
+        POKEAPI_CACHE_PATH = ''
+        POKEAPI_RATE_LIMIT = 0
+        POKEAPI_BACKOFF_FACTOR = 0.05
+        LOG_LEVEL = 'WARNING'
+        SLOW_REQUEST_MS = 0
+
+    if pokeapi_url:
+        BenchConfig.POKEAPI_BASE_URL = pokeapi_url
+    for key, value in overrides.items():
+        setattr(BenchConfig, key, value)
+    return BenchConfig
+
+
+def dataset_path(size):
+    return os.path.join(DATA_DIR, f'pokemon_{size}_v{DATASET_VERSION}.db')
+
+
+def seed(size, force=False, chunk=1000):
+    """
+    Build the dataset file for size Pokemon (no-op if it already exists).
+
+    Rows go through PokemonService.save_pokemon_batch, the same write path
+    the importer uses, so every table, index and summary row is populated.
+    """
+    from services.pokemon_service import PokemonService
+
+    path = dataset_path(size)
+    if os.path.exists(path) and not force:
+        return path
+
+    os.makedirs(DATA_DIR, exist_ok=True)
+    building = path + '.building'
+    if os.path.exists(building):
+        os.remove(building)
+
+    app = create_app(bench_config(building))
+    with app.app_context():
+        service = PokemonService()
+        for start in range(1, size + 1, chunk):
+            service.save_pokemon_batch(
+                [make_pokemon(number) for number in range(start, min(start + chunk, size + 1))]
+            )
+        db.session.remove()
+        db.engine.dispose()
+
+    os.replace(building, path)
+    return path
+
+
+def seeded_app(size, pokeapi_url=None, **overrides):
+    """
+    App bound to a private copy of the seeded dataset (overrides: config values).
+
+    Returns:
+        tuple: (app, path of the copy - delete it when done)
+    """
+    source = seed(size)
+    handle, path = tempfile.mkstemp(suffix=f'-{size}.db')
+    os.close(handle)
+    shutil.copyfile(source, path)
+    return create_app(bench_config(path, pokeapi_url, **overrides)), path
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--sizes', type=int, nargs='+', default=list(DEFAULT_SIZES))
+    parser.add_argument('--force', action='store_true', help='Rebuild existing datasets.')
+    args = parser.parse_args()
+
+    for size in args.sizes:
+        started = time.perf_counter()
+        path = seed(size, force=args.force)
+        print(f"{size:>6} Pokemon -> {path} ({time.perf_counter() - started:.1f}s)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,171 @@
+"""
+Description: Concurrent read/write load test for the SQLite database profiles.
+Author: Bryan Vela
+Created: 2026-10-17
+
+Reader threads hit the uncached list/search/type/ability routes, first on
+their own and then while bulk syncs in separate worker processes write
+new Pokemon from the stub PokeAPI (each writer its own names, like two app
+workers or an import next to the server). Run once per profile:
+
+    default     rollback journal, no pragmas, one engine, deferred write transactions
+    production  the Config defaults (WAL, pragmas, reader engine, BEGIN IMMEDIATE writers)
+
+Usage:
+    python -m benchmarks.load_sqlite [--size 1000] [--readers 4] [--seconds 5] [--sync 400]
+        [--writers 2] [--profiles default production]
+"""
+import argparse
+import multiprocessing
+import os
+import threading
+import time
+
+import numpy as np
+
+from app import create_app
+from benchmarks.datasets import bench_config, seeded_app
+from benchmarks.stub_pokeapi import StubPokeAPI
+from services.negative_cache import unknown_pokemon_names
+from utils.db import db
+
+PROFILES = {
+    'default': {
+        'DB_READ_ENGINE': False,
+        'DB_SERIALIZE_WRITES': False,
+        'SQLITE_JOURNAL_MODE': 'DELETE',
+        'SQLITE_SYNCHRONOUS': '',
+        'SQLITE_CACHE_SIZE': '',
+        'SQLITE_MMAP_SIZE': '',
+        'SQLITE_BUSY_TIMEOUT': ''
+    },
+    'production': {}
+}
+
+READ_PATHS = (
+    '/api/pokemon/?limit=50',
+    '/api/pokemon/search?min_attack=100&limit=50',
+    '/api/pokemon/type/fire?limit=50',
+    '/api/pokemon/ability/ability-7?limit=50'
+)
+
+
+def read_load(app, readers, stop):
+    """Start reader threads that run until stop is set; returns (threads, latencies ms, errors)."""
+    latencies, errors = [], []
+
+    def reader(offset):
+        client = app.test_client()
+        step = offset
+        while not stop.is_set():
+            started = time.perf_counter()
+            try:
+                status = client.get(READ_PATHS[step % len(READ_PATHS)]).status_code
+            except Exception:
+                status = 500
+            latencies.append((time.perf_counter() - started) * 1000)
+            if status != 200:
+                errors.append(status)
+            step += 1
+
+    threads = [threading.Thread(target=reader, args=(n,)) for n in range(readers)]
+    for thread in threads:
+        thread.start()
+    return threads, latencies, errors
+
+
+def summarize(latencies, errors, seconds):
+    p50, p95, p99 = np.percentile(latencies, [50, 95, 99]) if latencies else (0, 0, 0)
+    return (f"{len(latencies) / seconds:>7.0f} req/s  p50 {p50:>7.2f}  p95 {p95:>7.2f}  "
+            f"p99 {p99:>8.2f} ms  {len(errors)} errors")
+
+
+def sync_worker(path, pokeapi_url, profile, names, outcome):
+    """Bulk sync in its own process, like a second app worker."""
+    from services.pokemon_service import PokemonService
+
+    app = create_app(bench_config(path, pokeapi_url, **PROFILES[profile]))
+    with app.app_context():
+        started = time.perf_counter()
+        try:
+            result = PokemonService().sync_pokemon_list(names)
+            outcome['saved'] = len(result['success'])
+            outcome['failed'] = len(result['failed'])
+        except Exception as e:
+            outcome['error'] = f'{type(e).__name__}: {e}'
+        outcome['seconds'] = time.perf_counter() - started
+
+
+def run_profile(profile, args):
+    stub = StubPokeAPI(args.size + args.sync).start()
+    app, path = seeded_app(args.size, pokeapi_url=stub.url, **PROFILES[profile])
+    names = [f'bench-{number}' for number in range(args.size + 1, args.size + args.sync + 1)]
+    batches = [names[start::args.writers] for start in range(args.writers)]
+
+    try:
+        # Readers alone
+        stop = threading.Event()
+        threads, latencies, errors = read_load(app, args.readers, stop)
+        time.sleep(args.seconds)
+        stop.set()
+        for thread in threads:
+            thread.join()
+        print(f"  reads only        {summarize(latencies, errors, args.seconds)}")
+
+        # Readers during bulk syncs from other processes
+        context = multiprocessing.get_context('spawn')
+        with context.Manager() as manager:
+            outcomes = [manager.dict() for _ in batches]
+            writers = [
+                context.Process(target=sync_worker, args=(path, stub.url, profile, batch, outcome))
+                for batch, outcome in zip(batches, outcomes)
+            ]
+            stop = threading.Event()
+            threads, latencies, errors = read_load(app, args.readers, stop)
+            started = time.perf_counter()
+            for writer in writers:
+                writer.start()
+            for writer in writers:
+                writer.join()
+            elapsed = time.perf_counter() - started
+            outcomes = [dict(outcome) for outcome in outcomes]
+        stop.set()
+        for thread in threads:
+            thread.join()
+        print(f"  reads during sync {summarize(latencies, errors, elapsed)}")
+        for number, outcome in enumerate(outcomes, start=1):
+            if 'error' in outcome:
+                print(f"  sync {number}            failed after {outcome['seconds']:.1f}s: {outcome['error']}")
+            else:
+                print(f"  sync {number}            {outcome['saved']} saved, {outcome['failed']} failed "
+                      f"in {outcome['seconds']:.1f}s")
+
+        with app.app_context():
+            db.session.remove()
+            for engine in db.engines.values():
+                engine.dispose()
+    finally:
+        stub.stop()
+        unknown_pokemon_names.purge()
+        for suffix in ('', '-wal', '-shm'):
+            if os.path.exists(path + suffix):
+                os.remove(path + suffix)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--size', type=int, default=1000, help='Seeded Pokemon.')
+    parser.add_argument('--readers', type=int, default=4, help='Concurrent reader threads.')
+    parser.add_argument('--seconds', type=float, default=5.0, help='Reads-only phase length.')
+    parser.add_argument('--sync', type=int, default=400, help='Pokemon written by the bulk syncs.')
+    parser.add_argument('--writers', type=int, default=2, help='Concurrent bulk sync processes.')
+    parser.add_argument('--profiles', nargs='+', choices=sorted(PROFILES), default=['default', 'production'])
+    args = parser.parse_args()
+
+    for profile in args.profiles:
+        print(f"{profile} profile ({args.size} Pokemon, {args.readers} readers):")
+        run_profile(profile, args)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,161 @@
+"""
+Description: Local PokeAPI stand-in with configurable latency and error rate.
+Author: Bryan Vela
+Created: 2026-10-17
+
+Serves /pokemon/<name or id>, /pokemon?limit=&offset= and /type/<name>
+for the synthetic Pokemon "bench-1" ... "bench-<count>".
+
+Usage:
+    python -m benchmarks.stub_pokeapi [--port 8765] [--count 1000] [--latency-ms 50] [--error-rate 0.05]
+"""
+import argparse
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+from benchmarks.bench_batch_save import make_pokemon
+from services.type_chart import BUNDLED_TYPE_CHART
+
+
+def pokeapi_payload(number):
+    """make_pokemon(number) in PokeAPI /pokemon/<name> shape."""
+    data = make_pokemon(number)
+    return {
+        'id': number,
+        'name': data['name'],
+        'height': data['height'],
+        'weight': data['weight'],
+        'sprites': {
+            'front_default': data['sprite_front_default'],
+            'front_shiny': data['sprite_front_shiny']
+        },
+        'types': [{'slot': t['slot'], 'type': {'name': t['name']}} for t in data['types']],
+        'stats': [{'base_stat': s['value'], 'stat': {'name': s['name']}} for s in data['stats']],
+        'abilities': [
+            {'ability': {'name': a['name']}, 'is_hidden': a['is_hidden'], 'slot': a['slot']}
+            for a in data['abilities']
+        ]
+    }
+
+
+class StubPokeAPI:
+    """
+    Threaded HTTP server mimicking the PokeAPI endpoints the app calls.
+
+    latency_ms is added to every response; error_rate is the fraction of
+    requests answered with 503 (the client's retry path).
+    """
+
+    def __init__(self, count=1000, latency_ms=0.0, error_rate=0.0, port=0, seed=1):
+        self.count = count
+        self.latency = latency_ms / 1000.0
+        self.error_rate = error_rate
+        self.requests = 0
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        with open(BUNDLED_TYPE_CHART, 'r', encoding='utf-8') as handle:
+            self._types = json.load(handle)
+        self.server = ThreadingHTTPServer(('127.0.0.1', port), self._handler())
+        self.server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self.server.server_address[:2]
+        return f'http://{host}:{port}'
+
+    def _number(self, key):
+        if key.isdigit():
+            number = int(key)
+        elif key.startswith('bench-') and key[6:].isdigit():
+            number = int(key[6:])
+        else:
+            return None
+        return number if 1 <= number <= self.count else None
+
+    def respond(self, path, query):
+        """(status, body) for a request path."""
+        parts = path.strip('/').split('/')
+        if parts == ['pokemon']:
+            limit = int(query.get('limit', ['20'])[0])
+            offset = int(query.get('offset', ['0'])[0])
+            end = min(self.count, offset + limit)
+            return 200, {
+                'count': self.count,
+                'next': f'/pokemon?limit={limit}&offset={end}' if end < self.count else None,
+                'previous': None,
+                'results': [
+                    {'name': f'bench-{number}', 'url': f'/pokemon/{number}/'}
+                    for number in range(offset + 1, end + 1)
+                ]
+            }
+        if len(parts) == 2 and parts[0] == 'pokemon':
+            number = self._number(parts[1])
+            if number is not None:
+                return 200, pokeapi_payload(number)
+        if len(parts) == 2 and parts[0] == 'type' and parts[1] in self._types:
+            return 200, self._types[parts[1]]
+        return 404, {'detail': 'Not found.'}
+
+    def _handler(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                with stub._lock:
+                    stub.requests += 1
+                    failing = stub._random.random() < stub.error_rate
+                if stub.latency:
+                    time.sleep(stub.latency)
+
+                url = urlparse(self.path)
+                if failing:
+                    status, body = 503, {'detail': 'Service unavailable.'}
+                else:
+                    status, body = stub.respond(url.path, parse_qs(url.query))
+
+                data = json.dumps(body).encode('utf-8')
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+        return Handler
+
+    def start(self):
+        self._thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--count', type=int, default=1000)
+    parser.add_argument('--latency-ms', type=float, default=50.0)
+    parser.add_argument('--error-rate', type=float, default=0.0)
+    args = parser.parse_args()
+
+    stub = StubPokeAPI(args.count, args.latency_ms, args.error_rate, port=args.port)
+    print(f"Stub PokeAPI on {stub.url} ({args.count} Pokemon, {args.latency_ms} ms, "
+          f"{args.error_rate:.0%} errors) - set POKEAPI_BASE_URL={stub.url}")
+    try:
+        stub.server.serve_forever()
+    except KeyboardInterrupt:
+        stub.stop()
+
+
+if __name__ == '__main__':
+    main()
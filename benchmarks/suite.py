@@ -0,0 +1,290 @@
+"""
+Description: Route and service benchmark suite with JSON results and regression check.
+Author: Bryan Vela
+Created: 2026-10-17
+
+Runs every route and service entry point against seeded datasets
+(benchmarks/datasets.py) and a local stub PokeAPI (benchmarks/stub_pokeapi.py),
+recording p50/p95/p99 latency, SQL queries per call and peak Python memory.
+Routes served from the response cache are measured twice: "[cold]" clears
+the cache before every call, "[warm]" fills it for every step first.
+
+Usage:
+    python -m benchmarks.suite [--sizes 100 1000 10000] [--repeat 30]
+        [--latency-ms 20] [--error-rate 0.0] [--only suggest similar]
+        [--output results.json] [--baseline previous.json] [--max-slowdown 0.2]
+
+Exit status is 1 when --baseline is given and any case's p95 is more than
+--max-slowdown slower (0.2 = 20%) than the baseline run.
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+import numpy as np
+from sqlalchemy import event
+
+from benchmarks.datasets import DEFAULT_SIZES, seeded_app
+from benchmarks.stub_pokeapi import StubPokeAPI
+from services.negative_cache import unknown_pokemon_names
+from services.response_cache import pokemon_response_cache
+from utils.db import db
+
+# Below this p95 (ms) timer noise dominates, so slowdowns are not flagged
+MIN_COMPARABLE_MS = 0.5
+
+# New Pokemon fetched from the stub per sync_pokemon_list call
+SYNC_BATCH = 20
+
+# Route cases answered from pokemon_response_cache once warm
+CACHED_ROUTES = ('GET /api/pokemon/<id>', 'GET /api/pokemon/name/<name>')
+
+
+class QueryCounter:
+    """Counts statements executed on the app's engines."""
+
+    def __init__(self, engines):
+        self.count = 0
+        for engine in engines:
+            event.listen(engine, 'before_cursor_execute', self._count)
+
+    def _count(self, *args):
+        self.count += 1
+
+
+class Upstream:
+    """Hands out names the stub knows but the database does not."""
+
+    def __init__(self, first):
+        self.next_number = first
+
+    def take(self, count=1):
+        names = [f'bench-{number}' for number in range(self.next_number, self.next_number + count)]
+        self.next_number += count
+        return names
+
+
+def route_cases(size):
+    """(name, call(client, step)) for every read route plus the upstream fetch."""
+
+    def pokemon_id(step):
+        return step * 7919 % size + 1
+
+    def consume(response):
+        # Streamed responses only do their work when iterated
+        for _ in response.response:
+            pass
+        return response
+
+    return [
+        ('GET /api/pokemon/', lambda c, i: c.get('/api/pokemon/?limit=50')),
+        ('GET /api/pokemon/<id>', lambda c, i: c.get(f'/api/pokemon/{pokemon_id(i)}')),
+        ('GET /api/pokemon/name/<name>', lambda c, i: c.get(f'/api/pokemon/name/bench-{pokemon_id(i)}')),
+        ('GET /api/pokemon/search', lambda c, i: c.get('/api/pokemon/search?min_attack=100&max_speed=150&limit=50')),
+        ('GET /api/pokemon/suggest', lambda c, i: c.get(f'/api/pokemon/suggest?q=bench-{pokemon_id(i) % 100}')),
+        ('GET /api/pokemon/type/<type>', lambda c, i: c.get('/api/pokemon/type/fire?limit=50')),
+        ('GET /api/pokemon/ability/<ability>', lambda c, i: c.get('/api/pokemon/ability/ability-7?limit=50')),
+        ('GET /api/pokemon/<id>/similar', lambda c, i: c.get(f'/api/pokemon/{pokemon_id(i)}/similar?k=10')),
+        ('POST /api/pokemon/similar', lambda c, i: c.post('/api/pokemon/similar', json={
+            'ids': [pokemon_id(i + n) for n in range(20)], 'k': 5
+        })),
+        ('POST /api/pokemon/team/coverage', lambda c, i: c.post('/api/pokemon/team/coverage', json={
+            'ids': [pokemon_id(i + n) for n in range(6)]
+        })),
+        ('GET /api/pokemon/analytics/percentiles', lambda c, i: c.get('/api/pokemon/analytics/percentiles')),
+        ('GET /api/pokemon/analytics/top', lambda c, i: c.get('/api/pokemon/analytics/top?type=fire')),
+        ('GET /api/pokemon/analytics/means-by-type', lambda c, i: c.get('/api/pokemon/analytics/means-by-type')),
+        ('GET /api/pokemon/export', lambda c, i: consume(c.get('/api/pokemon/export?format=ndjson'))),
+        ('GET /api/pokemon/cache/stats', lambda c, i: c.get('/api/pokemon/cache/stats')),
+    ]
+
+
+def service_cases(size, upstream):
+    """(name, call(service, step)) for the PokemonService entry points."""
+
+    def pokemon_id(step):
+        return step * 7919 % size + 1
+
+    return [
+        ('PokemonService.get_all_pokemon', lambda s, i: s.get_all_pokemon(limit=50)),
+        ('PokemonService.get_pokemon_by_id', lambda s, i: s.get_pokemon_by_id(pokemon_id(i)).to_dict()),
+        ('PokemonService.get_pokemon_by_name', lambda s, i: s.get_pokemon_by_name(f'bench-{pokemon_id(i)}').to_dict()),
+        ('PokemonService.search_by_stats', lambda s, i: s.search_by_stats({'attack': (100, None)}, limit=50)),
+        ('PokemonService.get_pokemon_by_type', lambda s, i: s.get_pokemon_by_type('fire', limit=50)),
+        ('PokemonService.get_pokemon_by_ability', lambda s, i: s.get_pokemon_by_ability('ability-7', limit=50)),
+        ('PokemonService.suggest_names', lambda s, i: s.suggest_names(f'bench-{pokemon_id(i) % 100}')),
+        ('PokemonService.iter_all_pokemon', lambda s, i: sum(1 for _ in s.iter_all_pokemon())),
+        ('PokemonService.fetch_and_save_pokemon', lambda s, i: s.fetch_and_save_pokemon(upstream.take()[0])),
+        ('PokemonService.sync_pokemon_list', lambda s, i: s.sync_pokemon_list(upstream.take(SYNC_BATCH))),
+    ]
+
+
+def percentile_summary(samples_ms):
+    p50, p95, p99 = np.percentile(samples_ms, [50, 95, 99])
+    return {
+        'p50_ms': round(float(p50), 3),
+        'p95_ms': round(float(p95), 3),
+        'p99_ms': round(float(p99), 3),
+        'mean_ms': round(float(np.mean(samples_ms)), 3),
+        'max_ms': round(float(np.max(samples_ms)), 3)
+    }
+
+
+def measure(call, repeat, queries, warm=False):
+    """
+    Time repeat calls, then one more under tracemalloc for peak memory.
+
+    call(step) runs one iteration; a step of -1 is the warm-up. The response
+    cache starts empty for every case so one case never reads what another
+    filled. Unless warm, it is also cleared before every call; when warm,
+    every step is called once untimed so the timed calls all hit it.
+    """
+    def reset():
+        db.session.remove()
+        if not warm:
+            pokemon_response_cache.clear()
+
+    db.session.remove()
+    pokemon_response_cache.clear()
+    call(-1)
+    if warm:
+        for step in range(repeat + 1):
+            call(step)
+
+    samples, statements = [], []
+    for step in range(repeat):
+        reset()
+        before = queries.count
+        started = time.perf_counter()
+        call(step)
+        samples.append((time.perf_counter() - started) * 1000)
+        statements.append(queries.count - before)
+
+    reset()
+    tracemalloc.start()
+    try:
+        call(repeat)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    result = percentile_summary(samples)
+    result['queries_per_call'] = round(sum(statements) / len(statements), 2)
+    result['peak_memory_kb'] = round(peak / 1024, 1)
+    result['repeat'] = repeat
+    return result
+
+
+def run_size(size, args):
+    """Benchmark every case against one dataset size."""
+    from services.pokemon_service import PokemonService
+
+    # Upstream names start past the seeded ones; the stub knows all of them
+    needed = (args.repeat + 2) * (SYNC_BATCH + 2)
+    stub = StubPokeAPI(size + needed, args.latency_ms, args.error_rate).start()
+    app, path = seeded_app(size, pokeapi_url=stub.url)
+    upstream = Upstream(size + 1)
+    results = {}
+
+    try:
+        with app.app_context():
+            queries = QueryCounter(db.engines.values())
+            client = app.test_client()
+            service = PokemonService()
+            cases = [
+                (name, lambda i, call=call: call(client, i)) for name, call in route_cases(size)
+            ] + [
+                (name, lambda i, call=call: call(service, i)) for name, call in service_cases(size, upstream)
+            ]
+
+            for name, call in cases:
+                if args.only and not any(term in name for term in args.only):
+                    continue
+                modes = ((' [cold]', False), (' [warm]', True)) if name in CACHED_ROUTES else (('', False),)
+                for suffix, warm in modes:
+                    results[name + suffix] = row = measure(call, args.repeat, queries, warm)
+                    print(f"  {name + suffix:<42} p50 {row['p50_ms']:>9.3f}  p95 {row['p95_ms']:>9.3f}  "
+                          f"p99 {row['p99_ms']:>9.3f} ms  {row['queries_per_call']:>6} q  "
+                          f"{row['peak_memory_kb']:>9.1f} KB")
+
+            db.session.remove()
+            db.engine.dispose()
+    finally:
+        stub.stop()
+        unknown_pokemon_names.purge()
+        os.remove(path)
+
+    return results
+
+
+def compare(results, baseline, max_slowdown):
+    """
+    p95 regressions of results against a baseline run.
+
+    Returns:
+        list: (size, case, baseline p95, current p95) over the threshold
+    """
+    regressions = []
+    for size, cases in results['sizes'].items():
+        for name, row in cases.items():
+            previous = baseline.get('sizes', {}).get(size, {}).get(name)
+            if not previous or max(previous['p95_ms'], row['p95_ms']) < MIN_COMPARABLE_MS:
+                continue
+            if row['p95_ms'] > previous['p95_ms'] * (1 + max_slowdown):
+                regressions.append((size, name, previous['p95_ms'], row['p95_ms']))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--sizes', type=int, nargs='+', default=list(DEFAULT_SIZES))
+    parser.add_argument('--repeat', type=int, default=30)
+    parser.add_argument('--latency-ms', type=float, default=20.0, help='Stub PokeAPI latency.')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='Stub PokeAPI 503 rate.')
+    parser.add_argument('--only', nargs='+', help='Run cases whose name contains any of these.')
+    parser.add_argument('--output', help='Write results JSON here.')
+    parser.add_argument('--baseline', help='Results JSON to compare against.')
+    parser.add_argument('--max-slowdown', type=float, default=0.2,
+                        help='Allowed p95 slowdown vs the baseline (0.2 = 20%%).')
+    args = parser.parse_args()
+
+    results = {
+        'created_at': datetime.now(timezone.utc).isoformat(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'options': {
+            'repeat': args.repeat,
+            'latency_ms': args.latency_ms,
+            'error_rate': args.error_rate
+        },
+        'sizes': {}
+    }
+
+    for size in args.sizes:
+        print(f"{size} Pokemon:")
+        results['sizes'][str(size)] = run_size(size, args)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as handle:
+            json.dump(results, handle, indent=2)
+        print(f"results -> {args.output}")
+
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as handle:
+            baseline = json.load(handle)
+        regressions = compare(results, baseline, args.max_slowdown)
+        for size, name, previous, current in regressions:
+            print(f"REGRESSION [{size}] {name}: p95 {previous:.3f} -> {current:.3f} ms "
+                  f"(+{(current / previous - 1):.0%})")
+        if regressions:
+            sys.exit(1)
+        print(f"no p95 regressions over {args.max_slowdown:.0%} vs {args.baseline}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,10 @@
+"""
+Description: Flask CLI commands package.
+Author: Bryan Vela
+Created: 2026-10-17
+"""
+from .pokescouter_cli import pokescouter_cli
+
+__all__ = [
+    'pokescouter_cli'
+]
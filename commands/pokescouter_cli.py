@@ -0,0 +1,111 @@
+"""
+Description: `flask pokescouter ...` maintenance commands.
+Author: Bryan Vela
+Created: 2026-10-17
+"""
+import json
+import os
+
+import click
+from flask import current_app
+from flask.cli import AppGroup
+
+# Command group, registered in create_app
+pokescouter_cli = AppGroup('pokescouter', help='PokeScouter data management commands.')
+
+
+@pokescouter_cli.command('import-all')
+@click.option('--page-size', default=100, show_default=True, type=click.IntRange(1, 1000),
+              help='Index entries fetched and committed per chunk.')
+@click.option('--concurrency', default=None, type=click.IntRange(1, 64),
+              help='Parallel PokeAPI fetches (defaults to POKEAPI_MAX_CONCURRENCY).')
+@click.option('--limit', 'max_pokemon', default=None, type=click.IntRange(1),
+              help='Stop after this many index entries.')
+@click.option('--restart', is_flag=True, help='Ignore the saved checkpoint and start over.')
+def import_all(page_size, concurrency, max_pokemon, restart):
+    """
+    Import the full Pokedex from PokeAPI, resuming from the last checkpoint.
+    """
+    from services.import_service import BulkImportService
+    
+    importer = BulkImportService(page_size=page_size)
+    if concurrency:
+        importer.pokemon_service.max_concurrency = concurrency
+    
+    def progress(report):
+        click.echo(
+            f"offset {report['next_offset']}/{report['total'] or '?'}: "
+            f"{report['imported']} imported, {report['skipped']} skipped, {report['failed']} failed"
+        )
+    
+    report = importer.run(restart=restart, max_pokemon=max_pokemon, progress=progress)
+    
+    click.echo(
+        f"Done ({report['status']}): {report['imported']} imported, {report['skipped']} skipped, "
+        f"{report['failed']} failed in {report['elapsed_seconds']}s "
+        f"({report['pokemon_per_second']} Pokemon/s)"
+    )
+
+
+@pokescouter_cli.command('rebuild-stat-index')
+def rebuild_stat_index():
+    """
+    Rebuild the denormalized stat search table from pokemon_stat.
+    """
+    from models.pokemonStatSummary import PokemonStatSummary
+    from utils.db import db
+    
+    PokemonStatSummary.refresh(db.session)
+    db.session.commit()
+    click.echo(f"Stat index rebuilt: {PokemonStatSummary.query.count()} Pokemon")
+
+
+@pokescouter_cli.command('import-type-chart')
+def import_type_chart():
+    """
+    Download the 18 type matchups from PokeAPI into TYPE_CHART_PATH.
+    """
+    from services.pokeapi_service import PokeAPIService
+    from services.type_chart import TYPE_NAMES, TypeChart, reset_type_chart
+    
+    path = current_app.config.get('TYPE_CHART_PATH')
+    if not path:
+        raise click.ClickException('TYPE_CHART_PATH is not set')
+    if not os.path.isabs(path):
+        path = os.path.join(current_app.instance_path, path)
+    
+    api_service = PokeAPIService()
+    relations = {}
+    for type_name in TYPE_NAMES:
+        payload = api_service.get_type(type_name)
+        if payload is None:
+            raise click.ClickException(f'Failed to fetch type "{type_name}" from PokeAPI')
+        relations[type_name] = {
+            'name': type_name,
+            'damage_relations': {
+                relation: [{'name': target['name']} for target in payload['damage_relations'].get(relation, [])]
+                for relation in ('double_damage_to', 'half_damage_to', 'no_damage_to')
+            }
+        }
+    
+    # Validate before replacing the current chart
+    TypeChart.from_relations(relations)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as handle:
+        json.dump(relations, handle, indent=2)
+    reset_type_chart()
+    click.echo(f"Type chart written to {path}")
+
+
+@pokescouter_cli.command('backfill-documents')
+@click.option('--all', 'rebuild_all', is_flag=True, help='Rebuild every document, not only missing ones.')
+def backfill_documents(rebuild_all):
+    """
+    Store the JSON document of Pokemon saved before the document column existed.
+    """
+    from models.pokemon import Pokemon
+    from utils.db import db
+    
+    written = Pokemon.refresh_documents(db.session, missing_only=not rebuild_all)
+    db.session.commit()
+    click.echo(f"Documents written: {written} Pokemon")
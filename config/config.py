@@ -11,7 +11,65 @@ class Config():
     
     # Database
     SQLALCHEMY_DATABASE_URI = os.getenv('DATABASE_URL')
+    DB_POOL_SIZE = int(os.getenv('DB_POOL_SIZE', '5'))
+    DB_MAX_OVERFLOW = int(os.getenv('DB_MAX_OVERFLOW', '10'))
+    DB_POOL_TIMEOUT = float(os.getenv('DB_POOL_TIMEOUT', '30'))
+    DB_POOL_RECYCLE = int(os.getenv('DB_POOL_RECYCLE', '3600'))  # -1 disables
+    DB_READ_ENGINE = os.getenv('DB_READ_ENGINE', 'true').lower() in ('true', '1')  # GET routes read through a read-only engine
+    DB_READ_POOL_SIZE = int(os.getenv('DB_READ_POOL_SIZE', '10'))
+    DB_SERIALIZE_WRITES = os.getenv('DB_SERIALIZE_WRITES', 'true').lower() in ('true', '1')
+
+    # SQLite connection pragmas (empty value leaves the SQLite default)
+    SQLITE_JOURNAL_MODE = os.getenv('SQLITE_JOURNAL_MODE', 'WAL')
+    SQLITE_SYNCHRONOUS = os.getenv('SQLITE_SYNCHRONOUS', 'NORMAL')
+    SQLITE_CACHE_SIZE = os.getenv('SQLITE_CACHE_SIZE', '-65536')  # negative = KiB, so 64 MiB per connection
+    SQLITE_MMAP_SIZE = os.getenv('SQLITE_MMAP_SIZE', str(256 * 1024 * 1024))
+    SQLITE_BUSY_TIMEOUT = os.getenv('SQLITE_BUSY_TIMEOUT', '5000')  # ms
+
+    # Logging and instrumentation
+    LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO')
+    METRICS_SERVER_TIMING = os.getenv('METRICS_SERVER_TIMING', 'false').lower() in ('true', '1')
+    SLOW_REQUEST_MS = float(os.getenv('SLOW_REQUEST_MS', '500'))  # 0 disables the slow-request log
+    
+    # Streaming export
+    EXPORT_CHUNK_SIZE = int(os.getenv('EXPORT_CHUNK_SIZE', '500'))
+    GZIP_COMPRESSION_LEVEL = int(os.getenv('GZIP_COMPRESSION_LEVEL', '6'))
+    GZIP_MIN_SIZE = int(os.getenv('GZIP_MIN_SIZE', '1024'))  # bytes; smaller responses are not compressed
+    
+    # Encoded response cache for single-Pokemon reads
+    RESPONSE_CACHE_MAX_ENTRIES = int(os.getenv('RESPONSE_CACHE_MAX_ENTRIES', '2048'))
+    RESPONSE_CACHE_TTL = int(os.getenv('RESPONSE_CACHE_TTL', '300'))
     
     # PokeAPI
     POKEAPI_BASE_URL = os.getenv('POKEAPI_BASE_URL')
-    POKEAPI_TIMEOUT = int(os.getenv('POKEAPI_TIMEOUT', '10'))
\ No newline at end of file
+    POKEAPI_TIMEOUT = int(os.getenv('POKEAPI_TIMEOUT', '10'))
+    POKEAPI_MAX_CONCURRENCY = int(os.getenv('POKEAPI_MAX_CONCURRENCY', '8'))
+    POKEAPI_POOL_SIZE = int(os.getenv('POKEAPI_POOL_SIZE', '10'))
+    POKEAPI_MAX_RETRIES = int(os.getenv('POKEAPI_MAX_RETRIES', '3'))
+    POKEAPI_BACKOFF_FACTOR = float(os.getenv('POKEAPI_BACKOFF_FACTOR', '0.5'))
+    POKEAPI_BACKOFF_MAX = float(os.getenv('POKEAPI_BACKOFF_MAX', '30'))
+    POKEAPI_RATE_LIMIT = float(os.getenv('POKEAPI_RATE_LIMIT', '20'))  # requests/s, 0 disables
+    POKEAPI_RATE_BURST = int(os.getenv('POKEAPI_RATE_BURST', '20'))
+    
+    # PokeAPI response cache (empty path disables it)
+    POKEAPI_CACHE_PATH = os.getenv('POKEAPI_CACHE_PATH', 'pokeapi_cache.db')
+    POKEAPI_CACHE_TTL = int(os.getenv('POKEAPI_CACHE_TTL', '604800'))  # 7 days
+    POKEAPI_CACHE_MAX_BYTES = int(os.getenv('POKEAPI_CACHE_MAX_BYTES', str(200 * 1024 * 1024)))
+    
+    # Type chart imported from PokeAPI (falls back to data/type_chart.json)
+    TYPE_CHART_PATH = os.getenv('TYPE_CHART_PATH', 'type_chart.json')
+    
+    # Names PokeAPI returned 404 for (answered without network I/O)
+    NEGATIVE_CACHE_MAX_ENTRIES = int(os.getenv('NEGATIVE_CACHE_MAX_ENTRIES', '10000'))
+    NEGATIVE_CACHE_TTL = int(os.getenv('NEGATIVE_CACHE_TTL', '3600'))
+    
+    # Cross-process fetch lock (one upstream fetch per name)
+    FETCH_LOCK_TTL = float(os.getenv('FETCH_LOCK_TTL', '60'))  # lease; a crashed holder's lock expires
+    FETCH_LOCK_WAIT = float(os.getenv('FETCH_LOCK_WAIT', '15'))  # max wait for another process's fetch
+    
+    # Background batch fetch jobs
+    JOB_WORKERS = int(os.getenv('JOB_WORKERS', '1'))
+    JOB_CHUNK_SIZE = int(os.getenv('JOB_CHUNK_SIZE', '50'))  # names committed per progress update
+    JOB_MAX_NAMES = int(os.getenv('JOB_MAX_NAMES', '5000'))
+    JOB_POLL_INTERVAL = float(os.getenv('JOB_POLL_INTERVAL', '5'))
+    JOB_STALE_SECONDS = float(os.getenv('JOB_STALE_SECONDS', '300'))  # running jobs without progress are reclaimed
\ No newline at end of file
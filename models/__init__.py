@@ -4,17 +4,30 @@ Author: Bryan Vela
 Created: 2026-01-29
 """
 from .base_model import BaseModel
-from .pokemontypes import pokemon_types
+from .pokemontypes import pokemon_types, PokemonTypeLink
 from .pokemon import Pokemon
 from .pokemonType import PokemonType
+from .typeRegistry import TypeRegistry, type_registry
 from .pokemonStat import PokemonStat
+from .pokemonStatSummary import PokemonStatSummary, STAT_COLUMNS
 from .pokemonAbility import PokemonAbility
+from .importCheckpoint import ImportCheckpoint
+from .fetchJob import FetchJob
+from .fetchLock import FetchLock
 
 __all__ = [
     'BaseModel',
     'pokemon_types',
+    'PokemonTypeLink',
     'Pokemon',
     'PokemonType',
+    'TypeRegistry',
+    'type_registry',
     'PokemonStat',
-    'PokemonAbility'
+    'PokemonStatSummary',
+    'STAT_COLUMNS',
+    'PokemonAbility',
+    'ImportCheckpoint',
+    'FetchJob',
+    'FetchLock'
 ]
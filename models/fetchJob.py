@@ -0,0 +1,72 @@
+"""
+Description: Queued batch fetch job (drained by the background worker pool).
+Author: Bryan Vela
+Created: 2026-10-17 - File created and model implementation.
+"""
+from datetime import datetime, timezone
+from .base_model import BaseModel
+from utils.db import db
+
+# Per-name outcome lists of sync_pokemon_list, merged across chunks
+RESULT_KEYS = ('success', 'failed', 'already_exists', 'duplicates')
+
+class FetchJob(BaseModel):
+    """
+    Fetch Job model - one queued POST /fetch/batch request.
+
+    names is processed in chunks; processed and results are committed
+    after every chunk, so a job interrupted by a restart resumes at the
+    first unprocessed name.
+    """
+    __tablename__ = 'fetch_job'
+
+    status = db.Column(db.String(20), nullable=False, default='queued', index=True)  # queued, running, completed, failed
+    names = db.Column(db.JSON, nullable=False)
+    total = db.Column(db.Integer, nullable=False, default=0)
+    processed = db.Column(db.Integer, nullable=False, default=0)
+    results = db.Column(db.JSON, nullable=True)
+    error = db.Column(db.Text, nullable=True)
+    attempts = db.Column(db.Integer, nullable=False, default=0)
+
+    started_at = db.Column(db.DateTime, nullable=True)
+    heartbeat_at = db.Column(db.DateTime, nullable=True)  # last progress commit of the running worker
+    finished_at = db.Column(db.DateTime, nullable=True)
+
+    @staticmethod
+    def empty_results():
+        return {**{key: [] for key in RESULT_KEYS}, 'timings': {}}
+
+    def record_chunk(self, chunk_results, chunk_size):
+        """
+        Merge one sync_pokemon_list result into the job (caller commits).
+        """
+        results = self.results or self.empty_results()
+        merged = {
+            key: results.get(key, []) + chunk_results.get(key, [])
+            for key in RESULT_KEYS
+        }
+        merged['timings'] = {**results['timings'], **chunk_results.get('timings', {})}
+
+        # JSON columns only persist on reassignment
+        self.results = merged
+        self.processed += chunk_size
+        self.heartbeat_at = datetime.now(timezone.utc)
+
+    def to_dict(self, include_results=True):
+        """Convert to dictionary"""
+        base_dict = super().to_dict()
+        results = self.results or self.empty_results()
+        base_dict.update({
+            'status': self.status,
+            'total': self.total,
+            'processed': self.processed,
+            'progress': round(100.0 * self.processed / self.total, 1) if self.total else 100.0,
+            'counts': {key: len(results.get(key, [])) for key in RESULT_KEYS},
+            'error': self.error,
+            'attempts': self.attempts,
+            'started_at': self.started_at.isoformat() if self.started_at else None,
+            'finished_at': self.finished_at.isoformat() if self.finished_at else None
+        })
+        if include_results:
+            base_dict['results'] = results
+        return base_dict
@@ -0,0 +1,100 @@
+"""
+Description: Cross-process lock rows for upstream Pokemon fetches.
+Author: Bryan Vela
+Created: 2026-10-17 - File created and model implementation.
+"""
+import time
+import uuid
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import delete, insert, select, update
+from sqlalchemy.exc import IntegrityError
+
+from utils.db import db
+
+class FetchLock(db.Model):
+    """
+    Fetch Lock model - one row while a process fetches a Pokemon name.
+
+    The primary key makes the insert the lock: only one process can create
+    the row for a name. Rows carry an expiry so a crashed holder's lock is
+    taken over instead of blocking the name forever.
+    """
+    __tablename__ = 'fetch_lock'
+
+    name = db.Column(db.String(100), primary_key=True)
+    owner = db.Column(db.String(32), nullable=False)
+    expires_at = db.Column(db.DateTime, nullable=False)
+
+    @classmethod
+    def acquire(cls, name, ttl):
+        """
+        Try to take the lock once.
+
+        Lock rows are written on their own connection and committed there,
+        so the caller's session and transaction are left alone.
+
+        Returns:
+            str or None: Owner token if acquired
+        """
+        table = cls.__table__
+        owner = uuid.uuid4().hex
+        now = datetime.now(timezone.utc)
+        expires_at = now + timedelta(seconds=ttl)
+
+        try:
+            with db.engine.begin() as conn:
+                conn.execute(insert(table).values(name=name, owner=owner, expires_at=expires_at))
+            return owner
+        except IntegrityError:
+            pass
+
+        # Held - take it over only if the holder's lease ran out
+        with db.engine.begin() as conn:
+            taken = conn.execute(
+                update(table)
+                .where(table.c.name == name, table.c.expires_at < now)
+                .values(owner=owner, expires_at=expires_at)
+            ).rowcount
+        return owner if taken else None
+
+    @classmethod
+    def release(cls, name, owner):
+        """Drop the lock if this owner still holds it."""
+        table = cls.__table__
+        with db.engine.begin() as conn:
+            conn.execute(delete(table).where(table.c.name == name, table.c.owner == owner))
+
+    @classmethod
+    def is_held(cls, name):
+        table = cls.__table__
+        now = datetime.now(timezone.utc)
+        with db.engine.connect() as conn:
+            return conn.execute(
+                select(table.c.name).where(table.c.name == name, table.c.expires_at >= now)
+            ).first() is not None
+
+    @classmethod
+    @contextmanager
+    def hold(cls, name, ttl=60, wait=15, poll_interval=0.1):
+        """
+        Hold the lock for name, waiting up to wait seconds for another holder.
+
+        Yields:
+            bool: True if held; False if another process held it until it
+                released (or wait ran out) - the caller should re-check
+                the database for its result instead of fetching
+        """
+        owner = cls.acquire(name, ttl)
+        if owner is None:
+            deadline = time.monotonic() + wait
+            while cls.is_held(name) and time.monotonic() < deadline:
+                time.sleep(poll_interval)
+            yield False
+            return
+
+        try:
+            yield True
+        finally:
+            cls.release(name, owner)
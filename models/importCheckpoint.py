@@ -0,0 +1,51 @@
+"""
+Description: Progress checkpoint for resumable bulk imports.
+Author: Bryan Vela
+Created: 2026-10-17 - File created and model implementation.
+"""
+from .base_model import BaseModel
+from utils.db import db
+
+class ImportCheckpoint(BaseModel):
+    """
+    Import Checkpoint model - one row per named import job.
+    """
+    __tablename__ = 'import_checkpoint'
+    
+    name = db.Column(db.String(50), unique=True, nullable=False, index=True)
+    
+    # Progress through the PokeAPI index
+    next_offset = db.Column(db.Integer, nullable=False, default=0)
+    total = db.Column(db.Integer, nullable=True)  # index size reported by PokeAPI
+    imported = db.Column(db.Integer, nullable=False, default=0)
+    failed = db.Column(db.Integer, nullable=False, default=0)
+    status = db.Column(db.String(20), nullable=False, default='pending')  # pending, running, completed
+    
+    def to_dict(self):
+        """Convert to dictionary"""
+        base_dict = super().to_dict()
+        base_dict.update({
+            'name': self.name,
+            'next_offset': self.next_offset,
+            'total': self.total,
+            'imported': self.imported,
+            'failed': self.failed,
+            'status': self.status
+        })
+        return base_dict
+    
+    @classmethod
+    def get_or_create(cls, name):
+        """
+        Get existing checkpoint or create a new one.
+        
+        Args:
+            name (str): Checkpoint name
+            
+        Returns:
+            ImportCheckpoint: Existing or new checkpoint
+        """
+        checkpoint = cls.query.filter_by(name=name).first()
+        if not checkpoint:
+            checkpoint = cls.create({'name': name, 'next_offset': 0, 'imported': 0, 'failed': 0})
+        return checkpoint
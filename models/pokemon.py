@@ -3,12 +3,18 @@ Description: Pokemon model and related tables for Pokemon scouting system.
 Author: Bryan Vela
 Created: 2026-01-29
 """
-from sqlalchemy import Column, Integer, String
-from sqlalchemy.orm import relationship
+import json
+from datetime import datetime, timezone
+from sqlalchemy import Column, Integer, LargeBinary, String, bindparam, event, exists, select
+from sqlalchemy.orm import Session, deferred, relationship, selectinload, validates
 from .base_model import BaseModel
 from .pokemontypes import pokemon_types
+from .typeRegistry import TypeRegistry
 from utils.db import db
 
+# Pokemon loaded per query when rebuilding documents
+DOCUMENT_CHUNK_SIZE = 500
+
 class Pokemon(BaseModel):
     """
     Pokemon model - stores core Pokemon data.
@@ -17,6 +23,14 @@ class Pokemon(BaseModel):
     
     # Basic Information
     name = db.Column(String(100), unique=True, nullable=False, index=True)
+    # Normalized (lowercase) name for index-backed case-insensitive lookups
+    name_key = db.Column(
+        String(100),
+        unique=True,
+        nullable=False,
+        index=True,
+        info={'backfill': 'lower(name)'}
+    )
     pokedex_number = db.Column(Integer, unique=True, nullable=False, index=True)
     height = db.Column(Integer, nullable=False)  # in decimetres
     weight = db.Column(Integer, nullable=False)  # in hectograms
@@ -25,12 +39,23 @@ class Pokemon(BaseModel):
     sprite_front_default = db.Column(String(500), nullable=True)
     sprite_front_shiny = db.Column(String(500), nullable=True)
 
+    # to_dict() as compact JSON, rebuilt whenever the Pokemon or its
+    # types/stats/abilities are written (see refresh_documents)
+    document = deferred(db.Column(LargeBinary, nullable=True))
+
     # Relationships
+    type_links = db.relationship(
+        'PokemonTypeLink',
+        back_populates='pokemon',
+        cascade='all, delete-orphan',
+        order_by=pokemon_types.c.slot,
+        lazy='joined'
+    )
     types = db.relationship(
         'PokemonType',
         secondary=pokemon_types,
         back_populates='pokemon',
-        lazy='joined'
+        viewonly=True
     )
     stats = db.relationship(
         'PokemonStat',
@@ -44,6 +69,23 @@ class Pokemon(BaseModel):
         cascade='all, delete-orphan',
         lazy='joined'
     )
+    stat_summary = db.relationship(
+        'PokemonStatSummary',
+        back_populates='pokemon',
+        cascade='all, delete-orphan',
+        uselist=False
+    )
+    
+    @staticmethod
+    def normalize_name(name):
+        """Normalized lookup key for a Pokemon name."""
+        return name.strip().lower()
+    
+    @validates('name')
+    def _set_name_key(self, key, name):
+        """Keep name_key in sync with name on every ORM write."""
+        self.name_key = self.normalize_name(name)
+        return name
     
     def to_dict(self):
         """
@@ -60,9 +102,9 @@ class Pokemon(BaseModel):
             'weight': self.weight,
             'types': [
                 {
-                    'name': t.name,
-                    'slot': self._get_type_slot(t)
-                } for t in sorted(self.types, key=lambda x: self._get_type_slot(x))
+                    'name': link.type.name,
+                    'slot': link.slot
+                } for link in sorted(self.type_links, key=lambda x: x.slot)
             ],
             'stats': {stat.name: stat.value for stat in self.stats},
             'abilities': [ability.to_dict() for ability in sorted(self.abilities, key=lambda x: x.slot)],
@@ -73,15 +115,111 @@ class Pokemon(BaseModel):
         })
         return base_dict
     
-    def _get_type_slot(self, pokemon_type):
-        """Get type slot from association table"""
-        result = db.session.execute(
-            pokemon_types.select().where(
-                (pokemon_types.c.pokemon_id == self.id) & 
-                (pokemon_types.c.type_id == pokemon_type.id)
-            )
-        ).first()
-        return result.slot if result else 1
+    @staticmethod
+    def dict_from_data(data, pokemon_id, created_at, updated_at):
+        """
+        to_dict() of a Pokemon built from its transformed data (save_pokemon_batch
+        input) and inserted row values, without loading it back.
+        """
+        return {
+            'id': pokemon_id,
+            'created_at': created_at.isoformat() if created_at else None,
+            'updated_at': updated_at.isoformat() if updated_at else None,
+            'name': data['name'],
+            'pokedex_number': data['pokedex_number'],
+            'height': data['height'],
+            'weight': data['weight'],
+            'types': [
+                {
+                    'name': TypeRegistry.normalize(type_data['name']),
+                    'slot': type_data.get('slot', 1)
+                } for type_data in sorted(data.get('types', []), key=lambda x: x.get('slot', 1))
+            ],
+            'stats': {stat['name']: stat['value'] for stat in data.get('stats', [])},
+            'abilities': [
+                {
+                    'name': ability['name'],
+                    'is_hidden': bool(ability['is_hidden']),
+                    'slot': ability['slot']
+                } for ability in sorted(data.get('abilities', []), key=lambda x: x['slot'])
+            ],
+            'sprites': {
+                'front_default': data.get('sprite_front_default'),
+                'front_shiny': data.get('sprite_front_shiny')
+            }
+        }
+    
+    @staticmethod
+    def encode_document(data):
+        """Encode a to_dict() payload the way responses are (sorted keys, compact)."""
+        return json.dumps(data, sort_keys=True, separators=(',', ':')).encode('utf-8')
+    
+    @classmethod
+    def refresh_documents(cls, session, pokemon_ids=None, missing_only=False, touch=False):
+        """
+        Rebuild stored documents from the normalized tables.
+        
+        Args:
+            session: Session to load and write with (caller's transaction)
+            pokemon_ids (iterable): Pokemon to rebuild, None for all
+            missing_only (bool): Only rows without a document (backfill)
+            touch (bool): Set updated_at to now first, for changes made only
+                to related rows (updated_at drives the ETags)
+            
+        Returns:
+            int: Documents written
+        """
+        query = select(cls.id).order_by(cls.id)
+        if pokemon_ids is not None:
+            pokemon_ids = list(pokemon_ids)
+            if not pokemon_ids:
+                return 0
+            query = query.where(cls.id.in_(pokemon_ids))
+        if missing_only:
+            query = query.where(cls.document.is_(None))
+        ids = session.scalars(query).all()
+        
+        table = cls.__table__
+        written = 0
+        with session.no_autoflush:
+            for start in range(0, len(ids), DOCUMENT_CHUNK_SIZE):
+                chunk_ids = ids[start:start + DOCUMENT_CHUNK_SIZE]
+                if touch:
+                    session.execute(
+                        table.update().where(table.c.id.in_(chunk_ids))
+                        .values(updated_at=datetime.now(timezone.utc))
+                    )
+                chunk = session.scalars(
+                    select(cls)
+                    .where(cls.id.in_(chunk_ids))
+                    .options(
+                        selectinload(cls.type_links),
+                        selectinload(cls.stats),
+                        selectinload(cls.abilities)
+                    )
+                    .execution_options(populate_existing=True)
+                ).unique().all()
+                cls.store_documents(session, {
+                    pokemon.id: cls.encode_document(pokemon.to_dict()) for pokemon in chunk
+                })
+                written += len(chunk)
+        return written
+    
+    @classmethod
+    def store_documents(cls, session, documents):
+        """Write encoded documents (id -> bytes) with one executemany UPDATE."""
+        if not documents:
+            return
+        table = cls.__table__
+        # Keep updated_at as it is; the document is not a change to the Pokemon
+        update = table.update().where(table.c.id == bindparam('pokemon_id')).values(
+            document=bindparam('payload'),
+            updated_at=table.c.updated_at
+        )
+        session.execute(update, [
+            {'pokemon_id': pokemon_id, 'payload': payload}
+            for pokemon_id, payload in documents.items()
+        ])
     
     @classmethod
     def get_by_name(cls, name):
@@ -94,7 +232,7 @@ class Pokemon(BaseModel):
         Returns:
             Pokemon or None: Found Pokemon or None
         """
-        return cls.query.filter(cls.name.ilike(name)).first()
+        return cls.query.filter_by(name_key=cls.normalize_name(name)).first()
     
     @classmethod
     def get_by_pokedex_number(cls, number):
@@ -120,4 +258,27 @@ class Pokemon(BaseModel):
         Returns:
             bool: True if exists
         """
-        return cls.query.filter(cls.name.ilike(name)).count() > 0
+        return db.session.query(
+            exists().where(cls.name_key == cls.normalize_name(name))
+        ).scalar()
+
+
+@event.listens_for(Session, 'after_flush')
+def _queue_changed_documents(session, flush_context):
+    """Note Pokemon whose row or related rows changed through the ORM."""
+    pending = session.info.setdefault('pokemon_documents_changed', set())
+    for obj in list(session.new) + list(session.dirty) + list(session.deleted):
+        table = getattr(getattr(obj, '__table__', None), 'name', None)
+        if table == 'pokemon':
+            if obj not in session.deleted:
+                pending.add(obj.id)
+        elif table in ('pokemon_types', 'pokemon_stat', 'pokemon_ability') and obj.pokemon_id is not None:
+            pending.add(obj.pokemon_id)
+
+
+@event.listens_for(Session, 'after_flush_postexec')
+def _refresh_changed_documents(session, flush_context):
+    """Rebuild their documents (and bump updated_at) once the flush has written every row."""
+    pending = session.info.pop('pokemon_documents_changed', None)
+    if pending:
+        Pokemon.refresh_documents(session, pending, touch=True)
@@ -12,10 +12,10 @@ class PokemonAbility(BaseModel):
     """
     __tablename__ = 'pokemon_ability'
     
-    pokemon_id = db.Column(db.Integer, db.ForeignKey('pokemon.id', ondelete='CASCADE'), nullable=False)
+    pokemon_id = db.Column(db.Integer, db.ForeignKey('pokemon.id', ondelete='CASCADE'), nullable=False, index=True)
     
     # Ability details
-    name = db.Column(db.String(100), nullable=False)
+    name = db.Column(db.String(100), nullable=False, index=True)
     is_hidden = db.Column(db.Integer, default=0)  # 0 = normal, 1 = hidden
     slot = db.Column(db.Integer, nullable=False)
     
@@ -12,7 +12,7 @@ class PokemonStat(BaseModel):
     """
     __tablename__ = 'pokemon_stat'
     
-    pokemon_id = db.Column(db.Integer, db.ForeignKey('pokemon.id', ondelete='CASCADE'), nullable=False)
+    pokemon_id = db.Column(db.Integer, db.ForeignKey('pokemon.id', ondelete='CASCADE'), nullable=False, index=True)
     
     # Stat details
     name = db.Column(db.String(50), nullable=False)  # hp, attack, defense, etc.
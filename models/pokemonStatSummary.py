@@ -0,0 +1,118 @@
+"""
+Description: Denormalized one-row-per-Pokemon stat table for range searches.
+Author: Bryan Vela
+Created: 2026-10-17 - File created and model implementation.
+"""
+from sqlalchemy import case, delete, event, func, insert, select
+from sqlalchemy.orm import Session
+
+from utils.db import db
+from .pokemonStat import PokemonStat
+
+# PokeAPI stat name -> column name
+STAT_COLUMNS = {
+    'hp': 'hp',
+    'attack': 'attack',
+    'defense': 'defense',
+    'special-attack': 'special_attack',
+    'special-defense': 'special_defense',
+    'speed': 'speed'
+}
+
+
+class PokemonStatSummary(db.Model):
+    """
+    Wide copy of the pokemon_stat rows (one column per stat plus the total).
+
+    Every column is indexed so min/max filters and sorts avoid pivoting the
+    EAV rows. Rows are rebuilt from pokemon_stat whenever stats are written
+    (see refresh and the flush hook below).
+    """
+    __tablename__ = 'pokemon_stat_summary'
+
+    pokemon_id = db.Column(db.Integer, db.ForeignKey('pokemon.id', ondelete='CASCADE'), primary_key=True)
+
+    hp = db.Column(db.Integer, nullable=False, default=0, index=True)
+    attack = db.Column(db.Integer, nullable=False, default=0, index=True)
+    defense = db.Column(db.Integer, nullable=False, default=0, index=True)
+    special_attack = db.Column(db.Integer, nullable=False, default=0, index=True)
+    special_defense = db.Column(db.Integer, nullable=False, default=0, index=True)
+    speed = db.Column(db.Integer, nullable=False, default=0, index=True)
+    total = db.Column(db.Integer, nullable=False, default=0, index=True)
+
+    # Relationship
+    pokemon = db.relationship('Pokemon', back_populates='stat_summary')
+
+    def to_dict(self):
+        """Convert to dictionary (PokeAPI stat names)"""
+        data = {name: getattr(self, column) for name, column in STAT_COLUMNS.items()}
+        data['total'] = self.total
+        return data
+
+    @classmethod
+    def refresh(cls, connection, pokemon_ids=None):
+        """
+        Rebuild summary rows from pokemon_stat.
+
+        Args:
+            connection: Connection or Session to execute on (caller's transaction)
+            pokemon_ids (iterable): Pokemon to rebuild, None for all
+        """
+        table = cls.__table__
+        stat = PokemonStat.__table__
+
+        pivot = select(
+            stat.c.pokemon_id,
+            *[
+                func.coalesce(func.max(case((stat.c.name == name, stat.c.value))), 0).label(column)
+                for name, column in STAT_COLUMNS.items()
+            ],
+            func.coalesce(func.sum(stat.c.value), 0).label('total')
+        ).group_by(stat.c.pokemon_id)
+
+        clear = delete(table)
+        if pokemon_ids is not None:
+            pokemon_ids = list(pokemon_ids)
+            if not pokemon_ids:
+                return
+            pivot = pivot.where(stat.c.pokemon_id.in_(pokemon_ids))
+            clear = clear.where(table.c.pokemon_id.in_(pokemon_ids))
+
+        connection.execute(clear)
+        connection.execute(
+            insert(table).from_select(
+                ['pokemon_id', *STAT_COLUMNS.values(), 'total'],
+                pivot
+            )
+        )
+
+    @classmethod
+    def backfill(cls, connection):
+        """
+        Build rows for Pokemon that have stats but no summary row (databases
+        created before this table, or written around the ORM hooks).
+
+        Returns:
+            int: Pokemon whose summary was built
+        """
+        stat = PokemonStat.__table__
+        missing = connection.execute(
+            select(stat.c.pokemon_id).distinct().where(
+                stat.c.pokemon_id.not_in(select(cls.__table__.c.pokemon_id))
+            )
+        ).scalars().all()
+        if missing:
+            cls.refresh(connection, missing)
+        return len(missing)
+
+
+@event.listens_for(Session, 'after_flush')
+def _refresh_changed_stats(session, flush_context):
+    """Keep summaries in sync when stats are changed through the ORM."""
+    pokemon_ids = {
+        obj.pokemon_id
+        for obj in list(session.new) + list(session.dirty) + list(session.deleted)
+        if isinstance(obj, PokemonStat) and obj.pokemon_id is not None
+    }
+    if pokemon_ids:
+        PokemonStatSummary.refresh(session.connection(), pokemon_ids)
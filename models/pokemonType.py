@@ -16,7 +16,8 @@ class PokemonType(BaseModel):
     pokemon = db.relationship(
         'Pokemon',
         secondary=pokemon_types,
-        back_populates='types'
+        back_populates='types',
+        viewonly=True
     )
     
     def to_dict(self):
@@ -29,21 +30,25 @@ class PokemonType(BaseModel):
     
     @classmethod
     def get_by_name(cls, name):
-        """Get type by name"""
-        return cls.query.filter(cls.name.ilike(name)).first()
+        """Get type by name (resolved through the in-memory type registry)"""
+        from .typeRegistry import type_registry
+        type_id = type_registry.get_id(name)
+        return db.session.get(cls, type_id) if type_id else None
     
     @classmethod
     def get_or_create(cls, name):
         """
         Get existing type or create new one.
         
+        A new type is inserted in the caller's transaction; nothing is
+        committed here.
+        
         Args:
             name (str): Type name
             
         Returns:
             PokemonType: Existing or new type
         """
-        type_obj = cls.get_by_name(name)
-        if not type_obj:
-            type_obj = cls.create({'name': name.lower()})
-        return type_obj
\ No newline at end of file
+        from .typeRegistry import type_registry
+        type_id = type_registry.resolve([name])[type_registry.normalize(name)]
+        return db.session.get(cls, type_id)
\ No newline at end of file
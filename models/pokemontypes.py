@@ -3,7 +3,7 @@ Description: Junction table for many-to-many relationship between Pokemon and Ty
 Author: Bryan Vela
 Created: 2026-01-29 - File created and model implementation.
 """
-from sqlalchemy import Table, Column, Integer, ForeignKey
+from sqlalchemy import Table, Column, Integer, ForeignKey, Index
 from utils.db import db
 
 # junction table for many-to-many: Pokemon / Types
@@ -12,5 +12,20 @@ pokemon_types = Table(
     db.Model.metadata,
     Column('pokemon_id', Integer, ForeignKey('pokemon.id', ondelete='CASCADE'), primary_key=True),
     Column('type_id', Integer, ForeignKey('pokemon_type.id', ondelete='CASCADE'), primary_key=True),
-    Column('slot', Integer, nullable=False, default=1)  # to indicate primary/secondary type
+    Column('slot', Integer, nullable=False, default=1),  # to indicate primary/secondary type
+    # reverse lookups ("all fire types", optionally primary only)
+    Index('ix_pokemon_types_type_id_slot', 'type_id', 'slot')
 )
+
+
+class PokemonTypeLink(db.Model):
+    """
+    Association object mapped onto the junction table.
+
+    Exposes the slot column so it is loaded together with the type
+    instead of being looked up per type.
+    """
+    __table__ = pokemon_types
+
+    pokemon = db.relationship('Pokemon', back_populates='type_links')
+    type = db.relationship('PokemonType', lazy='joined')
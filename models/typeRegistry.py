@@ -0,0 +1,148 @@
+"""
+Description: Process-level registry resolving Pokemon type names to ids.
+Author: Bryan Vela
+Created: 2026-10-17 - File created and registry implementation.
+"""
+import threading
+from typing import Dict, Iterable, Optional
+
+from sqlalchemy import event, insert, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from utils.db import db
+from .pokemonType import PokemonType
+
+
+class TypeRegistry:
+    """
+    In-memory name -> id map of the pokemon_type table.
+
+    All rows are loaded once per database. A lookup that misses checks the
+    table for that one name and reloads the map if another process has
+    inserted it since. Missing types are inserted inside the caller's
+    transaction (insert-or-ignore, then re-read, so concurrent creators
+    converge on the same row) and only become visible to other callers
+    after that transaction commits.
+    """
+
+    def __init__(self):
+        self._maps = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def normalize(name: str) -> str:
+        """Registry key of a type name (stripped, lowercase)."""
+        return name.strip().lower()
+
+    @staticmethod
+    def _key() -> str:
+        return str(db.engine.url)
+
+    def _load(self) -> Dict[str, int]:
+        rows = db.session.execute(select(PokemonType.id, PokemonType.name)).all()
+        return {self.normalize(row.name): row.id for row in rows}
+
+    def name_to_id(self) -> Dict[str, int]:
+        """
+        Full name -> id map, loaded on first use.
+
+        Returns:
+            dict: Lowercase type name -> pokemon_type.id
+        """
+        mapping = self._maps.get(self._key())
+        return mapping if mapping is not None else self._reload()
+
+    def _reload(self) -> Dict[str, int]:
+        key = self._key()
+        mapping = self._load()
+        with self._lock:
+            self._maps[key] = mapping
+        return mapping
+
+    def get_id(self, name: str) -> Optional[int]:
+        """
+        Id of an existing type (case-insensitive), or None.
+
+        A miss costs one indexed lookup of that name; if another process
+        created it since the map was loaded, the map is reloaded. Skipped
+        while this session has uncommitted new types, which a reload would
+        publish early.
+        """
+        name = self.normalize(name)
+        type_id = self.name_to_id().get(name)
+        if type_id is None and 'type_registry_pending' not in db.session.info:
+            type_id = db.session.execute(
+                select(PokemonType.id).where(PokemonType.name == name)
+            ).scalar()
+            if type_id is not None:
+                self._reload()
+        return type_id
+
+    def resolve(self, names: Iterable[str]) -> Dict[str, int]:
+        """
+        Map type names to ids, inserting missing types without committing.
+
+        Args:
+            names (iterable): Type names (any case)
+
+        Returns:
+            dict: Lowercase name -> id for every requested name
+        """
+        names = {self.normalize(name) for name in names}
+        mapping = self.name_to_id()
+        resolved = {name: mapping[name] for name in names if name in mapping}
+        missing = names - set(resolved)
+        if not missing:
+            return resolved
+
+        db.session.execute(self._insert_ignore(), [{'name': name} for name in sorted(missing)])
+        rows = db.session.execute(
+            select(PokemonType.id, PokemonType.name).where(PokemonType.name.in_(missing))
+        ).all()
+        created = {row.name: row.id for row in rows}
+
+        # Publish only once the caller's transaction commits
+        pending = db.session.info.setdefault('type_registry_pending', {})
+        pending.setdefault(self._key(), {}).update(created)
+
+        resolved.update(created)
+        return resolved
+
+    @staticmethod
+    def _insert_ignore():
+        """INSERT that skips names another writer created first."""
+        table = PokemonType.__table__
+        dialect = db.engine.dialect.name
+        if dialect == 'sqlite':
+            return sqlite.insert(table).on_conflict_do_nothing(index_elements=['name'])
+        if dialect == 'postgresql':
+            return postgresql.insert(table).on_conflict_do_nothing(index_elements=['name'])
+        return insert(table).prefix_with('IGNORE')
+
+    def publish(self, pending: Dict[str, Dict[str, int]]):
+        with self._lock:
+            for key, created in pending.items():
+                if key in self._maps:
+                    self._maps[key] = {**self._maps[key], **created}
+
+    def reset(self):
+        """Forget every loaded map (next lookup reloads from the table)."""
+        with self._lock:
+            self._maps.clear()
+
+
+# Process-wide instance
+type_registry = TypeRegistry()
+
+
+@event.listens_for(Session, 'after_commit')
+def _publish_created_types(session):
+    pending = session.info.pop('type_registry_pending', None)
+    if pending:
+        type_registry.publish(pending)
+
+
+@event.listens_for(Session, 'after_rollback')
+def _discard_created_types(session):
+    session.info.pop('type_registry_pending', None)
@@ -0,0 +1,77 @@
+"""
+Description: Stat analytics REST API routes.
+Author: Bryan Vela
+Created: 2026-10-17
+"""
+import math
+
+from flask import Blueprint, jsonify, request
+from services.analytics_service import StatAnalyticsService
+
+# Create Blueprint
+analytics_bp = Blueprint('analytics', __name__)
+
+
+def _unknown_type(type_name):
+    return jsonify({
+        'success': False,
+        'error': f'Type "{type_name}" not found'
+    }), 404
+
+
+@analytics_bp.route('/percentiles', methods=['GET'])
+def stat_percentiles():
+    """
+    Percentiles of every base stat and the total (?p=10,50,90&type=fire).
+    """
+    raw = request.args.get('p', None)
+    percentiles = StatAnalyticsService.DEFAULT_PERCENTILES
+    if raw:
+        try:
+            percentiles = [float(p) for p in raw.split(',')]
+        except ValueError:
+            percentiles = None
+        if not percentiles or len(percentiles) > 20 or any(not math.isfinite(p) or p < 0 or p > 100 for p in percentiles):
+            return jsonify({
+                'success': False,
+                'error': 'Invalid p, expected up to 20 comma-separated values between 0 and 100'
+            }), 400
+
+    type_name = request.args.get('type', None)
+    data = StatAnalyticsService().percentiles(percentiles, type_name=type_name)
+    if data is None:
+        return _unknown_type(type_name)
+
+    return jsonify({
+        'success': True,
+        'data': data
+    }), 200
+
+
+@analytics_bp.route('/top', methods=['GET'])
+def top_by_total():
+    """
+    Top-N Pokemon by base-stat total per type (?n=10&type=dragon).
+    """
+    n = max(1, min(request.args.get('n', 10, type=int), 100))
+    type_name = request.args.get('type', None)
+
+    data = StatAnalyticsService().top_by_total(n, type_name=type_name)
+    if data is None:
+        return _unknown_type(type_name)
+
+    return jsonify({
+        'success': True,
+        'data': data
+    }), 200
+
+
+@analytics_bp.route('/means-by-type', methods=['GET'])
+def means_by_type():
+    """
+    Mean base stats per type.
+    """
+    return jsonify({
+        'success': True,
+        'data': StatAnalyticsService().means_by_type()
+    }), 200
@@ -3,8 +3,23 @@ Description: Pokemon REST API routes.
 Author: Bryan Vela
 Created: 2026-01-29
 """
-from flask import Blueprint, jsonify, request
+import csv
+import io
+import json
+from flask import Blueprint, jsonify, request, current_app, Response, stream_with_context, url_for
 from services.pokemon_service import PokemonService
+from services.validators import InputValidator
+from services.response_cache import pokemon_response_cache
+from services.negative_cache import unknown_pokemon_names
+from services.http_client import get_http_client
+from services.similarity_service import SimilarityService
+from services.team_service import TeamCoverageService
+from services.type_chart import get_type_chart
+from models.pokemonStatSummary import STAT_COLUMNS
+from models.fetchJob import FetchJob
+from utils.db import db
+from utils.compression import client_accepts_gzip, gzip_stream
+from utils.http_cache import list_etag, not_modified, pokemon_etag
 
 # Create Blueprint
 pokemon_bp = Blueprint('pokemon', __name__)
@@ -13,20 +28,35 @@ pokemon_bp = Blueprint('pokemon', __name__)
 @pokemon_bp.route('/', methods=['GET'])
 def get_all_pokemon():
     """
-    Get all Pokemon.
+    Get all Pokemon (keyset paginated).
     """
+    limit = request.args.get('limit', 100, type=int)
+    limit = max(1, min(limit, 500))  # Max 500
+    cursor = request.args.get('cursor', None, type=int)
+    sort = request.args.get('sort', 'id')
+    
+    if sort not in PokemonService.SORT_KEYS:
+        return jsonify({
+            'success': False,
+            'error': f'Invalid sort "{sort}", expected one of: {", ".join(PokemonService.SORT_KEYS)}'
+        }), 400
+    
     try:
-        limit = request.args.get('limit', 100, type=int)
-        limit = min(limit, 500)  # Max 500
-        
         service = PokemonService()
-        pokemon_list = service.get_all_pokemon(limit=limit)
+        etag = list_etag(*service.get_list_version(), limit, cursor, sort)
+        unchanged = not_modified(etag)
+        if unchanged is not None:
+            return unchanged
         
-        return jsonify({
-            'success': True,
-            'count': len(pokemon_list),
-            'data': [p.to_dict() for p in pokemon_list]
-        }), 200
+        documents, next_cursor = service.get_all_documents(limit=limit, cursor=cursor, sort=sort)
+        
+        response = _document_response(
+            b'[' + b','.join(documents) + b']',
+            count=len(documents),
+            next_cursor=next_cursor
+        )
+        response.set_etag(etag)
+        return response, 200
     except Exception as e:
         return jsonify({
             'success': False,
@@ -34,24 +64,280 @@ def get_all_pokemon():
         }), 500
 
 
+def _document_body(data, **fields):
+    """
+    Encode {'success': True, 'data': data, **fields} like jsonify (sorted
+    keys, compact), where data is already encoded JSON bytes - stored
+    documents are spliced in without being parsed.
+    """
+    fields['success'] = True
+    parts = []
+    for key in sorted([*fields, 'data']):
+        value = data if key == 'data' else current_app.json.dumps(fields[key]).encode('utf-8')
+        parts.append(json.dumps(key).encode('utf-8') + b':' + value)
+    return b'{' + b','.join(parts) + b'}\n'
+
+
+def _document_response(data, **fields):
+    return Response(_document_body(data, **fields), mimetype='application/json')
+
+
+def _encoded_response(etag, body):
+    """Build a 200 response from an already encoded body."""
+    response = Response(body, status=200, mimetype='application/json')
+    response.set_etag(etag)
+    return response
+
+
+def _cached_pokemon_response(etag, body):
+    """Respond with a cached body, or a 304 if the client has it."""
+    return not_modified(etag) or _encoded_response(etag, body)
+
+
+def _pokemon_response(service, found, generation):
+    """
+    Respond with a Pokemon found as (id, name, updated_at) and cache the body.
+    
+    The ETag is checked before the document is read, so a 304 costs the
+    one version lookup.
+    """
+    pokemon_id, name, updated_at = found
+    etag = pokemon_etag(pokemon_id, updated_at)
+    unchanged = not_modified(etag)
+    if unchanged is not None:
+        return unchanged
+    
+    body = _document_body(service.get_document(pokemon_id))
+    pokemon_response_cache.put(pokemon_id, name, etag, body, generation)
+    return _encoded_response(etag, body)
+
+
+def _page_args(default_limit=50):
+    """Parse limit/offset query parameters."""
+    limit = max(1, min(request.args.get('limit', default_limit, type=int), 500))
+    offset = max(0, request.args.get('offset', 0, type=int))
+    return limit, offset
+
+
+def _page_response(results, limit, offset):
+    """Offset-paginated list response."""
+    return jsonify({
+        'success': True,
+        'count': len(results),
+        'next_offset': offset + limit if len(results) == limit else None,
+        'data': results
+    }), 200
+
+
+@pokemon_bp.route('/search', methods=['GET'])
+def search_pokemon():
+    """
+    Search Pokemon by base-stat ranges.
+    
+    Query: min_<stat>/max_<stat> for hp, attack, defense, special_attack,
+    special_defense, speed and total; sort, order (asc/desc), limit, offset.
+    """
+    ranges = {}
+    for column in PokemonService.SEARCH_COLUMNS:
+        low = request.args.get(f'min_{column}', None, type=int)
+        high = request.args.get(f'max_{column}', None, type=int)
+        if low is not None or high is not None:
+            ranges[column] = (low, high)
+    
+    sort = request.args.get('sort', 'total').replace('-', '_')
+    if sort not in PokemonService.SEARCH_COLUMNS:
+        return jsonify({
+            'success': False,
+            'error': f'Invalid sort "{sort}", expected one of: {", ".join(PokemonService.SEARCH_COLUMNS)}'
+        }), 400
+    
+    order = request.args.get('order', 'desc')
+    if order not in ('asc', 'desc'):
+        return jsonify({
+            'success': False,
+            'error': 'Invalid order, expected "asc" or "desc"'
+        }), 400
+    
+    limit, offset = _page_args()
+    
+    service = PokemonService()
+    results = service.search_by_stats(
+        ranges,
+        sort=sort,
+        descending=(order == 'desc'),
+        limit=limit,
+        offset=offset
+    )
+    
+    return _page_response(results, limit, offset)
+
+
+@pokemon_bp.route('/suggest', methods=['GET'])
+def suggest_pokemon():
+    """
+    Typeahead name suggestions (?q=char&k=10), tolerant to typos.
+    """
+    query = request.args.get('q', '').strip()
+    if not query or len(query) > 50:
+        return jsonify({
+            'success': False,
+            'error': 'Query "q" must be 1-50 characters'
+        }), 400
+    
+    k = max(1, min(request.args.get('k', 10, type=int), 50))
+    
+    service = PokemonService()
+    results = service.suggest_names(query, k)
+    
+    return jsonify({
+        'success': True,
+        'count': len(results),
+        'data': results
+    }), 200
+
+
+EXPORT_CSV_COLUMNS = (
+    ['id', 'name', 'pokedex_number', 'height', 'weight', 'types']
+    + list(STAT_COLUMNS)
+    + ['abilities', 'sprite_front_default', 'sprite_front_shiny', 'created_at', 'updated_at']
+)
+
+
+def _csv_row(data):
+    """Flatten a Pokemon dict into one CSV row."""
+    abilities = [
+        f"{a['name']}(hidden)" if a['is_hidden'] else a['name']
+        for a in data['abilities']
+    ]
+    return (
+        [data['id'], data['name'], data['pokedex_number'], data['height'], data['weight'],
+         '|'.join(t['name'] for t in data['types'])]
+        + [data['stats'].get(stat) for stat in STAT_COLUMNS]
+        + ['|'.join(abilities), data['sprites']['front_default'], data['sprites']['front_shiny'],
+           data['created_at'], data['updated_at']]
+    )
+
+
+def _export_chunks(export_format, chunk_size):
+    """Encode the whole table as NDJSON or CSV, one byte chunk per batch of rows."""
+    service = PokemonService()
+    if export_format == 'ndjson':
+        # Stored documents are already one-line JSON
+        batch = []
+        for document in service.iter_documents(chunk_size=chunk_size):
+            batch.append(document)
+            if len(batch) == chunk_size:
+                yield b'\n'.join(batch) + b'\n'
+                batch = []
+        if batch:
+            yield b'\n'.join(batch) + b'\n'
+        return
+    
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(EXPORT_CSV_COLUMNS)
+    
+    rows = 0
+    for document in service.iter_documents(chunk_size=chunk_size):
+        writer.writerow(_csv_row(json.loads(document)))
+        rows += 1
+        if rows % chunk_size == 0:
+            yield buffer.getvalue().encode('utf-8')
+            buffer.seek(0)
+            buffer.truncate()
+    
+    if buffer.tell():
+        yield buffer.getvalue().encode('utf-8')
+
+
+@pokemon_bp.route('/export', methods=['GET'])
+def export_pokemon():
+    """
+    Stream every Pokemon with stats, types and abilities (?format=ndjson|csv).
+    """
+    export_format = request.args.get('format', 'ndjson')
+    if export_format not in ('ndjson', 'csv'):
+        return jsonify({
+            'success': False,
+            'error': 'Invalid format, expected "ndjson" or "csv"'
+        }), 400
+    
+    chunk_size = current_app.config.get('EXPORT_CHUNK_SIZE', 500)
+    chunks = _export_chunks(export_format, chunk_size)
+    
+    headers = {
+        'Content-Disposition': f'attachment; filename=pokemon.{export_format}',
+        'Vary': 'Accept-Encoding'
+    }
+    if client_accepts_gzip():
+        chunks = gzip_stream(chunks, current_app.config.get('GZIP_COMPRESSION_LEVEL', 6))
+        headers['Content-Encoding'] = 'gzip'
+    
+    mimetype = 'text/csv' if export_format == 'csv' else 'application/x-ndjson'
+    return Response(stream_with_context(chunks), mimetype=mimetype, headers=headers)
+
+
+@pokemon_bp.route('/type/<string:type_name>', methods=['GET'])
+def get_pokemon_by_type(type_name):
+    """
+    List Pokemon of a type (optional slot=1|2).
+    """
+    slot = request.args.get('slot', None, type=int)
+    limit, offset = _page_args()
+    
+    service = PokemonService()
+    results = service.get_pokemon_by_type(type_name, slot=slot, limit=limit, offset=offset)
+    
+    if results is None:
+        return jsonify({
+            'success': False,
+            'error': f'Type "{type_name}" not found'
+        }), 404
+    
+    return _page_response(results, limit, offset)
+
+
+@pokemon_bp.route('/ability/<string:ability_name>', methods=['GET'])
+def get_pokemon_by_ability(ability_name):
+    """
+    List Pokemon with an ability (optional hidden=true|false).
+    """
+    hidden = request.args.get('hidden', None)
+    if hidden is not None:
+        if hidden.lower() not in ('true', 'false', '1', '0'):
+            return jsonify({
+                'success': False,
+                'error': 'Invalid hidden, expected "true" or "false"'
+            }), 400
+        hidden = hidden.lower() in ('true', '1')
+    limit, offset = _page_args()
+    
+    service = PokemonService()
+    results = service.get_pokemon_by_ability(ability_name, is_hidden=hidden, limit=limit, offset=offset)
+    
+    return _page_response(results, limit, offset)
+
+
 @pokemon_bp.route('/<int:pokemon_id>', methods=['GET'])
 def get_pokemon_by_id(pokemon_id):
     """
     Get Pokemon by ID.
     """
+    cached = pokemon_response_cache.get_by_id(pokemon_id)
+    if cached is not None:
+        return _cached_pokemon_response(*cached)
+    
+    generation = pokemon_response_cache.generation
     service = PokemonService()
-    pokemon = service.get_pokemon_by_id(pokemon_id)
+    found = service.get_version_by_id(pokemon_id)
     
-    if not pokemon:
+    if not found:
         return jsonify({
             'success': False,
             'error': 'Pokemon not found'
         }), 404
     
-    return jsonify({
-        'success': True,
-        'data': pokemon.to_dict()
-    }), 200
+    return _pokemon_response(service, found, generation)
 
 
 @pokemon_bp.route('/name/<string:name>', methods=['GET'])
@@ -59,18 +345,188 @@ def get_pokemon_by_name(name):
     """
     Get Pokemon by name.
     """
+    cached = pokemon_response_cache.get_by_name(name)
+    if cached is not None:
+        return _cached_pokemon_response(*cached)
+    
+    generation = pokemon_response_cache.generation
     service = PokemonService()
-    pokemon = service.get_pokemon_by_name(name)
+    found = service.get_version_by_name(name)
     
-    if not pokemon:
+    if not found:
         return jsonify({
             'success': False,
             'error': f'Pokemon "{name}" not found in database'
         }), 404
     
+    return _pokemon_response(service, found, generation)
+
+
+def _is_int(value):
+    """True for JSON integers (bool is an int subclass but not an id)."""
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+def _similar_args(args):
+    """Validate k/metric/type for similarity queries; returns (options, error response)."""
+    try:
+        k = max(1, min(int(args.get('k', 10)), 100))
+    except (TypeError, ValueError):
+        k = None
+    metric = args.get('metric', 'euclidean')
+    if k is None or metric not in SimilarityService.METRICS:
+        return None, (jsonify({
+            'success': False,
+            'error': f'Invalid k or metric, expected k=1-100 and metric one of: {", ".join(SimilarityService.METRICS)}'
+        }), 400)
+    return {'k': k, 'metric': metric, 'type_name': args.get('type') or None}, None
+
+
+@pokemon_bp.route('/<int:pokemon_id>/similar', methods=['GET'])
+def get_similar_pokemon(pokemon_id):
+    """
+    Pokemon with the closest base-stat spread (?k=10&metric=euclidean|cosine&type=dragon).
+    """
+    options, error = _similar_args(request.args)
+    if error:
+        return error
+    
+    result = SimilarityService().similar([pokemon_id], **options)
+    if result is None:
+        return jsonify({
+            'success': False,
+            'error': f'Type "{options["type_name"]}" not found'
+        }), 404
+    if result['not_found']:
+        return jsonify({
+            'success': False,
+            'error': 'Pokemon not found'
+        }), 404
+    
+    neighbours = result['results'][pokemon_id]
     return jsonify({
         'success': True,
-        'data': pokemon.to_dict()
+        'count': len(neighbours),
+        'data': neighbours
+    }), 200
+
+
+@pokemon_bp.route('/similar', methods=['POST'])
+def get_similar_pokemon_batch():
+    """
+    Nearest neighbours for many Pokemon in one pass.
+    
+    Body: {"ids": [445, 149], "k": 10, "metric": "euclidean", "type": "dragon"}
+    """
+    data = request.get_json(silent=True)
+    
+    if not isinstance(data, dict) or not isinstance(data.get('ids'), list) or not data['ids']:
+        return jsonify({
+            'success': False,
+            'error': 'Missing non-empty "ids" array in request body'
+        }), 400
+    
+    if len(data['ids']) > 500 or not all(_is_int(i) for i in data['ids']):
+        return jsonify({
+            'success': False,
+            'error': '"ids" must be at most 500 integers'
+        }), 400
+    
+    options, error = _similar_args(data)
+    if error:
+        return error
+    
+    result = SimilarityService().similar(data['ids'], **options)
+    if result is None:
+        return jsonify({
+            'success': False,
+            'error': f'Type "{options["type_name"]}" not found'
+        }), 404
+    
+    return jsonify({
+        'success': True,
+        'data': {str(pokemon_id): neighbours for pokemon_id, neighbours in result['results'].items()},
+        'not_found': result['not_found']
+    }), 200
+
+
+@pokemon_bp.route('/team/coverage', methods=['POST'])
+def team_coverage():
+    """
+    Defensive weaknesses and offensive coverage of a team.
+    
+    Body: {"ids": [445, 6, ...] (1-6), "bulk": false, "limit": 20}
+    bulk=true also scores every stored Pokemon against the team.
+    """
+    data = request.get_json(silent=True)
+    
+    ids = data.get('ids') if isinstance(data, dict) else None
+    if not isinstance(ids, list) or not ids:
+        return jsonify({
+            'success': False,
+            'error': 'Missing non-empty "ids" array in request body'
+        }), 400
+    
+    if len(ids) > TeamCoverageService.MAX_TEAM_SIZE or not all(_is_int(i) for i in ids):
+        return jsonify({
+            'success': False,
+            'error': f'"ids" must be at most {TeamCoverageService.MAX_TEAM_SIZE} integers'
+        }), 400
+    
+    limit = data.get('limit', 20)
+    if not _is_int(limit):
+        limit = 20
+    limit = max(1, min(limit, 500))
+    
+    chart = get_type_chart(current_app.config, current_app.instance_path)
+    result = TeamCoverageService(chart).coverage(ids, bulk=bool(data.get('bulk')), limit=limit)
+    
+    if not result['team']:
+        return jsonify({
+            'success': False,
+            'error': 'None of the Pokemon were found'
+        }), 404
+    
+    return jsonify({
+        'success': True,
+        'data': result
+    }), 200
+
+
+@pokemon_bp.route('/cache/stats', methods=['GET'])
+def get_cache_stats():
+    """
+    Hit/miss/eviction counters for the response and unknown-name caches,
+    plus request, retry and connection-reuse counters of the PokeAPI client.
+    """
+    return jsonify({
+        'success': True,
+        'data': {
+            'response_cache': pokemon_response_cache.stats(),
+            'unknown_names': unknown_pokemon_names.stats(),
+            'pokeapi_client': get_http_client(current_app.config).stats()
+        }
+    }), 200
+
+
+@pokemon_bp.route('/cache/unknown-names', methods=['DELETE'])
+def purge_unknown_names():
+    """
+    Purge the cache of names PokeAPI returned 404 for (?name=pikachu for one name).
+    """
+    name = request.args.get('name', None)
+    if name is not None:
+        name = InputValidator.sanitize_name(name)
+        if not name:
+            return jsonify({
+                'success': False,
+                'error': 'Invalid name format'
+            }), 400
+    
+    removed = unknown_pokemon_names.purge(name)
+    return jsonify({
+        'success': True,
+        'removed': removed
     }), 200
 
 
@@ -98,11 +554,11 @@ def fetch_pokemon(name):
 @pokemon_bp.route('/fetch/batch', methods=['POST'])
 def fetch_pokemon_batch():
     """
-    Fetch multiple Pokemon from PokeAPI.
+    Queue a batch fetch job; poll GET /jobs/<id> for progress and results.
     """
-    data = request.get_json()
+    data = request.get_json(silent=True)
     
-    if not data or 'pokemon' not in data:
+    if not isinstance(data, dict) or 'pokemon' not in data:
         return jsonify({
             'success': False,
             'error': 'Missing "pokemon" array in request body'
@@ -122,16 +578,45 @@ def fetch_pokemon_batch():
             'error': 'Pokemon list cannot be empty'
         }), 400
     
-    if len(pokemon_list) > 50:
+    max_names = current_app.config.get('JOB_MAX_NAMES', 5000)
+    if len(pokemon_list) > max_names:
         return jsonify({
             'success': False,
-            'error': 'Cannot fetch more than 50 Pokemon at once'
+            'error': f'Cannot queue more than {max_names} Pokemon in one job'
         }), 400
     
-    service = PokemonService()
-    results = service.sync_pokemon_list(pokemon_list)
+    if not all(isinstance(name, str) for name in pokemon_list):
+        return jsonify({
+            'success': False,
+            'error': '"pokemon" must contain only names'
+        }), 400
+    
+    job = current_app.extensions['fetch_job_queue'].enqueue(pokemon_list)
+    status_url = url_for('pokemon.get_fetch_job', job_id=job.id)
+    
+    return jsonify({
+        'success': True,
+        'job_id': job.id,
+        'status': job.status,
+        'status_url': status_url
+    }), 202, {'Location': status_url}
+
+
+@pokemon_bp.route('/jobs/<int:job_id>', methods=['GET'])
+def get_fetch_job(job_id):
+    """
+    Progress and per-item results of a batch fetch job (?results=false omits results).
+    """
+    job = db.session.get(FetchJob, job_id)
+    
+    if not job:
+        return jsonify({
+            'success': False,
+            'error': 'Job not found'
+        }), 404
     
+    include_results = request.args.get('results', 'true').lower() not in ('false', '0')
     return jsonify({
         'success': True,
-        'results': results
+        'data': job.to_dict(include_results=include_results)
     }), 200
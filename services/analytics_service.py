@@ -0,0 +1,120 @@
+"""
+Description: Stat distribution analytics over the in-memory stat matrix.
+Author: Bryan Vela
+Created: 2026-10-17
+"""
+from typing import Optional, Dict, Any, List, Sequence
+
+import numpy as np
+
+from services.stat_matrix import STAT_NAMES, StatMatrix, stat_matrix
+
+# Reported columns: the six base stats plus the total
+ANALYTICS_COLUMNS = STAT_NAMES + ('total',)
+
+
+class StatAnalyticsService:
+    """
+    Aggregations computed with vectorized NumPy operations on a StatMatrix
+    snapshot; no per-Pokemon Python loops and no SQL per request.
+    """
+
+    DEFAULT_PERCENTILES = (10, 25, 50, 75, 90)
+
+    def __init__(self, matrix: Optional[StatMatrix] = None):
+        self.matrix = matrix if matrix is not None else stat_matrix.snapshot()
+
+    def _columns(self) -> np.ndarray:
+        """(N, 7) int32 matrix: base stats then total."""
+        return np.column_stack([self.matrix.stats.astype(np.int32), self.matrix.total])
+
+    def _rows(self, type_name: Optional[str]) -> Optional[np.ndarray]:
+        """Row mask for a type filter (all rows if None), None if the type is unknown."""
+        if type_name is None:
+            return np.ones(len(self.matrix), dtype=bool)
+        return self.matrix.type_mask(type_name)
+
+    def percentiles(self, percentiles: Sequence[float] = DEFAULT_PERCENTILES,
+                    type_name: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """
+        Percentiles of every stat, optionally within one type.
+
+        Returns:
+            dict: {'count', 'percentiles': {stat: {p: value}}}, None if the type is unknown
+        """
+        rows = self._rows(type_name)
+        if rows is None:
+            return None
+
+        data = self._columns()[rows]
+        if not len(data):
+            return {'count': 0, 'percentiles': {}}
+
+        values = np.percentile(data, percentiles, axis=0)
+        return {
+            'count': len(data),
+            'percentiles': {
+                stat: {f'{p:g}': round(float(values[i, column]), 2) for i, p in enumerate(percentiles)}
+                for column, stat in enumerate(ANALYTICS_COLUMNS)
+            }
+        }
+
+    def _top_rows(self, rows: np.ndarray, n: int) -> np.ndarray:
+        """Row indices of the n highest totals among rows (ties by lower id)."""
+        candidates = np.flatnonzero(rows)
+        totals = self.matrix.total[candidates]
+        if len(candidates) > n:
+            best = np.argpartition(-totals, n - 1)[:n]
+            candidates, totals = candidates[best], totals[best]
+        order = np.lexsort((self.matrix.ids[candidates], -totals))
+        return candidates[order]
+
+    def _entry(self, row: int) -> Dict[str, Any]:
+        matrix = self.matrix
+        return {
+            'id': int(matrix.ids[row]),
+            'name': matrix.names[row],
+            'total': int(matrix.total[row]),
+            'stats': {stat: int(value) for stat, value in zip(STAT_NAMES, matrix.stats[row])}
+        }
+
+    def top_by_total(self, n: int = 10, type_name: Optional[str] = None) -> Optional[Dict[str, List[Dict[str, Any]]]]:
+        """
+        Top-n Pokemon by base-stat total for each type (or just type_name).
+
+        Returns:
+            dict: Type name -> ranked entries, None if the type is unknown
+        """
+        matrix = self.matrix
+        if type_name is not None:
+            rows = matrix.type_mask(type_name)
+            if rows is None:
+                return None
+            return {type_name.strip().lower(): [self._entry(row) for row in self._top_rows(rows, n)]}
+
+        return {
+            name: [self._entry(row) for row in self._top_rows(matrix.types[:, column], n)]
+            for column, name in enumerate(matrix.type_names)
+            if matrix.types[:, column].any()
+        }
+
+    def means_by_type(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Mean of every stat per type (dual-type Pokemon count towards both).
+
+        Returns:
+            dict: Type name -> {'count', 'means': {stat: value}}
+        """
+        membership = self.matrix.types.T.astype(np.int64)    # (T, N)
+        counts = membership.sum(axis=1)
+        sums = membership @ self._columns()                   # (T, 7)
+        means = sums / np.maximum(counts, 1)[:, None]
+
+        return {
+            name: {
+                'count': int(counts[column]),
+                'means': {stat: round(float(value), 2) for stat, value in zip(ANALYTICS_COLUMNS, means[column])}
+            }
+            for column, name in enumerate(self.matrix.type_names)
+            if counts[column]
+        }
@@ -0,0 +1,202 @@
+"""
+Description: Pooled, retrying HTTP client shared by all PokeAPI calls.
+Author: Bryan Vela
+Created: 2026-10-17
+"""
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
+from typing import Optional, Dict, Any
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+
+# Status codes worth retrying (throttling and transient upstream errors)
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+class TokenBucket:
+    """Thread-safe token bucket used as a client-side rate limit."""
+
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = max(1, capacity)
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """
+        Take one token, sleeping until one is available.
+
+        Returns:
+            float: Seconds spent waiting
+        """
+        if self.rate <= 0:
+            return 0.0
+
+        waited = 0.0
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return waited
+                delay = (1 - self.tokens) / self.rate
+            time.sleep(delay)
+            waited += delay
+
+
+class _ConnectionCounter:
+    """Counts new TCP connections opened by the pool."""
+
+    def __init__(self):
+        self.opened = 0
+        self.lock = threading.Lock()
+
+    def increment(self):
+        with self.lock:
+            self.opened += 1
+
+
+def _counting_pool(base, counter):
+    """Build a connection pool class that reports every new connection."""
+
+    class CountingPool(base):
+        def _new_conn(self):
+            counter.increment()
+            return super()._new_conn()
+
+    return CountingPool
+
+
+class PooledHTTPClient:
+    """
+    Keep-alive session with retries, backoff and rate limiting.
+
+    One instance is shared per process (see get_http_client) so TCP/TLS
+    connections are reused across requests and worker threads.
+    """
+
+    def __init__(self, pool_size: int = 10, max_retries: int = 3,
+                 backoff_factor: float = 0.5, backoff_max: float = 30.0,
+                 rate_limit: float = 0, rate_burst: int = 10):
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.backoff_max = backoff_max
+        self.bucket = TokenBucket(rate_limit, rate_burst)
+
+        self._connections = _ConnectionCounter()
+        self._stats_lock = threading.Lock()
+        self._stats = {
+            'requests': 0,
+            'retries': 0,
+            'throttled_seconds': 0.0
+        }
+
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=0)
+        adapter.poolmanager.pool_classes_by_scheme = {
+            'http': _counting_pool(HTTPConnectionPool, self._connections),
+            'https': _counting_pool(HTTPSConnectionPool, self._connections)
+        }
+
+        self.session = requests.Session()
+        self.session.headers.update({'Connection': 'keep-alive'})
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+    def _count(self, key: str, amount=1):
+        with self._stats_lock:
+            self._stats[key] += amount
+
+    def _backoff(self, attempt: int) -> float:
+        """Exponential backoff with full jitter."""
+        cap = min(self.backoff_max, self.backoff_factor * (2 ** attempt))
+        return random.uniform(0, cap)
+
+    def _retry_after(self, response: requests.Response) -> Optional[float]:
+        """Parse a Retry-After header (seconds or HTTP date)."""
+        value = response.headers.get('Retry-After')
+        if not value:
+            return None
+        try:
+            seconds = float(value)
+        except ValueError:
+            try:
+                when = parsedate_to_datetime(value)
+            except (TypeError, ValueError):
+                return None
+            seconds = (when - datetime.now(timezone.utc)).total_seconds()
+        return min(self.backoff_max, max(0.0, seconds))
+
+    def get(self, url: str, timeout: float, headers: Optional[Dict[str, str]] = None) -> requests.Response:
+        """
+        GET with retries on connection errors, timeouts, 429 and 5xx.
+
+        Returns:
+            requests.Response: The final response (may still be an error status)
+
+        Raises:
+            requests.exceptions.RequestException: If every attempt failed to connect
+        """
+        attempt = 0
+        while True:
+            self._count('throttled_seconds', self.bucket.acquire())
+            self._count('requests')
+            try:
+                response = self.session.get(url, timeout=timeout, headers=headers)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+                if attempt >= self.max_retries:
+                    raise
+                delay = self._backoff(attempt)
+            else:
+                if response.status_code not in RETRY_STATUSES or attempt >= self.max_retries:
+                    return response
+                delay = self._retry_after(response)
+                if delay is None:
+                    delay = self._backoff(attempt)
+                response.close()
+
+            attempt += 1
+            self._count('retries')
+            time.sleep(delay)
+
+    def stats(self) -> Dict[str, Any]:
+        """Connection reuse and retry counters."""
+        with self._stats_lock:
+            stats = dict(self._stats)
+        stats['connections_opened'] = self._connections.opened
+        stats['connections_reused'] = max(0, stats['requests'] - self._connections.opened)
+        return stats
+
+
+_client = None
+_client_lock = threading.Lock()
+
+
+def get_http_client(config) -> PooledHTTPClient:
+    """
+    Return the process-wide client, creating it from config on first use.
+
+    Args:
+        config: Flask config mapping
+    """
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = PooledHTTPClient(
+                    pool_size=config.get('POKEAPI_POOL_SIZE', 10),
+                    max_retries=config.get('POKEAPI_MAX_RETRIES', 3),
+                    backoff_factor=config.get('POKEAPI_BACKOFF_FACTOR', 0.5),
+                    backoff_max=config.get('POKEAPI_BACKOFF_MAX', 30.0),
+                    rate_limit=config.get('POKEAPI_RATE_LIMIT', 0),
+                    rate_burst=config.get('POKEAPI_RATE_BURST', 10)
+                )
+    return _client
@@ -0,0 +1,146 @@
+"""
+Description: Resumable full-Pokedex bulk import.
+Author: Bryan Vela
+Created: 2026-10-17
+"""
+import time
+from typing import Optional, Dict, Any, Callable, Tuple
+
+from models.importCheckpoint import ImportCheckpoint
+from utils.db import db
+from services.pokemon_service import PokemonService
+from services.validators import InputValidator
+
+
+class BulkImportService:
+    """
+    Pages the PokeAPI index and imports every Pokemon not yet stored.
+
+    Each index page is one chunk: its Pokemon are fetched concurrently,
+    saved on the calling thread and committed together with the checkpoint,
+    so an interrupted run resumes at the first unfinished page.
+    """
+
+    CHECKPOINT_NAME = 'pokedex'
+
+    def __init__(self, page_size: int = 100):
+        self.page_size = page_size
+        self.pokemon_service = PokemonService()
+        self.api_service = self.pokemon_service.api_service
+
+    def run(self, restart: bool = False, max_pokemon: Optional[int] = None,
+            progress: Optional[Callable[[Dict[str, Any]], None]] = None) -> Dict[str, Any]:
+        """
+        Import the Pokedex, resuming from the stored checkpoint.
+
+        Args:
+            restart (bool): Ignore the checkpoint and start from offset 0
+            max_pokemon (int): Stop after this many index entries (None = all)
+            progress (callable): Called with the summary after each chunk
+
+        Returns:
+            dict: Summary with imported/skipped/failed counts and throughput
+        """
+        checkpoint = ImportCheckpoint.get_or_create(self.CHECKPOINT_NAME)
+        if restart:
+            checkpoint.next_offset = 0
+            checkpoint.imported = 0
+            checkpoint.failed = 0
+
+        checkpoint.status = 'running'
+        db.session.commit()
+
+        summary = {
+            'start_offset': checkpoint.next_offset,
+            'imported': 0,
+            'skipped': 0,
+            'failed': 0
+        }
+        started = time.perf_counter()
+        seen = 0
+
+        while max_pokemon is None or seen < max_pokemon:
+            limit = self.page_size
+            if max_pokemon is not None:
+                limit = min(limit, max_pokemon - seen)
+
+            page = self.api_service.get_pokemon_index(limit=limit, offset=checkpoint.next_offset)
+            if page is None:
+                raise RuntimeError(f"Failed to fetch PokeAPI index at offset {checkpoint.next_offset}")
+
+            entries = page.get('results', [])
+            if not entries:
+                checkpoint.status = 'completed'
+                break
+
+            imported, skipped, failed = self._import_chunk(entries)
+            summary['imported'] += imported
+            summary['skipped'] += skipped
+            summary['failed'] += failed
+
+            # Progress and chunk data commit together
+            seen += len(entries)
+            checkpoint.next_offset += len(entries)
+            checkpoint.total = page.get('count', checkpoint.total)
+            checkpoint.imported += imported
+            checkpoint.failed += failed
+            if not page.get('next'):
+                checkpoint.status = 'completed'
+            db.session.commit()
+
+            if progress:
+                progress(self._report(summary, checkpoint, started))
+            if checkpoint.status == 'completed':
+                break
+
+        if checkpoint.status == 'running':
+            checkpoint.status = 'pending'
+        db.session.commit()
+        return self._report(summary, checkpoint, started)
+
+    def _import_chunk(self, entries) -> Tuple[int, int, int]:
+        """
+        Fetch and save one index page without committing.
+
+        Returns:
+            tuple: (imported, skipped, failed)
+        """
+        names = []
+        failed = 0
+        for entry in entries:
+            sanitized = InputValidator.sanitize_name(entry.get('name'))
+            if sanitized:
+                names.append(sanitized)
+            else:
+                failed += 1
+
+        existing = self.pokemon_service.existing_names(names)
+        pending = [name for name in names if name not in existing]
+
+        transformed = []
+        for _, data, _ in self.pokemon_service.fetch_many(pending):
+            if data:
+                transformed.append(data)
+            else:
+                failed += 1
+
+        # One multi-row insert per table for the whole chunk; rows it leaves
+        # out were already stored (by another writer) or repeated in the chunk
+        ids = self.pokemon_service.save_pokemon_batch(transformed, commit=False)
+        skipped = sum(1 for name in names if name in existing) + len(transformed) - len(ids)
+
+        return len(ids), skipped, failed
+
+    @staticmethod
+    def _report(summary: Dict[str, Any], checkpoint: ImportCheckpoint, started: float) -> Dict[str, Any]:
+        """Public summary with throughput."""
+        elapsed = time.perf_counter() - started
+        report = dict(summary)
+        report.update({
+            'next_offset': checkpoint.next_offset,
+            'total': checkpoint.total,
+            'status': checkpoint.status,
+            'elapsed_seconds': round(elapsed, 2),
+            'pokemon_per_second': round(report['imported'] / elapsed, 2) if elapsed > 0 else 0.0
+        })
+        return report
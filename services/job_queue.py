@@ -0,0 +1,168 @@
+"""
+Description: DB-backed queue and local worker pool for batch fetch jobs.
+Author: Bryan Vela
+Created: 2026-10-17
+"""
+import logging
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional
+
+from sqlalchemy import and_, or_, select, update
+
+from models.fetchJob import FetchJob
+from utils.db import db
+
+logger = logging.getLogger(__name__)
+
+
+class FetchJobQueue:
+    """
+    Worker threads draining the fetch_job table.
+
+    Jobs are claimed with a conditional UPDATE, so several processes can
+    share the table without running a job twice. A running job whose
+    heartbeat is older than stale_after seconds (its worker died) is
+    claimed again and resumes after its last committed chunk.
+    """
+
+    def __init__(self, app, workers: int = 1, chunk_size: int = 50,
+                 poll_interval: float = 5.0, stale_after: float = 300.0):
+        self.app = app
+        self.workers = workers
+        self.chunk_size = chunk_size
+        self.poll_interval = poll_interval
+        self.stale_after = stale_after
+        self._threads = []
+        self._wakeup = threading.Event()
+        self._stopping = threading.Event()
+        self._lock = threading.Lock()
+
+    def enqueue(self, names: List[str]) -> FetchJob:
+        """Store a job and wake the workers (starting them on first use)."""
+        job = FetchJob(names=names, total=len(names), status='queued', results=FetchJob.empty_results())
+        db.session.add(job)
+        db.session.commit()
+
+        self.start()
+        self._wakeup.set()
+        return job
+
+    def start(self):
+        """Start the worker threads (no-op if already running or workers=0)."""
+        with self._lock:
+            if self._threads or self.workers <= 0:
+                return
+            self._stopping.clear()
+            for number in range(self.workers):
+                thread = threading.Thread(target=self._run, name=f'fetch-job-worker-{number}', daemon=True)
+                thread.start()
+                self._threads.append(thread)
+
+    def stop(self, timeout: Optional[float] = None):
+        """Ask the workers to exit after their current chunk."""
+        self._stopping.set()
+        self._wakeup.set()
+        with self._lock:
+            threads, self._threads = self._threads, []
+        for thread in threads:
+            thread.join(timeout)
+
+    def _claimable(self):
+        cutoff = datetime.now(timezone.utc) - timedelta(seconds=self.stale_after)
+        return or_(
+            FetchJob.status == 'queued',
+            and_(FetchJob.status == 'running', FetchJob.heartbeat_at < cutoff)
+        )
+
+    def claim(self) -> Optional[int]:
+        """Atomically mark the oldest claimable job as running; returns its id."""
+        while True:
+            job_id = db.session.execute(
+                select(FetchJob.id).where(self._claimable()).order_by(FetchJob.id).limit(1)
+            ).scalar()
+            if job_id is None:
+                db.session.rollback()
+                return None
+
+            now = datetime.now(timezone.utc)
+            claimed = db.session.execute(
+                update(FetchJob)
+                .where(FetchJob.id == job_id, self._claimable())
+                .values(status='running', heartbeat_at=now, attempts=FetchJob.attempts + 1)
+            ).rowcount
+            db.session.commit()
+            if claimed:
+                return job_id
+
+    def has_unfinished(self) -> bool:
+        """True if any job is queued or running (possibly orphaned by a restart)."""
+        return db.session.execute(
+            select(FetchJob.id).where(FetchJob.status.in_(('queued', 'running'))).limit(1)
+        ).first() is not None
+
+    def process(self, job_id: int):
+        """Run a claimed job chunk by chunk, committing progress after each."""
+        from services.pokemon_service import PokemonService
+
+        job = db.session.get(FetchJob, job_id)
+        if job.started_at is None:
+            job.started_at = datetime.now(timezone.utc)
+            db.session.commit()
+
+        service = PokemonService()
+        try:
+            while job.processed < job.total and not self._stopping.is_set():
+                chunk = job.names[job.processed:job.processed + self.chunk_size]
+                job.record_chunk(service.sync_pokemon_list(chunk), len(chunk))
+                db.session.commit()
+
+            if job.processed >= job.total:
+                job.status = 'completed'
+                job.finished_at = datetime.now(timezone.utc)
+            else:
+                job.status = 'queued'  # stopped mid-job, resume later
+            db.session.commit()
+        except Exception as e:
+            db.session.rollback()
+            logger.exception("fetch job %s failed", job_id)
+            job = db.session.get(FetchJob, job_id)
+            job.status = 'failed'
+            job.error = str(e)
+            job.finished_at = datetime.now(timezone.utc)
+            db.session.commit()
+
+    def _run(self):
+        while not self._stopping.is_set():
+            job_id = None
+            try:
+                with self.app.app_context():
+                    job_id = self.claim()
+                    if job_id is not None:
+                        self.process(job_id)
+            except Exception as e:
+                logger.exception("fetch job worker error: %s", e)
+
+            if job_id is None:
+                self._wakeup.wait(self.poll_interval)
+                self._wakeup.clear()
+
+
+def init_job_queue(app):
+    """
+    Attach the queue to the app; workers start on the first enqueue, or
+    right away when unfinished jobs from a previous run are waiting.
+    """
+    queue = FetchJobQueue(
+        app,
+        workers=app.config.get('JOB_WORKERS', 1),
+        chunk_size=app.config.get('JOB_CHUNK_SIZE', 50),
+        poll_interval=app.config.get('JOB_POLL_INTERVAL', 5.0),
+        stale_after=app.config.get('JOB_STALE_SECONDS', 300)
+    )
+    app.extensions['fetch_job_queue'] = queue
+
+    with app.app_context():
+        if queue.has_unfinished():
+            queue.start()
+    return queue
@@ -0,0 +1,223 @@
+"""
+Description: In-memory prefix and fuzzy index over Pokemon names (typeahead).
+Author: Bryan Vela
+Created: 2026-10-17
+"""
+import bisect
+import sys
+import threading
+from collections import Counter
+from typing import Dict, List, Any
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+
+
+def _trigrams(name: str) -> set:
+    """Padded character trigrams ('$ch', 'cha', ..., 'rd$')."""
+    padded = f'${name}$'
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def _edit_distance(a: str, b: str, limit: int) -> int:
+    """
+    Levenshtein distance restricted to a diagonal band of width limit.
+
+    Returns limit + 1 as soon as the distance is known to exceed limit.
+    """
+    len_a, len_b = len(a), len(b)
+    if abs(len_a - len_b) > limit:
+        return limit + 1
+
+    too_far = limit + 1
+    previous = [j if j <= limit else too_far for j in range(len_b + 1)]
+    for i in range(1, len_a + 1):
+        low = max(1, i - limit)
+        high = min(len_b, i + limit)
+        current = [too_far] * (len_b + 1)
+        current[0] = i if i <= limit else too_far
+        char_a = a[i - 1]
+        best = current[0]
+        for j in range(low, high + 1):
+            cost = previous[j - 1] if char_a == b[j - 1] else previous[j - 1] + 1
+            if previous[j] + 1 < cost:
+                cost = previous[j] + 1
+            if current[j - 1] + 1 < cost:
+                cost = current[j - 1] + 1
+            current[j] = cost
+            if cost < best:
+                best = cost
+        if best > limit:
+            return too_far
+        previous = current
+    return min(previous[len_b], too_far)
+
+
+class NameIndex:
+    """
+    Sorted name array for prefix matches plus a trigram index for typos.
+
+    Prefix lookups are two bisects; fuzzy lookups rank names sharing
+    trigrams with the query and verify the best candidates with a bounded
+    edit distance.
+    """
+
+    # Fuzzy candidates verified with edit distance per query
+    FUZZY_CANDIDATES = 24
+
+    def __init__(self):
+        self._names = []
+        self._ids = {}
+        self._grams = {}
+        self._lock = threading.Lock()
+
+    def build(self, rows):
+        """Replace the index contents with (id, name) rows."""
+        names, ids, grams = [], {}, {}
+        for pokemon_id, name in rows:
+            key = name.lower()
+            ids[key] = pokemon_id
+            for gram in _trigrams(key):
+                grams.setdefault(gram, set()).add(key)
+        names = sorted(ids)
+        with self._lock:
+            self._names, self._ids, self._grams = names, ids, grams
+
+    def add(self, pokemon_id: int, name: str):
+        """Insert one name (no-op if already present)."""
+        key = name.lower()
+        with self._lock:
+            if key in self._ids:
+                self._ids[key] = pokemon_id
+                return
+            bisect.insort(self._names, key)
+            self._ids[key] = pokemon_id
+            for gram in _trigrams(key):
+                self._grams.setdefault(gram, set()).add(key)
+
+    def remove(self, name: str):
+        """Drop one name."""
+        key = name.lower()
+        with self._lock:
+            if self._ids.pop(key, None) is None:
+                return
+            position = bisect.bisect_left(self._names, key)
+            if position < len(self._names) and self._names[position] == key:
+                del self._names[position]
+            for gram in _trigrams(key):
+                self._grams.get(gram, set()).discard(key)
+
+    def __len__(self):
+        return len(self._names)
+
+    def _prefix(self, query: str, k: int) -> List[str]:
+        names = self._names
+        start = bisect.bisect_left(names, query)
+        end = bisect.bisect_left(names, query + '\uffff', start)
+        return names[start:min(end, start + k)]
+
+    def _fuzzy(self, query: str, k: int, exclude: set) -> List[Dict[str, Any]]:
+        overlap = Counter()
+        for gram in _trigrams(query):
+            overlap.update(self._grams.get(gram, ()))
+
+        limit = max(1, len(query) // 3)
+        matches = []
+        for name, shared in overlap.most_common(self.FUZZY_CANDIDATES + len(exclude)):
+            if name in exclude or len(name) < len(query) - limit:
+                continue
+            distance = _edit_distance(query, name, limit)
+            # Also accept typos in the part typed so far ("charizrd" -> "charizard-mega-x")
+            if distance > limit and len(name) > len(query):
+                distance = _edit_distance(query, name[:len(query) + 1], limit)
+            if distance <= limit:
+                matches.append((distance, -shared, name))
+                # Nothing can beat distance 1 (distance 0 is a prefix match)
+                if sum(1 for match in matches if match[0] == 1) >= k:
+                    break
+
+        matches.sort()
+        return [
+            {'name': name, 'id': self._ids.get(name), 'match': 'fuzzy', 'distance': distance}
+            for distance, _, name in matches[:k]
+        ]
+
+    def suggest(self, query: str, k: int = 10) -> List[Dict[str, Any]]:
+        """
+        Top-k names for a typeahead query: prefix matches first, then typo matches.
+
+        Returns:
+            list: {'name', 'id', 'match' ('prefix'|'fuzzy'), 'distance'}
+        """
+        query = query.strip().lower()
+        if not query:
+            return []
+
+        results = [
+            {'name': name, 'id': self._ids.get(name), 'match': 'prefix', 'distance': 0}
+            for name in self._prefix(query, k)
+        ]
+        if len(results) < k:
+            seen = {result['name'] for result in results}
+            results.extend(self._fuzzy(query, k - len(results), seen))
+        return results
+
+    def memory_bytes(self) -> int:
+        """Approximate memory held by the index structures."""
+        size = sys.getsizeof(self._names) + sys.getsizeof(self._ids) + sys.getsizeof(self._grams)
+        size += sum(sys.getsizeof(name) for name in self._names)
+        for gram, names in self._grams.items():
+            size += sys.getsizeof(gram) + sys.getsizeof(names)
+        return size
+
+
+# Process-wide instance
+name_index = NameIndex()
+
+
+def record_added(session, pairs):
+    """Queue (id, name) pairs to be added to the index when session commits."""
+    session.info.setdefault('name_index_added', []).extend(pairs)
+
+
+@event.listens_for(Session, 'after_flush')
+def _track_orm_changes(session, flush_context):
+    """Queue name changes made through the ORM (new, renamed, deleted Pokemon)."""
+    changes = session.info.setdefault('name_index_changes', [])
+    for obj in session.new:
+        if getattr(obj, '__tablename__', None) == 'pokemon':
+            changes.append(('add', obj.id, obj.name))
+    for obj in session.dirty:
+        if getattr(obj, '__tablename__', None) == 'pokemon':
+            for old_name in inspect(obj).attrs.name.history.deleted or ():
+                changes.append(('remove', obj.id, old_name))
+            changes.append(('add', obj.id, obj.name))
+    for obj in session.deleted:
+        if getattr(obj, '__tablename__', None) == 'pokemon':
+            changes.append(('remove', obj.id, obj.name))
+
+
+@event.listens_for(Session, 'after_commit')
+def _publish(session):
+    for pokemon_id, name in session.info.pop('name_index_added', ()):
+        name_index.add(pokemon_id, name)
+    for action, pokemon_id, name in session.info.pop('name_index_changes', ()):
+        if action == 'add':
+            name_index.add(pokemon_id, name)
+        else:
+            name_index.remove(name)
+
+
+@event.listens_for(Session, 'after_rollback')
+def _discard(session):
+    session.info.pop('name_index_added', None)
+    session.info.pop('name_index_changes', None)
+
+
+def init_name_index(app):
+    """Build the index from the pokemon table."""
+    from models.pokemon import Pokemon
+    from utils.db import db
+
+    with app.app_context():
+        name_index.build(db.session.query(Pokemon.id, Pokemon.name).all())
@@ -0,0 +1,60 @@
+"""
+Description: Negative cache of Pokemon names PokeAPI answered with 404.
+Author: Bryan Vela
+Created: 2026-10-17
+"""
+from typing import Optional
+
+from utils.cache import LRUCache
+
+
+class UnknownNameCache:
+    """
+    Bounded, TTL'd set of sanitized names known not to exist upstream.
+
+    Checked right after sanitizing a name, so typos and bots repeating
+    bad names get a 404 without any network I/O. Entries expire so names
+    added to PokeAPI later become fetchable again.
+    """
+
+    def __init__(self, max_entries: int = 10000, ttl: float = 3600):
+        self.cache = LRUCache(max_entries=max_entries, ttl=ttl)
+
+    def configure(self, max_entries: int, ttl: float):
+        """Resize the cache (drops current entries)."""
+        self.cache = LRUCache(max_entries=max_entries, ttl=ttl)
+
+    def add(self, name: str):
+        self.cache.set(name, True)
+
+    def contains(self, name: str) -> bool:
+        """True if name recently returned 404 (counts as a hit)."""
+        return self.cache.get(name) is not None
+
+    def purge(self, name: Optional[str] = None) -> int:
+        """
+        Forget one name, or every name if None.
+
+        Returns:
+            int: Number of entries removed
+        """
+        if name is not None:
+            return 1 if self.cache.delete(name) else 0
+        removed = len(self.cache)
+        self.cache.clear()
+        return removed
+
+    def stats(self):
+        return self.cache.stats()
+
+
+# Process-wide instance
+unknown_pokemon_names = UnknownNameCache()
+
+
+def init_negative_cache(app):
+    """Configure the unknown-name cache from app config."""
+    unknown_pokemon_names.configure(
+        max_entries=app.config.get('NEGATIVE_CACHE_MAX_ENTRIES', 10000),
+        ttl=app.config.get('NEGATIVE_CACHE_TTL', 3600)
+    )
@@ -0,0 +1,209 @@
+"""
+Description: Persistent on-disk cache of raw PokeAPI responses.
+Author: Bryan Vela
+Created: 2026-10-17
+"""
+import os
+import sqlite3
+import threading
+import time
+from collections import namedtuple
+from typing import Optional, Dict, Any
+
+
+CacheEntry = namedtuple('CacheEntry', ['body', 'etag', 'last_modified', 'fetched_at'])
+
+
+class PokeAPICache:
+    """
+    SQLite-backed cache of PokeAPI responses keyed by endpoint.
+
+    Entries keep the validators (ETag / Last-Modified) so stale entries can
+    be revalidated with a conditional request. Total body size is capped
+    and the least recently used entries are evicted first.
+
+    Reads do not write: access times are kept in memory and written in one
+    batch on the next put/revalidation, or once ACCESS_FLUSH_SIZE entries
+    are pending.
+    """
+
+    # Pending access times that trigger a batched write from get()
+    ACCESS_FLUSH_SIZE = 256
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS responses (
+            endpoint TEXT PRIMARY KEY,
+            body BLOB NOT NULL,
+            etag TEXT,
+            last_modified TEXT,
+            fetched_at REAL NOT NULL,
+            last_access REAL NOT NULL,
+            size INTEGER NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS ix_responses_last_access ON responses (last_access);
+    """
+
+    def __init__(self, path: str, ttl: int = 86400, max_bytes: int = 200 * 1024 * 1024):
+        self.path = path
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self._local = threading.local()
+        self._accessed = {}
+        self._accessed_lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self._stats = {
+            'hits': 0,
+            'misses': 0,
+            'revalidated': 0,
+            'stale_served': 0,
+            'evictions': 0
+        }
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        conn = self._conn()
+        conn.executescript(self.SCHEMA)
+        conn.commit()
+
+    def _conn(self) -> sqlite3.Connection:
+        """One connection per thread (sqlite3 connections are not shareable)."""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            self._local.conn = conn
+        return conn
+
+    def _count(self, key: str):
+        with self._stats_lock:
+            self._stats[key] += 1
+
+    def get(self, endpoint: str) -> Optional[CacheEntry]:
+        """
+        Look up an entry and mark it as recently used (in memory).
+
+        Returns:
+            CacheEntry or None: Cached response (fresh or stale)
+        """
+        conn = self._conn()
+        row = conn.execute(
+            'SELECT body, etag, last_modified, fetched_at FROM responses WHERE endpoint = ?',
+            (endpoint,)
+        ).fetchone()
+        if row is None:
+            self._count('misses')
+            return None
+
+        with self._accessed_lock:
+            self._accessed[endpoint] = time.time()
+            pending = len(self._accessed)
+        if pending >= self.ACCESS_FLUSH_SIZE:
+            self._flush_access(conn)
+            conn.commit()
+        return CacheEntry(*row)
+
+    def _flush_access(self, conn: sqlite3.Connection):
+        """Write pending access times in one executemany (caller commits)."""
+        with self._accessed_lock:
+            accessed, self._accessed = self._accessed, {}
+        if accessed:
+            conn.executemany(
+                'UPDATE responses SET last_access = MAX(last_access, ?) WHERE endpoint = ?',
+                [(when, endpoint) for endpoint, when in accessed.items()]
+            )
+
+    def is_fresh(self, entry: CacheEntry) -> bool:
+        """True if the entry is within its TTL."""
+        return time.time() - entry.fetched_at < self.ttl
+
+    def record_hit(self, fresh: bool = True):
+        """Count a response served from disk (fresh hit or stale fallback)."""
+        self._count('hits' if fresh else 'stale_served')
+
+    def put(self, endpoint: str, body: bytes, etag: Optional[str] = None,
+            last_modified: Optional[str] = None):
+        """Store a response body with its validators, evicting LRU entries over the cap."""
+        now = time.time()
+        conn = self._conn()
+        conn.execute(
+            'INSERT OR REPLACE INTO responses '
+            '(endpoint, body, etag, last_modified, fetched_at, last_access, size) '
+            'VALUES (?, ?, ?, ?, ?, ?, ?)',
+            (endpoint, body, etag, last_modified, now, now, len(body))
+        )
+        self._flush_access(conn)
+        self._evict(conn)
+        conn.commit()
+
+    def revalidated(self, endpoint: str):
+        """Restart the TTL of an entry after a 304 Not Modified."""
+        now = time.time()
+        conn = self._conn()
+        conn.execute(
+            'UPDATE responses SET fetched_at = ?, last_access = ? WHERE endpoint = ?',
+            (now, now, endpoint)
+        )
+        self._flush_access(conn)
+        conn.commit()
+        self._count('revalidated')
+
+    def _evict(self, conn: sqlite3.Connection):
+        """Drop least recently used entries until the size cap is met."""
+        total = conn.execute('SELECT COALESCE(SUM(size), 0) FROM responses').fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        rows = conn.execute('SELECT endpoint, size FROM responses ORDER BY last_access').fetchall()
+        for endpoint, size in rows:
+            if total <= self.max_bytes:
+                break
+            conn.execute('DELETE FROM responses WHERE endpoint = ?', (endpoint,))
+            total -= size
+            self._count('evictions')
+
+    def clear(self):
+        """Remove all entries."""
+        with self._accessed_lock:
+            self._accessed.clear()
+        conn = self._conn()
+        conn.execute('DELETE FROM responses')
+        conn.commit()
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss/revalidation counters plus current size."""
+        entries, size = self._conn().execute(
+            'SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses'
+        ).fetchone()
+        with self._stats_lock:
+            stats = dict(self._stats)
+        stats.update({'entries': entries, 'bytes': size})
+        return stats
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_pokeapi_cache(config, instance_path: str = '') -> Optional[PokeAPICache]:
+    """
+    Return the process-wide cache, or None when POKEAPI_CACHE_PATH is empty.
+
+    Args:
+        config: Flask config mapping
+        instance_path (str): Base directory for relative cache paths
+    """
+    global _cache
+    path = config.get('POKEAPI_CACHE_PATH')
+    if not path:
+        return None
+    path = os.path.join(instance_path, path)
+    if _cache is None or _cache.path != path:
+        with _cache_lock:
+            if _cache is None or _cache.path != path:
+                _cache = PokeAPICache(
+                    path,
+                    ttl=config.get('POKEAPI_CACHE_TTL', 86400),
+                    max_bytes=config.get('POKEAPI_CACHE_MAX_BYTES', 200 * 1024 * 1024)
+                )
+    return _cache
@@ -3,9 +3,18 @@ Description: fetch Pokemon data from PokeAPI.
 Author: Bryan Vela
 Created: 2026-01-29
 """
+import json
+import logging
+import time
 import requests
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
 from flask import current_app
+from services.http_client import get_http_client
+from services.pokeapi_cache import get_pokeapi_cache
+from services.negative_cache import unknown_pokemon_names
+from utils.metrics import record_pokeapi_call
+
+logger = logging.getLogger(__name__)
 
 
 class PokeAPIService:
@@ -14,24 +23,75 @@ class PokeAPIService:
     def __init__(self):
         self.base_url = current_app.config.get('POKEAPI_BASE_URL')
         self.timeout = current_app.config.get('POKEAPI_TIMEOUT', 10)
+        self.client = get_http_client(current_app.config)
+        self.cache = get_pokeapi_cache(current_app.config, current_app.instance_path)
     
     def _make_request(self, endpoint: str) -> Optional[Dict[str, Any]]:
-        """Make GET request to PokeAPI."""
+        """
+        Make GET request to PokeAPI (pooled, retried and rate limited).
+        
+        Responses are cached on disk; stale entries are revalidated with a
+        conditional request and served from disk on 304, or when the
+        upstream is unavailable or rate limiting.
+        """
+        return self._request(endpoint)[0]
+    
+    def _request(self, endpoint: str) -> Tuple[Optional[Dict[str, Any]], Optional[int]]:
+        """
+        _make_request that also returns the upstream status code (None when
+        served from cache or the request failed before a response).
+        """
         url = f"{self.base_url}{endpoint}"
         
+        entry = self.cache.get(endpoint) if self.cache else None
+        if entry and self.cache.is_fresh(entry):
+            self.cache.record_hit()
+            return json.loads(entry.body), None
+        
+        headers = {}
+        if entry and entry.etag:
+            headers['If-None-Match'] = entry.etag
+        if entry and entry.last_modified:
+            headers['If-Modified-Since'] = entry.last_modified
+        
+        started = time.perf_counter()
         try:
-            response = requests.get(url, timeout=self.timeout)
+            response = self.client.get(url, timeout=self.timeout, headers=headers)
+            record_pokeapi_call(time.perf_counter() - started, str(response.status_code))
+            if entry and response.status_code == 304:
+                self.cache.revalidated(endpoint)
+                return json.loads(entry.body), response.status_code
             response.raise_for_status()
-            return response.json()
+            data = response.json()
+            if self.cache:
+                self.cache.put(
+                    endpoint,
+                    response.content,
+                    etag=response.headers.get('ETag'),
+                    last_modified=response.headers.get('Last-Modified')
+                )
+            return data, response.status_code
         except requests.exceptions.Timeout:
-            print(f"Timeout: {url}")
-            return None
+            record_pokeapi_call(time.perf_counter() - started, 'timeout')
+            logger.warning("Timeout: %s", url)
+            return self._serve_stale(entry), None
         except requests.exceptions.HTTPError as e:
-            print(f"HTTP {e.response.status_code}: {url}")
-            return None
+            status = e.response.status_code
+            logger.warning("HTTP %s: %s", status, url)
+            if status >= 500 or status == 429:
+                return self._serve_stale(entry), status
+            return None, status
         except Exception as e:
-            print(f"Request failed: {e}")
+            record_pokeapi_call(time.perf_counter() - started, 'error')
+            logger.error("Request failed: %s", e)
+            return self._serve_stale(entry), None
+    
+    def _serve_stale(self, entry) -> Optional[Dict[str, Any]]:
+        """Fall back to a stale cached body when the upstream fails."""
+        if not entry:
             return None
+        self.cache.record_hit(fresh=False)
+        return json.loads(entry.body)
     
     def get_pokemon(self, pokemon_name: str) -> Optional[Dict[str, Any]]:
         """
@@ -40,7 +100,26 @@ class PokeAPIService:
         Returns PokeAPI response with: name, id, height, weight, 
         types, stats, abilities, sprites
         """
-        return self._make_request(f"/pokemon/{pokemon_name.lower()}")
+        name = pokemon_name.lower()
+        data, status = self._request(f"/pokemon/{name}")
+        if status == 404:
+            unknown_pokemon_names.add(name)
+        return data
+    
+    def get_pokemon_index(self, limit: int = 100, offset: int = 0) -> Optional[Dict[str, Any]]:
+        """
+        Fetch one page of the Pokemon index.
+        
+        Returns PokeAPI response with: count, next, previous,
+        results (list of {name, url})
+        """
+        return self._make_request(f"/pokemon?limit={limit}&offset={offset}")
+    
+    def get_type(self, type_name: str) -> Optional[Dict[str, Any]]:
+        """
+        Fetch one type (damage_relations holds its matchups).
+        """
+        return self._make_request(f"/type/{type_name.lower()}")
 
 
 class PokeAPITransformer:
@@ -3,26 +3,329 @@ Description: Pokemon logic service.
 Author: Bryan Vela
 Created: 2026-01-29
 """
-from typing import List, Optional, Dict, Any
+import logging
+import time
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import List, Optional, Dict, Any, Tuple, Set, Iterator
+from flask import current_app
+from sqlalchemy import func, select
+from sqlalchemy.orm import selectinload
 from models.pokemon import Pokemon
-from models.pokemonType import PokemonType
+from models.typeRegistry import type_registry
+from models.pokemontypes import PokemonTypeLink, pokemon_types
 from models.pokemonStat import PokemonStat
+from models.pokemonStatSummary import PokemonStatSummary, STAT_COLUMNS
 from models.pokemonAbility import PokemonAbility
+from models.fetchLock import FetchLock
 from utils.db import db
+from utils.singleflight import SingleFlight
 from services.pokeapi_service import PokeAPIService, PokeAPITransformer
 from services.validators import InputValidator, DataValidator
+from services.name_index import name_index, record_added
+from services.stat_matrix import record_changed
+from services.negative_cache import unknown_pokemon_names
+
+logger = logging.getLogger(__name__)
+
+# Process-wide: one in-flight upstream fetch per sanitized name
+pokemon_fetches = SingleFlight()
 
 
 class PokemonService:
     """Pokemon business logic."""
     
+    # Stat search columns (summary table column names)
+    SEARCH_COLUMNS = list(STAT_COLUMNS.values()) + ['total']
+    
+    # Columns usable as keyset cursors (both unique)
+    SORT_KEYS = {
+        'id': Pokemon.id,
+        'pokedex_number': Pokemon.pokedex_number
+    }
+    
     def __init__(self):
         self.api_service = PokeAPIService()
         self.transformer = PokeAPITransformer()
+        self.max_concurrency = current_app.config.get('POKEAPI_MAX_CONCURRENCY', 8)
+    
+    @staticmethod
+    def list_load_options():
+        """
+        Loader options for list paths.
+        
+        Collections are loaded with one SELECT ... IN per relationship
+        instead of joined eager loading, so LIMIT applies to Pokemon rows
+        and the row count grows linearly with page size.
+        """
+        return (
+            selectinload(Pokemon.type_links),
+            selectinload(Pokemon.stats),
+            selectinload(Pokemon.abilities)
+        )
+    
+    def get_all_pokemon(self, limit: int = 100, cursor: Optional[int] = None,
+                        sort: str = 'id') -> Tuple[List[Pokemon], Optional[int]]:
+        """
+        Get a page of Pokemon using keyset pagination.
+        
+        Args:
+            limit (int): Page size
+            cursor (int): Last sort key of the previous page, None for the first page
+            sort (str): Sort key, 'id' or 'pokedex_number'
+            
+        Returns:
+            tuple: (pokemon_list, next_cursor) - next_cursor is None on the last page
+        """
+        key = self.SORT_KEYS[sort]
+        query = Pokemon.query.options(*self.list_load_options()).order_by(key)
+        if cursor is not None:
+            query = query.filter(key > cursor)
+        
+        # Fetch one extra row to know whether another page exists
+        rows = query.limit(limit + 1).all()
+        if len(rows) <= limit:
+            return rows, None
+        
+        rows = rows[:limit]
+        return rows, getattr(rows[-1], sort)
+    
+    def get_all_documents(self, limit: int = 100, cursor: Optional[int] = None,
+                          sort: str = 'id') -> Tuple[List[bytes], Optional[int]]:
+        """
+        Keyset page of stored Pokemon documents (same paging as get_all_pokemon).
+        
+        Reads only the sort key and document columns; no relationships
+        are loaded and nothing is serialized.
+        
+        Returns:
+            tuple: (documents, next_cursor) - next_cursor is None on the last page
+        """
+        key = self.SORT_KEYS[sort]
+        query = select(Pokemon.id, key.label('sort_key'), Pokemon.document).order_by(key)
+        if cursor is not None:
+            query = query.where(key > cursor)
+        
+        rows = db.session.execute(query.limit(limit + 1)).all()
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = rows[-1].sort_key
+        return self._documents_of(rows), next_cursor
+    
+    def get_list_version(self) -> Tuple[int, Optional[datetime]]:
+        """
+        Row count and latest updated_at of the pokemon table, in one query.
+        
+        Together they change on every insert, delete and ORM update, so
+        they version the list pages (see utils.http_cache.list_etag).
+        """
+        row = db.session.execute(select(func.count(Pokemon.id), func.max(Pokemon.updated_at))).one()
+        return row[0], row[1]
+    
+    def get_version_by_id(self, pokemon_id: int) -> Optional[Tuple[int, str, datetime]]:
+        """
+        The values a Pokemon's ETag is built from, without its document.
+        
+        Returns:
+            tuple or None: (id, name, updated_at)
+        """
+        return self._version_row(Pokemon.id == pokemon_id)
+    
+    def get_version_by_name(self, name: str) -> Optional[Tuple[int, str, datetime]]:
+        """(id, name, updated_at) of a Pokemon by name (case-insensitive); see get_version_by_id."""
+        return self._version_row(Pokemon.name_key == Pokemon.normalize_name(name))
+    
+    def get_document(self, pokemon_id: int) -> Optional[bytes]:
+        """
+        Stored document of a Pokemon, encoded from the normalized tables if
+        the row has not been backfilled yet.
+        """
+        rows = db.session.execute(
+            select(Pokemon.id, Pokemon.document).where(Pokemon.id == pokemon_id)
+        ).all()
+        return self._documents_of(rows)[0] if rows else None
+    
+    def iter_documents(self, chunk_size: int = 500) -> Iterator[bytes]:
+        """Stream every stored document in id order from a yield_per cursor."""
+        query = (
+            select(Pokemon.id, Pokemon.document)
+            .order_by(Pokemon.id)
+            .execution_options(yield_per=chunk_size)
+        )
+        for rows in db.session.execute(query).partitions():
+            yield from self._documents_of(rows)
+    
+    def _version_row(self, condition) -> Optional[Tuple[int, str, datetime]]:
+        row = db.session.execute(
+            select(Pokemon.id, Pokemon.name, Pokemon.updated_at).where(condition)
+        ).first()
+        return tuple(row) if row is not None else None
+    
+    def _documents_of(self, rows) -> List[bytes]:
+        """
+        Documents of (id, document) rows in order.
+        
+        Rows written before the document column existed (not yet
+        backfilled) are encoded from the normalized tables on the fly.
+        """
+        missing = [row.id for row in rows if row.document is None]
+        if not missing:
+            return [row.document for row in rows]
+        
+        built = {
+            pokemon.id: Pokemon.encode_document(pokemon.to_dict())
+            for pokemon in db.session.scalars(
+                select(Pokemon).where(Pokemon.id.in_(missing)).options(*self.list_load_options())
+            )
+        }
+        return [row.document if row.document is not None else built[row.id] for row in rows]
+    
+    def search_by_stats(self, ranges: Dict[str, Tuple[Optional[int], Optional[int]]],
+                        sort: str = 'total', descending: bool = True,
+                        limit: int = 50, offset: int = 0) -> List[Dict[str, Any]]:
+        """
+        Search Pokemon by base-stat ranges using the indexed summary table.
+        
+        Args:
+            ranges (dict): Column name ('speed', 'special_attack', 'total', ...) -> (min, max);
+                either bound may be None
+            sort (str): Column to sort by
+            descending (bool): Sort direction
+            limit (int): Page size
+            offset (int): Rows to skip
+            
+        Returns:
+            list: Summary rows with id, name, pokedex_number and stats
+        """
+        summary = PokemonStatSummary
+        query = db.session.query(
+            Pokemon.id,
+            Pokemon.name,
+            Pokemon.pokedex_number,
+            summary
+        ).join(summary, summary.pokemon_id == Pokemon.id)
+        
+        for column, (low, high) in ranges.items():
+            attribute = getattr(summary, column)
+            if low is not None:
+                query = query.filter(attribute >= low)
+            if high is not None:
+                query = query.filter(attribute <= high)
+        
+        sort_column = getattr(summary, sort)
+        query = query.order_by(
+            sort_column.desc() if descending else sort_column.asc(),
+            Pokemon.id
+        )
+        
+        return [
+            {
+                'id': row.id,
+                'name': row.name,
+                'pokedex_number': row.pokedex_number,
+                'stats': row.PokemonStatSummary.to_dict()
+            }
+            for row in query.limit(limit).offset(offset).all()
+        ]
+    
+    def get_pokemon_by_type(self, type_name: str, slot: Optional[int] = None,
+                            limit: int = 50, offset: int = 0) -> Optional[List[Dict[str, Any]]]:
+        """
+        List Pokemon having a type, reading only the junction and pokemon rows.
+        
+        Args:
+            type_name (str): Type name (case-insensitive)
+            slot (int): Restrict to primary (1) or secondary (2) type
+            limit (int): Page size
+            offset (int): Rows to skip
+            
+        Returns:
+            list or None: Summary rows, None if the type is unknown
+        """
+        type_id = type_registry.get_id(type_name)
+        if type_id is None:
+            return None
+        
+        query = db.session.query(
+            Pokemon.id,
+            Pokemon.name,
+            Pokemon.pokedex_number,
+            pokemon_types.c.slot
+        ).join(pokemon_types, pokemon_types.c.pokemon_id == Pokemon.id).filter(
+            pokemon_types.c.type_id == type_id
+        )
+        if slot is not None:
+            query = query.filter(pokemon_types.c.slot == slot)
+        
+        rows = query.order_by(Pokemon.id).limit(limit).offset(offset).all()
+        return [
+            {
+                'id': row.id,
+                'name': row.name,
+                'pokedex_number': row.pokedex_number,
+                'slot': row.slot
+            }
+            for row in rows
+        ]
+    
+    def get_pokemon_by_ability(self, ability_name: str, is_hidden: Optional[bool] = None,
+                               limit: int = 50, offset: int = 0) -> List[Dict[str, Any]]:
+        """
+        List Pokemon having an ability.
+        
+        Args:
+            ability_name (str): Ability name (case-insensitive)
+            is_hidden (bool): Restrict to hidden (True) or normal (False) abilities
+            limit (int): Page size
+            offset (int): Rows to skip
+            
+        Returns:
+            list: Summary rows
+        """
+        query = db.session.query(
+            Pokemon.id,
+            Pokemon.name,
+            Pokemon.pokedex_number,
+            PokemonAbility.slot,
+            PokemonAbility.is_hidden
+        ).join(PokemonAbility, PokemonAbility.pokemon_id == Pokemon.id).filter(
+            PokemonAbility.name == ability_name.strip().lower()
+        )
+        if is_hidden is not None:
+            query = query.filter(PokemonAbility.is_hidden == (1 if is_hidden else 0))
+        
+        rows = query.order_by(Pokemon.id).limit(limit).offset(offset).all()
+        return [
+            {
+                'id': row.id,
+                'name': row.name,
+                'pokedex_number': row.pokedex_number,
+                'slot': row.slot,
+                'is_hidden': bool(row.is_hidden)
+            }
+            for row in rows
+        ]
     
-    def get_all_pokemon(self, limit: int = 100) -> List[Pokemon]: #limit 100 pokemon
-        """Get all Pokemon from database."""
-        return Pokemon.query.limit(limit).all()
+    def suggest_names(self, query: str, k: int = 10) -> List[Dict[str, Any]]:
+        """Typeahead suggestions (prefix, then typo-tolerant) from the in-memory name index."""
+        return name_index.suggest(query, k)
+    
+    def iter_all_pokemon(self, chunk_size: int = 500) -> Iterator[Pokemon]:
+        """
+        Stream every Pokemon in id order.
+        
+        Rows are read in chunks of chunk_size from a streaming cursor
+        (yield_per) and each chunk loads its collections with one SELECT
+        per relationship, so memory stays flat regardless of table size.
+        """
+        query = (
+            select(Pokemon)
+            .options(*self.list_load_options())
+            .order_by(Pokemon.id)
+            .execution_options(yield_per=chunk_size)
+        )
+        yield from db.session.scalars(query)
     
     def get_pokemon_by_id(self, pokemon_id: int) -> Optional[Pokemon]:
         """Get Pokemon by ID."""
@@ -30,120 +333,323 @@ class PokemonService:
     
     def get_pokemon_by_name(self, name: str) -> Optional[Pokemon]:
         """Get Pokemon by name (case-insensitive)."""
-        return Pokemon.query.filter(Pokemon.name.ilike(name)).first()
+        return Pokemon.get_by_name(name)
     
     def fetch_and_save_pokemon(self, pokemon_name: str) -> Optional[Pokemon]:
         """
         Fetch from PokeAPI and save to database.
-    
+        
+        Concurrent calls for the same name share one upstream fetch: within
+        the process through single-flight, across processes through a
+        fetch_lock row.
         """
         # s 1: Sanitize
         sanitized = InputValidator.sanitize_name(pokemon_name)
         if not sanitized:
-            print(f"invalid name format: {pokemon_name}")
+            logger.warning("invalid name format: %s", pokemon_name)
+            return None
+        
+        if unknown_pokemon_names.contains(sanitized):
+            logger.info("%s is a known unknown name, skipping PokeAPI", sanitized)
             return None
         
+        pokemon_id, shared = pokemon_fetches.do(sanitized, lambda: self._fetch_and_save_once(sanitized))
+        if shared:
+            logger.info("%s fetched by a concurrent request", sanitized)
+        
+        # Waiters reload the row into their own session
+        return db.session.get(Pokemon, pokemon_id) if pokemon_id else None
+    
+    def _fetch_and_save_once(self, sanitized: str) -> Optional[int]:
+        """Steps 2-6 for one name under the cross-process fetch lock; returns the id."""
         # s 2: Check if exists
         existing = self.get_pokemon_by_name(sanitized)
         if existing:
-            print(f"{sanitized} already exists (ID: {existing.id})")
-            return existing
+            logger.info("%s already exists (ID: %s)", sanitized, existing.id)
+            return existing.id
+        
+        config = current_app.config
+        with FetchLock.hold(sanitized, ttl=config.get('FETCH_LOCK_TTL', 60),
+                            wait=config.get('FETCH_LOCK_WAIT', 15)) as held:
+            # Another process may have saved it while we waited for the lock
+            existing = self.get_pokemon_by_name(sanitized)
+            if existing or not held:
+                return existing.id if existing else None
+            
+            # s 3-5: Fetch, transform and validate
+            transformed = self._fetch_transformed(sanitized)
+            if not transformed:
+                return None
+            
+            # Step 6: Save
+            pokemon = self._save_transformed(sanitized, transformed)
+            return pokemon.id if pokemon else None
+    
+    def _fetch_transformed(self, sanitized: str) -> Optional[Dict[str, Any]]:
+        """
+        Fetch, transform and validate a Pokemon without touching the database.
         
+        Safe to run from worker threads.
+        """
         # s 3: Fetch from API
-        print(f"Fetching {sanitized} from PokeAPI...")
+        logger.info("Fetching %s from PokeAPI...", sanitized)
         api_data = self.api_service.get_pokemon(sanitized)
         if not api_data:
-            print(f"failed to fetch {sanitized}")
+            logger.warning("failed to fetch %s", sanitized)
             return None
         
         # s 4: Transform 
         transformed = self.transformer.transform_pokemon(api_data)
         if not transformed:
-            print(f"Failed to transform {sanitized}")
+            logger.warning("Failed to transform %s", sanitized)
             return None
         
         #s 5: Validate
         is_valid, errors = DataValidator.validate_pokemon_data(transformed)
         if not is_valid:
-            print(f"Validation failed for {sanitized}:")
-            for error in errors:
-                print(f"   - {error}")
+            logger.warning("Validation failed for %s: %s", sanitized, "; ".join(errors))
             return None
         
-        # Step 6: Save
+        return transformed
+    
+    def _save_transformed(self, sanitized: str, transformed: Dict[str, Any]) -> Optional[Pokemon]:
+        """Save a validated Pokemon, rolling back on failure."""
         try:
             pokemon = self._save_pokemon_with_relations(transformed)
-            print(f"saved {sanitized} (ID: {pokemon.id})")
+            logger.info("saved %s (ID: %s)", sanitized, pokemon.id)
             return pokemon
         except Exception as e:
-            print(f"save error: {str(e)}")
+            logger.error("save error: %s", e)
             db.session.rollback()
             return None
     
-    def _save_pokemon_with_relations(self, data: Dict[str, Any]) -> Pokemon:
-        """Save Pokemon with types, stats, and abilities."""
-        # Create Pokemon
-        pokemon = Pokemon(
-            name=data['name'],
-            pokedex_number=data['pokedex_number'],
-            height=data['height'],
-            weight=data['weight'],
-            sprite_front_default=data.get('sprite_front_default'),
-            sprite_front_shiny=data.get('sprite_front_shiny')
+    def _save_pokemon_with_relations(self, data: Dict[str, Any], commit: bool = True) -> Pokemon:
+        """
+        Save Pokemon with types, stats, and abilities.
+        
+        Args:
+            data (dict): Transformed and validated Pokemon data
+            commit (bool): Commit at the end; False leaves it to the caller (chunked imports)
+            
+        Raises:
+            ValueError: If the name or Pokedex number is already stored
+        """
+        ids = self.save_pokemon_batch([data], commit=commit)
+        if data['name'] not in ids:
+            raise ValueError(f"Pokemon {data['name']} already exists")
+        return db.session.get(Pokemon, ids[data['name']])
+    
+    def save_pokemon_batch(self, items: List[Dict[str, Any]], commit: bool = True) -> Dict[str, int]:
+        """
+        Save many transformed Pokemon with a few executemany inserts.
+        
+        One INSERT each for pokemon, the type junction, stats and abilities,
+        all in the current transaction. Items whose name or Pokedex number
+        is already stored (or repeated in the batch) are skipped.
+        
+        Args:
+            items (list): Transformed and validated Pokemon dicts
+            commit (bool): Commit at the end; False leaves it to the caller
+            
+        Returns:
+            dict: name -> new Pokemon id for every inserted item
+        """
+        items = self._new_items(items)
+        if not items:
+            return {}
+        
+        type_ids = type_registry.resolve(
+            type_data['name']
+            for item in items
+            for type_data in item.get('types', [])
         )
-        db.session.add(pokemon)
-        db.session.flush()  # Get ID
-        
-        # Add types
-        for type_data in data.get('types', []):
-            pokemon_type = PokemonType.get_or_create(type_data['name'])
-            pokemon.types.append(pokemon_type)
-        
-        # Add stats
-        for stat_data in data.get('stats', []):
-            stat = PokemonStat(
-                pokemon_id=pokemon.id,
-                name=stat_data['name'],
-                value=stat_data['value']
+        
+        pokemon_table = Pokemon.__table__
+        rows = db.session.execute(
+            pokemon_table.insert().returning(
+                pokemon_table.c.id,
+                pokemon_table.c.name,
+                pokemon_table.c.created_at,
+                pokemon_table.c.updated_at,
+                sort_by_parameter_order=True
+            ),
+            [
+                {
+                    'name': item['name'],
+                    'name_key': Pokemon.normalize_name(item['name']),
+                    'pokedex_number': item['pokedex_number'],
+                    'height': item['height'],
+                    'weight': item['weight'],
+                    'sprite_front_default': item.get('sprite_front_default'),
+                    'sprite_front_shiny': item.get('sprite_front_shiny')
+                }
+                for item in items
+            ]
+        ).all()
+        ids = {row.name: row.id for row in rows}
+        
+        # Stored documents are built from the input, in the same transaction
+        Pokemon.store_documents(db.session, {
+            row.id: Pokemon.encode_document(
+                Pokemon.dict_from_data(item, row.id, row.created_at, row.updated_at)
+            )
+            for item, row in zip(items, rows)
+        })
+        
+        type_rows, stat_rows, ability_rows = [], [], []
+        for item in items:
+            pokemon_id = ids[item['name']]
+            type_rows.extend(
+                {
+                    'pokemon_id': pokemon_id,
+                    'type_id': type_ids[type_registry.normalize(type_data['name'])],
+                    'slot': type_data.get('slot', 1)
+                }
+                for type_data in item.get('types', [])
+            )
+            stat_rows.extend(
+                {
+                    'pokemon_id': pokemon_id,
+                    'name': stat_data['name'],
+                    'value': stat_data['value']
+                }
+                for stat_data in item.get('stats', [])
             )
-            db.session.add(stat)
-        
-        # Add abilities
-        for ability_data in data.get('abilities', []):
-            ability = PokemonAbility(
-                pokemon_id=pokemon.id,
-                name=ability_data['name'],
-                is_hidden=1 if ability_data['is_hidden'] else 0,
-                slot=ability_data['slot']
+            ability_rows.extend(
+                {
+                    'pokemon_id': pokemon_id,
+                    'name': ability_data['name'],
+                    'is_hidden': 1 if ability_data['is_hidden'] else 0,
+                    'slot': ability_data['slot']
+                }
+                for ability_data in item.get('abilities', [])
             )
-            db.session.add(ability)
         
-        db.session.commit()
-        return pokemon
+        for table, table_rows in (
+            (PokemonTypeLink.__table__, type_rows),
+            (PokemonStat.__table__, stat_rows),
+            (PokemonAbility.__table__, ability_rows)
+        ):
+            if table_rows:
+                db.session.execute(table.insert(), table_rows)
+        PokemonStatSummary.refresh(db.session, ids.values())
+        record_added(db.session, [(pokemon_id, name) for name, pokemon_id in ids.items()])
+        record_changed(db.session, ids.values())
+        
+        if commit:
+            db.session.commit()
+        return ids
+    
+    def _new_items(self, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Drop items already stored or repeated within the batch."""
+        names = {Pokemon.normalize_name(item['name']) for item in items}
+        numbers = {item['pokedex_number'] for item in items}
+        taken = db.session.query(Pokemon.name_key, Pokemon.pokedex_number).filter(
+            Pokemon.name_key.in_(names) | Pokemon.pokedex_number.in_(numbers)
+        ).all()
+        seen_names = {row.name_key for row in taken}
+        seen_numbers = {row.pokedex_number for row in taken}
+        
+        fresh = []
+        for item in items:
+            name_key = Pokemon.normalize_name(item['name'])
+            if name_key in seen_names or item['pokedex_number'] in seen_numbers:
+                continue
+            seen_names.add(name_key)
+            seen_numbers.add(item['pokedex_number'])
+            fresh.append(item)
+        return fresh
+    
+    def existing_names(self, names: List[str]) -> Set[str]:
+        """Return which of the given (lowercase) names are already stored."""
+        if not names:
+            return set()
+        rows = db.session.query(Pokemon.name_key).filter(
+            Pokemon.name_key.in_(names)
+        ).all()
+        return {row.name_key for row in rows}
+    
+    def _fetch_timed(self, sanitized: str) -> Tuple[Optional[Dict[str, Any]], float]:
+        """Run the fetch stage and return its result with elapsed milliseconds."""
+        started = time.perf_counter()
+        transformed = self._fetch_transformed(sanitized)
+        return transformed, (time.perf_counter() - started) * 1000
     
     def sync_pokemon_list(self, pokemon_names: List[str]) -> Dict[str, Any]:
         """
         Sync multiple Pokemon from PokeAPI.
-
+        
+        Upstream fetches run on a bounded thread pool
+        (POKEAPI_MAX_CONCURRENCY); all database writes happen on the
+        calling thread, so SQLite only ever sees a single writer.
         """
         results = {
             'success': [],
             'failed': [],
             'already_exists': [],
-            'total': len(pokemon_names)
+            'duplicates': [],
+            'total': len(pokemon_names),
+            'timings': {}
         }
         
+        # Sanitize and de-duplicate, keeping the caller's spelling for the response
+        pending = {}
         for name in pokemon_names:
             name = name.strip()
-            
-            if self.get_pokemon_by_name(name):
-                results['already_exists'].append(name)
-                continue
-            
-            pokemon = self.fetch_and_save_pokemon(name)
-            if pokemon:
-                results['success'].append(name)
-            else:
+            sanitized = InputValidator.sanitize_name(name)
+            if not sanitized:
+                logger.warning("invalid name format: %s", name)
                 results['failed'].append(name)
+            elif unknown_pokemon_names.contains(sanitized):
+                results['failed'].append(name)
+            elif sanitized in pending:
+                results['duplicates'].append(name)
+            else:
+                pending[sanitized] = name
+        
+        # One existence query for the whole batch
+        for sanitized in self.existing_names(list(pending)):
+            results['already_exists'].append(pending.pop(sanitized))
+        
+        if not pending:
+            return results
+        
+        # Save on this thread as fetches complete
+        for sanitized, transformed, fetch_ms in self.fetch_many(list(pending)):
+            name = pending[sanitized]
+            started = time.perf_counter()
+            pokemon = self._save_transformed(sanitized, transformed) if transformed else None
+            save_ms = (time.perf_counter() - started) * 1000
+            
+            results['success' if pokemon else 'failed'].append(name)
+            results['timings'][name] = {
+                'fetch_ms': round(fetch_ms, 2),
+                'save_ms': round(save_ms, 2)
+            }
+        
+        return results
+    
+    def fetch_many(self, sanitized_names: List[str]) -> Iterator[Tuple[str, Optional[Dict[str, Any]], float]]:
+        """
+        Fetch, transform and validate many Pokemon on a bounded thread pool.
+        
+        Yields (name, transformed_or_None, fetch_ms) in completion order on
+        the calling thread, which stays the only one touching the database.
+        """
+        if not sanitized_names:
+            return
         
-        return results
\ No newline at end of file
+        workers = max(1, min(self.max_concurrency, len(sanitized_names)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(self._fetch_timed, sanitized): sanitized
+                for sanitized in sanitized_names
+            }
+            for future in as_completed(futures):
+                sanitized = futures[future]
+                try:
+                    transformed, fetch_ms = future.result()
+                except Exception as e:
+                    logger.error("fetch error for %s: %s", sanitized, e)
+                    transformed, fetch_ms = None, 0.0
+                yield sanitized, transformed, fetch_ms
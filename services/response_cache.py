@@ -0,0 +1,135 @@
+"""
+Description: Cache of encoded JSON responses for single-Pokemon reads.
+Author: Bryan Vela
+Created: 2026-10-17
+"""
+import threading
+from typing import Optional, Iterable, Set, Tuple
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+
+from utils.cache import LRUCache
+
+
+class PokemonResponseCache:
+    """
+    Encoded response bodies and their ETags, keyed by Pokemon id and by
+    normalized name.
+
+    Entries are dropped when a commit touches the Pokemon row or any of its
+    stats, abilities or type links (see init_response_cache). A generation
+    counter stops a reader that loaded data before an invalidation from
+    storing the now stale body.
+    """
+
+    def __init__(self, max_entries: int = 2048, ttl: float = 300):
+        self.cache = LRUCache(max_entries=max_entries, ttl=ttl)
+        self.generation = 0
+        self._names_by_id = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def normalize(name: str) -> str:
+        return name.strip().lower()
+
+    def configure(self, max_entries: int, ttl: float):
+        """Resize the cache (drops current entries)."""
+        self.cache = LRUCache(max_entries=max_entries, ttl=ttl)
+        with self._lock:
+            self._names_by_id.clear()
+
+    def get_by_id(self, pokemon_id: int) -> Optional[Tuple[str, bytes]]:
+        """(etag, body) of a cached response, or None."""
+        return self.cache.get(('id', pokemon_id))
+
+    def get_by_name(self, name: str) -> Optional[Tuple[str, bytes]]:
+        return self.cache.get(('name', self.normalize(name)))
+
+    def put(self, pokemon_id: int, name: str, etag: str, body: bytes, generation: int):
+        """
+        Store an (etag, body) pair under both keys.
+
+        Args:
+            generation (int): Value of self.generation read before the DB load;
+                the body is discarded if an invalidation happened since.
+        """
+        key = self.normalize(name)
+        with self._lock:
+            if generation != self.generation:
+                return
+            self._names_by_id[pokemon_id] = key
+            self.cache.set(('id', pokemon_id), (etag, body))
+            self.cache.set(('name', key), (etag, body))
+
+    def invalidate(self, entries: Iterable[Tuple[Optional[int], Optional[str]]]):
+        """Drop cached bodies for (id, name) pairs; either part may be None."""
+        with self._lock:
+            self.generation += 1
+            for pokemon_id, name in entries:
+                if pokemon_id is not None:
+                    self.cache.delete(('id', pokemon_id))
+                    cached_name = self._names_by_id.pop(pokemon_id, None)
+                    if cached_name:
+                        self.cache.delete(('name', cached_name))
+                if name:
+                    self.cache.delete(('name', self.normalize(name)))
+
+    def clear(self):
+        with self._lock:
+            self.generation += 1
+            self._names_by_id.clear()
+            self.cache.clear()
+
+    def stats(self):
+        return self.cache.stats()
+
+
+# Process-wide instance used by the read routes
+pokemon_response_cache = PokemonResponseCache()
+
+
+def _affected_pokemon(obj) -> Set[Tuple[Optional[int], Optional[str]]]:
+    """(id, name) pairs whose cached responses an ORM change invalidates."""
+    affected = set()
+    if getattr(obj, '__tablename__', None) == 'pokemon':
+        affected.add((obj.id, obj.name))
+        # Renames must also drop the old name key
+        for old_name in inspect(obj).attrs.name.history.deleted or ():
+            affected.add((None, old_name))
+    elif getattr(obj, 'pokemon_id', None) is not None:
+        affected.add((obj.pokemon_id, None))
+    return affected
+
+
+def _after_flush(session, flush_context):
+    pending = session.info.setdefault('pokemon_cache_invalidations', set())
+    for obj in list(session.new) + list(session.dirty) + list(session.deleted):
+        pending.update(_affected_pokemon(obj))
+
+
+def _after_commit(session):
+    pending = session.info.pop('pokemon_cache_invalidations', None)
+    if pending:
+        pokemon_response_cache.invalidate(pending)
+
+
+def _after_rollback(session):
+    session.info.pop('pokemon_cache_invalidations', None)
+
+
+_registered = False
+
+
+def init_response_cache(app):
+    """Configure the response cache from app config and hook commit-time invalidation."""
+    global _registered
+    pokemon_response_cache.configure(
+        max_entries=app.config.get('RESPONSE_CACHE_MAX_ENTRIES', 2048),
+        ttl=app.config.get('RESPONSE_CACHE_TTL', 300)
+    )
+    if not _registered:
+        event.listen(Session, 'after_flush', _after_flush)
+        event.listen(Session, 'after_commit', _after_commit)
+        event.listen(Session, 'after_rollback', _after_rollback)
+        _registered = True
@@ -0,0 +1,115 @@
+"""
+Description: Nearest-neighbour "similar Pokemon" search over base-stat vectors.
+Author: Bryan Vela
+Created: 2026-10-17
+"""
+from typing import Optional, Dict, Any, Sequence
+
+import numpy as np
+
+from services.stat_matrix import STAT_NAMES, StatMatrix, stat_matrix
+
+
+def _standardized(matrix: StatMatrix) -> np.ndarray:
+    """Stats z-scored per column, so every stat weighs the same (euclidean)."""
+    stats = matrix.stats.astype(np.float32)
+    std = stats.std(axis=0)
+    features = (stats - stats.mean(axis=0)) / np.where(std > 0, std, 1)
+    return np.ascontiguousarray(features)
+
+
+def _unit_length(matrix: StatMatrix) -> np.ndarray:
+    """Stats scaled to unit length, so only the spread's shape matters (cosine)."""
+    stats = matrix.stats.astype(np.float32)
+    norms = np.linalg.norm(stats, axis=1, keepdims=True)
+    return np.ascontiguousarray(stats / np.where(norms > 0, norms, 1))
+
+
+class SimilarityService:
+    """
+    k-nearest neighbours by base-stat spread.
+
+    Feature matrices are derived once per StatMatrix snapshot; a query for
+    Q Pokemon is a single (Q, N) distance computation followed by a
+    row-wise argpartition.
+    """
+
+    METRICS = ('euclidean', 'cosine')
+
+    def __init__(self, matrix: Optional[StatMatrix] = None):
+        self.matrix = matrix if matrix is not None else stat_matrix.snapshot()
+
+    def _distances(self, rows: np.ndarray, metric: str) -> np.ndarray:
+        """(Q, N) distances from the query rows to every Pokemon."""
+        if metric == 'cosine':
+            features = self.matrix.derived('unit_length', _unit_length)
+            return 1.0 - features[rows] @ features.T
+
+        features = self.matrix.derived('standardized', _standardized)
+        squared = self.matrix.derived('standardized_sq', lambda m: (features ** 2).sum(axis=1))
+        queries = features[rows]
+        distances = squared[rows][:, None] + squared[None, :] - 2.0 * (queries @ features.T)
+        return np.sqrt(np.maximum(distances, 0.0))
+
+    def similar(self, pokemon_ids: Sequence[int], k: int = 10, metric: str = 'euclidean',
+                type_name: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """
+        Nearest neighbours of each query Pokemon (the query itself excluded).
+
+        Args:
+            pokemon_ids (sequence): Query Pokemon ids
+            k (int): Neighbours per query
+            metric (str): 'euclidean' (standardized stats) or 'cosine'
+            type_name (str): Only consider neighbours of this type
+
+        Returns:
+            dict: {'results': {id: [neighbours]}, 'not_found': [ids]},
+                None if type_name is unknown
+        """
+        matrix = self.matrix
+        candidates = np.ones(len(matrix), dtype=bool)
+        if type_name is not None:
+            candidates = matrix.type_mask(type_name)
+            if candidates is None:
+                return None
+
+        positions = matrix.positions(pokemon_ids)
+        found = positions >= 0
+        rows = positions[found]
+        results = {}
+
+        k = min(k, int(candidates.sum()))
+        if len(rows) and k > 0:
+            distances = self._distances(rows, metric)
+            distances[:, ~candidates] = np.inf
+            distances[np.arange(len(rows)), rows] = np.inf
+
+            # Row-wise top-k, then order just those k
+            nearest = np.argpartition(distances, k - 1, axis=1)[:, :k]
+            nearest_distances = np.take_along_axis(distances, nearest, axis=1)
+            order = np.argsort(nearest_distances, axis=1, kind='stable')
+            nearest = np.take_along_axis(nearest, order, axis=1)
+            nearest_distances = np.take_along_axis(nearest_distances, order, axis=1)
+
+            for query_row, neighbour_rows, neighbour_distances in zip(rows, nearest, nearest_distances):
+                results[int(matrix.ids[query_row])] = [
+                    self._entry(row, distance)
+                    for row, distance in zip(neighbour_rows, neighbour_distances)
+                    if np.isfinite(distance)
+                ]
+        else:
+            results = {int(matrix.ids[row]): [] for row in rows}
+
+        return {
+            'results': results,
+            'not_found': [int(pokemon_id) for pokemon_id, ok in zip(pokemon_ids, found) if not ok]
+        }
+
+    def _entry(self, row: int, distance: float) -> Dict[str, Any]:
+        matrix = self.matrix
+        return {
+            'id': int(matrix.ids[row]),
+            'name': matrix.names[row],
+            'distance': round(float(distance), 4),
+            'stats': {stat: int(value) for stat, value in zip(STAT_NAMES, matrix.stats[row])}
+        }
@@ -0,0 +1,244 @@
+"""
+Description: In-memory columnar snapshot of Pokemon stats and types (NumPy).
+Author: Bryan Vela
+Created: 2026-10-17
+"""
+import threading
+from typing import Iterable, List, Optional
+
+import numpy as np
+from sqlalchemy import event, select
+from sqlalchemy.orm import Session
+
+from models.pokemonStatSummary import STAT_COLUMNS
+
+# Matrix column order (PokeAPI stat names)
+STAT_NAMES = tuple(STAT_COLUMNS)
+_STAT_INDEX = {name: column for column, name in enumerate(STAT_NAMES)}
+
+
+class StatMatrix:
+    """
+    Immutable snapshot: one row per Pokemon, ordered by id.
+
+    Attributes:
+        ids (ndarray): int64 (N,) Pokemon ids, ascending
+        names (ndarray): object (N,) Pokemon names
+        stats (ndarray): int16 (N, 6) base stats in STAT_NAMES order
+        total (ndarray): int32 (N,) base-stat totals
+        types (ndarray): bool (N, T) type membership
+        type_ids (ndarray): int64 (T,) pokemon_type.id of each types column
+        type_names (list): Type name of each types column
+    """
+
+    def __init__(self, ids, names, stats, types, type_ids, type_names):
+        self.ids = ids
+        self.names = names
+        self.stats = stats
+        self.types = types
+        self.type_ids = type_ids
+        self.type_names = list(type_names)
+        self.total = stats.sum(axis=1, dtype=np.int32)
+        self._type_columns = {name: column for column, name in enumerate(self.type_names)}
+        self._derived = {}
+        self._derived_lock = threading.Lock()
+
+    def derived(self, key, build):
+        """
+        Memoize an array computed from this snapshot (e.g. normalized stats).
+
+        Snapshots are immutable, so the result stays valid for their lifetime.
+        """
+        value = self._derived.get(key)
+        if value is None:
+            with self._derived_lock:
+                value = self._derived.get(key)
+                if value is None:
+                    value = self._derived[key] = build(self)
+        return value
+
+    def __len__(self):
+        return len(self.ids)
+
+    def type_mask(self, type_name: str) -> Optional[np.ndarray]:
+        """Boolean row mask of Pokemon having a type, None if the type is unknown."""
+        column = self._type_columns.get(type_name.strip().lower())
+        if column is None:
+            return None
+        return self.types[:, column]
+
+    def positions(self, pokemon_ids: Iterable[int]) -> np.ndarray:
+        """Row index of each id, -1 where the id is not in the snapshot."""
+        return self._rows_of(self.ids, np.asarray(list(pokemon_ids), dtype=np.int64))
+
+    @classmethod
+    def load(cls, session, pokemon_ids: Optional[Iterable[int]] = None) -> 'StatMatrix':
+        """
+        Build a snapshot from pokemon, pokemon_stat and pokemon_types.
+
+        Args:
+            session: Session to read with
+            pokemon_ids (iterable): Restrict to these Pokemon, None for all
+        """
+        from models.pokemon import Pokemon
+        from models.pokemonStat import PokemonStat
+        from models.pokemonType import PokemonType
+        from models.pokemontypes import pokemon_types
+
+        pokemon = Pokemon.__table__
+        stat = PokemonStat.__table__
+
+        pokemon_query = select(pokemon.c.id, pokemon.c.name).order_by(pokemon.c.id)
+        stat_query = select(stat.c.pokemon_id, stat.c.name, stat.c.value)
+        type_query = select(pokemon_types.c.pokemon_id, pokemon_types.c.type_id)
+        if pokemon_ids is not None:
+            pokemon_ids = list(pokemon_ids)
+            pokemon_query = pokemon_query.where(pokemon.c.id.in_(pokemon_ids))
+            stat_query = stat_query.where(stat.c.pokemon_id.in_(pokemon_ids))
+            type_query = type_query.where(pokemon_types.c.pokemon_id.in_(pokemon_ids))
+
+        rows = session.execute(pokemon_query).all()
+        ids = np.array([row.id for row in rows], dtype=np.int64)
+        names = np.array([row.name for row in rows], dtype=object)
+
+        type_rows = session.execute(
+            select(PokemonType.id, PokemonType.name).order_by(PokemonType.id)
+        ).all()
+        type_ids = np.array([row.id for row in type_rows], dtype=np.int64)
+        type_names = [row.name.lower() for row in type_rows]
+
+        stats = np.zeros((len(ids), len(STAT_NAMES)), dtype=np.int16)
+        stat_rows = session.execute(stat_query).all()
+        if stat_rows and len(ids):
+            owners = np.array([row.pokemon_id for row in stat_rows], dtype=np.int64)
+            columns = np.array([_STAT_INDEX.get(row.name, -1) for row in stat_rows], dtype=np.int64)
+            values = np.array([row.value for row in stat_rows], dtype=np.int16)
+            rows_at = cls._rows_of(ids, owners)
+            keep = (rows_at >= 0) & (columns >= 0)
+            stats[rows_at[keep], columns[keep]] = values[keep]
+
+        types = np.zeros((len(ids), len(type_ids)), dtype=bool)
+        link_rows = session.execute(type_query).all()
+        if link_rows and len(ids) and len(type_ids):
+            owners = np.array([row.pokemon_id for row in link_rows], dtype=np.int64)
+            linked = np.array([row.type_id for row in link_rows], dtype=np.int64)
+            rows_at = cls._rows_of(ids, owners)
+            columns = cls._rows_of(type_ids, linked)
+            keep = (rows_at >= 0) & (columns >= 0)
+            types[rows_at[keep], columns[keep]] = True
+
+        return cls(ids, names, stats, types, type_ids, type_names)
+
+    @staticmethod
+    def _rows_of(sorted_keys: np.ndarray, keys: np.ndarray) -> np.ndarray:
+        """Index of each key in sorted_keys, -1 where missing."""
+        if not len(sorted_keys):
+            return np.full(len(keys), -1, dtype=np.int64)
+        rows = np.searchsorted(sorted_keys, keys)
+        rows = np.minimum(rows, len(sorted_keys) - 1)
+        return np.where(sorted_keys[rows] == keys, rows, -1)
+
+    def merge(self, update: 'StatMatrix', changed: Iterable[int]) -> 'StatMatrix':
+        """
+        New snapshot with the changed ids replaced by the rows in update.
+
+        Ids in changed but absent from update (deleted Pokemon) are dropped.
+        update must be loaded after self, so its type columns are a superset.
+        """
+        changed = np.fromiter(changed, dtype=np.int64)
+        keep = ~np.isin(self.ids, changed)
+
+        # Re-home the kept type columns onto the (possibly wider) new type set
+        types = np.zeros((int(keep.sum()), len(update.type_ids)), dtype=bool)
+        if len(self.type_ids) and len(update.type_ids):
+            columns = self._rows_of(update.type_ids, self.type_ids)
+            present = columns >= 0
+            types[:, columns[present]] = self.types[keep][:, present]
+
+        ids = np.concatenate([self.ids[keep], update.ids])
+        order = np.argsort(ids, kind='stable')
+        return StatMatrix(
+            ids[order],
+            np.concatenate([self.names[keep], update.names])[order],
+            np.concatenate([self.stats[keep], update.stats])[order],
+            np.concatenate([types, update.types])[order],
+            update.type_ids,
+            update.type_names
+        )
+
+
+class StatMatrixStore:
+    """
+    Holds the current StatMatrix and applies committed writes lazily.
+
+    Commits only record which Pokemon changed; the next reader reloads just
+    those rows and merges them into a new snapshot. Snapshots are never
+    mutated, so readers holding an older one are unaffected.
+    """
+
+    def __init__(self):
+        self._snapshot = None
+        self._pending = set()
+        self._lock = threading.Lock()
+
+    def snapshot(self) -> StatMatrix:
+        """Current snapshot, built or brought up to date on demand."""
+        from utils.db import db
+
+        with self._lock:
+            if self._snapshot is None:
+                self._snapshot = StatMatrix.load(db.session)
+                self._pending.clear()
+            elif self._pending:
+                changed, self._pending = self._pending, set()
+                self._snapshot = self._snapshot.merge(StatMatrix.load(db.session, changed), changed)
+            return self._snapshot
+
+    def invalidate(self, pokemon_ids: Iterable[int]):
+        """Mark Pokemon as changed (applied on the next snapshot call)."""
+        with self._lock:
+            self._pending.update(pokemon_ids)
+
+    def reset(self):
+        """Drop the snapshot (next call rebuilds it from scratch)."""
+        with self._lock:
+            self._snapshot = None
+            self._pending.clear()
+
+
+# Process-wide instance
+stat_matrix = StatMatrixStore()
+
+
+def record_changed(session, pokemon_ids: List[int]):
+    """Queue Pokemon written outside the ORM to be refreshed when session commits."""
+    session.info.setdefault('stat_matrix_changed', set()).update(pokemon_ids)
+
+
+@event.listens_for(Session, 'after_flush')
+def _track_orm_changes(session, flush_context):
+    """Queue Pokemon whose row, stats or type links changed through the ORM."""
+    changed = session.info.setdefault('stat_matrix_changed', set())
+    for obj in list(session.new) + list(session.dirty) + list(session.deleted):
+        table = getattr(getattr(obj, '__table__', None), 'name', None)
+        if table == 'pokemon':
+            changed.add(obj.id)
+        elif table in ('pokemon_stat', 'pokemon_types') and obj.pokemon_id is not None:
+            changed.add(obj.pokemon_id)
+
+
+@event.listens_for(Session, 'after_commit')
+def _publish(session):
+    changed = session.info.pop('stat_matrix_changed', None)
+    if changed:
+        stat_matrix.invalidate(changed)
+
+
+@event.listens_for(Session, 'after_rollback')
+def _discard(session):
+    session.info.pop('stat_matrix_changed', None)
+
+
+def init_stat_matrix(app):
+    """Start each app from an empty store; the snapshot is built on first use."""
+    stat_matrix.reset()
@@ -0,0 +1,160 @@
+"""
+Description: Team type-coverage analysis on the type-effectiveness matrix.
+Author: Bryan Vela
+Created: 2026-10-17
+"""
+from typing import Optional, Dict, Any, List, Sequence
+
+import numpy as np
+
+from services.stat_matrix import StatMatrix, stat_matrix
+from services.type_chart import TYPE_NAMES, TYPE_INDEX, TypeChart
+
+# Immunities count as this log2 multiplier when scoring matchups
+IMMUNE_LOG2 = -3.0
+
+
+def _type_indicators(matrix: StatMatrix) -> np.ndarray:
+    """(N, 18) type indicator rows in TypeChart order."""
+    projection = np.zeros((len(matrix.type_names), len(TYPE_NAMES)), dtype=np.float32)
+    for column, name in enumerate(matrix.type_names):
+        if name in TYPE_INDEX:
+            projection[column, TYPE_INDEX[name]] = 1.0
+    return matrix.types.astype(np.float32) @ projection
+
+
+class TeamCoverageService:
+    """
+    Defensive weaknesses and offensive coverage of a team of up to 6.
+
+    Dual-type multipliers come from the chart's log-space matrix product,
+    and the bulk mode scores every stored Pokemon against the team with
+    the same products over the full (N, 18) indicator matrix.
+    """
+
+    MAX_TEAM_SIZE = 6
+
+    def __init__(self, chart: TypeChart, matrix: Optional[StatMatrix] = None):
+        self.chart = chart
+        self.matrix = matrix if matrix is not None else stat_matrix.snapshot()
+        self.indicators = self.matrix.derived('type_indicators', _type_indicators)
+
+    def coverage(self, pokemon_ids: Sequence[int], bulk: bool = False, limit: int = 20) -> Dict[str, Any]:
+        """
+        Analyse a team.
+
+        Args:
+            pokemon_ids (sequence): Team member ids (at most MAX_TEAM_SIZE)
+            bulk (bool): Also score every stored Pokemon against the team
+            limit (int): Threats listed in bulk mode
+
+        Returns:
+            dict: team, defensive, weaknesses, offensive, not_found (+ matchups)
+        """
+        positions = self.matrix.positions(pokemon_ids)
+        rows = positions[positions >= 0]
+        not_found = [int(pokemon_id) for pokemon_id, row in zip(pokemon_ids, positions) if row < 0]
+
+        team = self.indicators[rows]                       # (M, 18)
+        taken = self.chart.defensive(team)                 # (M, 18) [member, attacking type]
+        attack_types = team.any(axis=0)                    # STAB types the team can use
+
+        result = {
+            'team': [self._member(row) for row in rows],
+            'defensive': self._defensive(rows, taken),
+            'weaknesses': self._weaknesses(taken),
+            'offensive': self._offensive(attack_types),
+            'not_found': not_found
+        }
+        if bulk:
+            result['matchups'] = self._matchups(rows, taken, attack_types, limit)
+        return result
+
+    def _member(self, row: int) -> Dict[str, Any]:
+        return {
+            'id': int(self.matrix.ids[row]),
+            'name': self.matrix.names[row],
+            'types': self._types_of(row)
+        }
+
+    def _types_of(self, row: int) -> List[str]:
+        return [TYPE_NAMES[index] for index in np.flatnonzero(self.indicators[row])]
+
+    def _defensive(self, rows: np.ndarray, taken: np.ndarray) -> Dict[str, Dict[str, Any]]:
+        """Per attacking type: member multipliers and weak/resist/immune counts."""
+        weak = (taken > 1).sum(axis=0)
+        resist = ((taken < 1) & (taken > 0)).sum(axis=0)
+        immune = (taken == 0).sum(axis=0)
+        ids = [str(int(self.matrix.ids[row])) for row in rows]
+        return {
+            name: {
+                'weak': int(weak[index]),
+                'resist': int(resist[index]),
+                'immune': int(immune[index]),
+                'multipliers': {pokemon_id: float(taken[member, index]) for member, pokemon_id in enumerate(ids)}
+            }
+            for index, name in enumerate(TYPE_NAMES)
+        }
+
+    @staticmethod
+    def _weaknesses(taken: np.ndarray) -> List[str]:
+        """Attacking types more members are weak to than resist or are immune to."""
+        weak = (taken > 1).sum(axis=0)
+        covered = (taken < 1).sum(axis=0)
+        shared = np.flatnonzero(weak > covered)
+        return [TYPE_NAMES[index] for index in shared[np.argsort(-weak[shared], kind='stable')]]
+
+    def _offensive(self, attack_types: np.ndarray) -> Dict[str, Any]:
+        """Best STAB multiplier against each single defending type."""
+        if attack_types.any():
+            best = self.chart.multipliers[attack_types].max(axis=0)
+        else:
+            best = np.ones(len(TYPE_NAMES), dtype=np.float32)
+        return {
+            'best_multiplier': {name: float(best[index]) for index, name in enumerate(TYPE_NAMES)},
+            'super_effective': [name for index, name in enumerate(TYPE_NAMES) if best[index] > 1],
+            'not_very_effective': [name for index, name in enumerate(TYPE_NAMES) if best[index] < 1]
+        }
+
+    def _matchups(self, rows: np.ndarray, taken: np.ndarray, attack_types: np.ndarray,
+                  limit: int) -> Dict[str, Any]:
+        """
+        Score every stored Pokemon against the team in one pass.
+
+        offense: best multiplier the team's STAB types deal to it.
+        threat: best multiplier its own types deal to any team member.
+        advantage: log2(offense) - log2(threat); most negative = biggest threat.
+        """
+        everyone = self.matrix.derived(('defensive', id(self.chart)), lambda m: self.chart.defensive(self.indicators))
+        if attack_types.any():
+            offense = everyone[:, attack_types].max(axis=1)
+        else:
+            offense = np.ones(len(everyone), dtype=np.float32)
+
+        best_against_team = taken.max(axis=0) if len(taken) else np.zeros(len(TYPE_NAMES), dtype=np.float32)
+        threat = np.where(self.indicators > 0, best_against_team[None, :], 0.0).max(axis=1)
+
+        with np.errstate(divide='ignore'):
+            advantage = (
+                np.maximum(np.log2(offense), IMMUNE_LOG2)
+                - np.maximum(np.log2(threat), IMMUNE_LOG2)
+            )
+
+        candidates = np.setdiff1d(np.arange(len(self.matrix)), rows)
+        ranked = candidates[np.lexsort((self.matrix.ids[candidates], -threat[candidates], advantage[candidates]))]
+        return {
+            'pokemon': int(len(candidates)),
+            'hit_super_effectively': int((offense[candidates] > 1).sum()),
+            'threatening': int((threat[candidates] > 1).sum()),
+            'threats': [
+                {
+                    'id': int(self.matrix.ids[row]),
+                    'name': self.matrix.names[row],
+                    'types': self._types_of(row),
+                    'team_best_multiplier': float(offense[row]),
+                    'best_multiplier_against_team': float(threat[row]),
+                    'advantage': float(advantage[row])
+                }
+                for row in ranked[:limit]
+            ]
+        }
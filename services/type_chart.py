@@ -0,0 +1,124 @@
+"""
+Description: Precomputed 18x18 type-effectiveness matrix.
+Author: Bryan Vela
+Created: 2026-10-17
+"""
+import json
+import os
+import threading
+from typing import Dict, Any
+
+import numpy as np
+
+# Bundled dump in PokeAPI /type/<name> shape (damage_relations only)
+BUNDLED_TYPE_CHART = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data', 'type_chart.json')
+
+# Matrix axis order
+TYPE_NAMES = (
+    'normal', 'fire', 'water', 'electric', 'grass', 'ice', 'fighting', 'poison', 'ground',
+    'flying', 'psychic', 'bug', 'rock', 'ghost', 'dragon', 'dark', 'steel', 'fairy'
+)
+TYPE_INDEX = {name: index for index, name in enumerate(TYPE_NAMES)}
+
+_RELATION_MULTIPLIERS = {
+    'double_damage_to': 2.0,
+    'half_damage_to': 0.5,
+    'no_damage_to': 0.0
+}
+
+
+class TypeChart:
+    """
+    Attack-type x defend-type damage multipliers.
+
+    Besides the raw matrix, dual-type matchups are precomputed as log2
+    multipliers plus an immunity matrix, so a Pokemon's multiplier against
+    every attacking type is one matrix product over its type indicator row
+    (a sum of logs) instead of a product in nested loops.
+    """
+
+    def __init__(self, multipliers: np.ndarray):
+        self.multipliers = multipliers.astype(np.float32)
+        immune = self.multipliers == 0
+        self.log_multipliers = np.where(immune, 0.0, np.log2(np.where(immune, 1.0, self.multipliers))).astype(np.float32)
+        self.immunities = immune.astype(np.float32)
+
+    @classmethod
+    def from_relations(cls, relations: Dict[str, Any]) -> 'TypeChart':
+        """
+        Build from {type_name: PokeAPI /type/<name> payload}.
+
+        Only the *_damage_to lists are read; the *_damage_from lists are
+        their transpose.
+        """
+        multipliers = np.ones((len(TYPE_NAMES), len(TYPE_NAMES)), dtype=np.float32)
+        for attacker, payload in relations.items():
+            row = TYPE_INDEX.get(attacker)
+            if row is None:
+                continue
+            damage_relations = payload.get('damage_relations', {})
+            for relation, multiplier in _RELATION_MULTIPLIERS.items():
+                for target in damage_relations.get(relation, []):
+                    column = TYPE_INDEX.get(target['name'])
+                    if column is not None:
+                        multipliers[row, column] = multiplier
+        return cls(multipliers)
+
+    @classmethod
+    def from_file(cls, path: str) -> 'TypeChart':
+        with open(path, 'r', encoding='utf-8') as handle:
+            return cls.from_relations(json.load(handle))
+
+    def indicator(self, type_names) -> np.ndarray:
+        """(18,) 0/1 row for a list of type names (unknown names ignored)."""
+        row = np.zeros(len(TYPE_NAMES), dtype=np.float32)
+        for name in type_names:
+            index = TYPE_INDEX.get(name)
+            if index is not None:
+                row[index] = 1.0
+        return row
+
+    def defensive(self, indicators: np.ndarray) -> np.ndarray:
+        """
+        Damage multiplier of every attacking type against each defender.
+
+        Args:
+            indicators (ndarray): (N, 18) type indicator rows
+
+        Returns:
+            ndarray: (N, 18) multipliers, [defender, attacking type]
+        """
+        log_multiplier = indicators @ self.log_multipliers.T
+        immune = (indicators @ self.immunities.T) > 0
+        return np.where(immune, 0.0, np.exp2(log_multiplier)).astype(np.float32)
+
+
+_chart = None
+_chart_path = None
+_lock = threading.Lock()
+
+
+def resolve_type_chart_path(config, instance_path: str = '') -> str:
+    """Configured TYPE_CHART_PATH (relative to the instance folder) or the bundled dump."""
+    path = config.get('TYPE_CHART_PATH') or ''
+    if path and not os.path.isabs(path):
+        path = os.path.join(instance_path, path)
+    return path if path and os.path.exists(path) else BUNDLED_TYPE_CHART
+
+
+def get_type_chart(config, instance_path: str = '') -> TypeChart:
+    """Process-wide TypeChart, loaded once per resolved file."""
+    global _chart, _chart_path
+    path = resolve_type_chart_path(config, instance_path)
+    if _chart is None or _chart_path != path:
+        with _lock:
+            if _chart is None or _chart_path != path:
+                _chart, _chart_path = TypeChart.from_file(path), path
+    return _chart
+
+
+def reset_type_chart():
+    """Forget the loaded chart (next call reloads from disk)."""
+    global _chart, _chart_path
+    with _lock:
+        _chart, _chart_path = None, None
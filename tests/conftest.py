@@ -0,0 +1,59 @@
+"""
+Description: Shared fixtures - an app on a temporary SQLite database.
+Author: Bryan Vela
+Created: 2026-10-17
+"""
+import pytest
+from sqlalchemy import event
+
+from app import create_app
+from config.config import Config
+from utils.db import db
+
+
+@pytest.fixture
+def config_overrides():
+    """Config values a test module needs on top of TestConfig (override the fixture)."""
+    return {}
+
+
+@pytest.fixture
+def test_config(tmp_path, config_overrides):
+    """Config class for an app on tmp_path/test.db (create_app(test_config) restarts it)."""
+    class TestConfig(Config):
+        TESTING = True
+        SQLALCHEMY_DATABASE_URI = f"sqlite:///{tmp_path / 'test.db'}"
+        POKEAPI_BASE_URL = 'http://127.0.0.1:9'
+        POKEAPI_CACHE_PATH = ''
+        POKEAPI_MAX_RETRIES = 0
+        LOG_LEVEL = 'WARNING'
+        SLOW_REQUEST_MS = 0
+
+    for key, value in config_overrides.items():
+        setattr(TestConfig, key, value)
+    return TestConfig
+
+
+@pytest.fixture
+def app(test_config):
+    app = create_app(test_config)
+    with app.app_context():
+        yield app
+        db.session.remove()
+        for engine in db.engines.values():
+            engine.dispose()
+
+
+@pytest.fixture
+def statements(app):
+    """(statement, parameters) of every SQL statement executed on any engine, in order."""
+    executed = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        executed.append((statement, parameters))
+
+    for engine in db.engines.values():
+        event.listen(engine, 'before_cursor_execute', record)
+    yield executed
+    for engine in db.engines.values():
+        event.remove(engine, 'before_cursor_execute', record)
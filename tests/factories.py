@@ -0,0 +1,26 @@
+"""
+Description: Test data builders.
+Author: Bryan Vela
+Created: 2026-10-17
+"""
+
+
+def make_pokemon(number, types=('fire', 'flying')):
+    """Transformed Pokemon dict (same shape as PokeAPITransformer output)."""
+    return {
+        'name': f'mon-{number}',
+        'pokedex_number': number,
+        'height': number % 30 + 1,
+        'weight': number % 900 + 1,
+        'sprite_front_default': None,
+        'sprite_front_shiny': None,
+        'types': [{'name': name, 'slot': slot} for slot, name in enumerate(types, start=1)],
+        'stats': [
+            {'name': stat, 'value': number + i}
+            for i, stat in enumerate(['hp', 'attack', 'defense', 'special-attack', 'special-defense', 'speed'])
+        ],
+        'abilities': [
+            {'name': 'blaze', 'is_hidden': False, 'slot': 1},
+            {'name': 'solar-power', 'is_hidden': True, 'slot': 3}
+        ]
+    }
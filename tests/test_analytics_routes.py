@@ -0,0 +1,14 @@
+"""
+Description: Query parameter validation of the stat analytics endpoints.
+Author: Bryan Vela
+Created: 2026-10-17
+"""
+import pytest
+
+
+@pytest.mark.parametrize('p', ['nan', 'inf', '-inf', '50,nan', '-1', '101', 'x'])
+def test_percentiles_rejects_invalid_p(app, p):
+    response = app.test_client().get(f'/api/pokemon/analytics/percentiles?p={p}')
+
+    assert response.status_code == 400
+    assert response.get_json()['success'] is False
@@ -0,0 +1,103 @@
+"""
+Description: ETags, 304 Not Modified and gzip on the list and single-Pokemon routes.
+Author: Bryan Vela
+Created: 2026-10-17
+"""
+import gzip
+
+import pytest
+
+from models.pokemonStat import PokemonStat
+from services.pokemon_service import PokemonService
+from services.response_cache import pokemon_response_cache
+from tests.factories import make_pokemon
+from utils.db import db
+
+
+@pytest.fixture
+def client(app):
+    PokemonService().save_pokemon_batch([make_pokemon(n) for n in range(1, 11)])
+    db.session.remove()
+    pokemon_response_cache.clear()
+    return app.test_client()
+
+
+@pytest.mark.parametrize('path', ['/api/pokemon/3', '/api/pokemon/name/MON-3'])
+def test_single_304_reads_no_document(client, statements, path):
+    etag = client.get(path).headers['ETag']
+    pokemon_response_cache.clear()
+    db.session.remove()
+    before = len(statements)
+
+    response = client.get(path, headers={'If-None-Match': etag})
+
+    assert response.status_code == 304
+    assert response.get_data() == b''
+    executed = [sql for sql, _ in statements[before:]]
+    assert len(executed) == 1
+    assert 'document' not in executed[0]
+
+
+def test_single_304_from_response_cache(client, statements):
+    etag = client.get('/api/pokemon/3').headers['ETag']
+    before = len(statements)
+
+    assert client.get('/api/pokemon/3', headers={'If-None-Match': etag}).status_code == 304
+    assert len(statements) == before
+
+
+def test_single_etag_changes_with_stats(client):
+    etag = client.get('/api/pokemon/3').headers['ETag']
+
+    stat = PokemonStat.query.filter_by(pokemon_id=3, name='speed').one()
+    stat.value = 150
+    db.session.commit()
+    db.session.remove()
+
+    response = client.get('/api/pokemon/3', headers={'If-None-Match': etag})
+    assert response.status_code == 200
+    assert response.headers['ETag'] != etag
+    assert response.get_json()['data']['stats']['speed'] == 150
+
+
+def test_list_304_runs_only_the_version_query(client, statements):
+    etag = client.get('/api/pokemon/?limit=5').headers['ETag']
+    db.session.remove()
+    before = len(statements)
+
+    response = client.get('/api/pokemon/?limit=5', headers={'If-None-Match': etag})
+
+    assert response.status_code == 304
+    executed = [sql for sql, _ in statements[before:]]
+    assert len(executed) == 1
+    assert 'count(' in executed[0] and 'max(' in executed[0]
+
+
+def test_list_etag_depends_on_page_and_data(client):
+    etag = client.get('/api/pokemon/?limit=5').headers['ETag']
+
+    assert client.get('/api/pokemon/?limit=6', headers={'If-None-Match': etag}).status_code == 200
+
+    PokemonService().save_pokemon_batch([make_pokemon(11)])
+    db.session.remove()
+    assert client.get('/api/pokemon/?limit=5', headers={'If-None-Match': etag}).status_code == 200
+
+
+def test_large_responses_are_gzipped(client):
+    plain = client.get('/api/pokemon/?limit=10')
+    response = client.get('/api/pokemon/?limit=10', headers={'Accept-Encoding': 'gzip'})
+
+    assert response.headers['Content-Encoding'] == 'gzip'
+    assert 'Accept-Encoding' in response.headers['Vary']
+    assert gzip.decompress(response.get_data()) == plain.get_data()
+    assert response.headers['ETag'] == plain.headers['ETag'][:-1] + '-gzip"'
+
+    conditional = client.get('/api/pokemon/?limit=10', headers={'If-None-Match': response.headers['ETag']})
+    assert conditional.status_code == 304
+
+
+def test_small_responses_are_not_gzipped(client):
+    response = client.get('/api/pokemon/3', headers={'Accept-Encoding': 'gzip'})
+
+    assert len(response.get_data()) < 1024
+    assert 'Content-Encoding' not in response.headers
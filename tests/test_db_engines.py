@@ -0,0 +1,122 @@
+"""
+Description: SQLite engine setup - read routing and write serialization across connections.
+Author: Bryan Vela
+Created: 2026-10-17
+"""
+import sqlite3
+
+import pytest
+from sqlalchemy import event, select, text
+from sqlalchemy.exc import OperationalError
+
+from models.pokemon import Pokemon
+from services.pokemon_service import PokemonService
+from services.response_cache import pokemon_response_cache
+from tests.factories import make_pokemon
+from utils.db import db
+
+
+@pytest.fixture
+def config_overrides():
+    return {'SQLITE_BUSY_TIMEOUT': '200'}
+
+
+@pytest.fixture
+def engine_log(app):
+    """'reader' or 'writer' for every statement executed, in order."""
+    executed = []
+    listeners = []
+    for name, engine in (('writer', db.engine), ('reader', db.engines['reader'])):
+        def record(*args, name=name):
+            executed.append(name)
+        event.listen(engine, 'before_cursor_execute', record)
+        listeners.append((engine, record))
+    yield executed
+    for engine, record in listeners:
+        event.remove(engine, 'before_cursor_execute', record)
+
+
+def other_process_writer():
+    """A plain sqlite3 connection to the same file, standing in for another process."""
+    path = db.engine.url.database
+    return sqlite3.connect(path, isolation_level=None)
+
+
+def test_writer_connections_begin_immediate(app):
+    with db.engine.connect() as conn:
+        assert conn.connection.dbapi_connection.isolation_level == 'IMMEDIATE'
+
+
+def test_write_waits_for_another_process_then_raises(app):
+    other = other_process_writer()
+    other.execute('BEGIN IMMEDIATE')
+    try:
+        with pytest.raises(OperationalError, match='database is locked'):
+            PokemonService().save_pokemon_batch([make_pokemon(1)])
+        db.session.rollback()
+    finally:
+        other.execute('ROLLBACK')
+        other.close()
+
+    assert PokemonService().save_pokemon_batch([make_pokemon(1)]) == {'mon-1': 1}
+
+
+def test_reads_are_not_blocked_by_another_writer(app):
+    PokemonService().save_pokemon_batch([make_pokemon(1)])
+    db.session.remove()
+
+    other = other_process_writer()
+    other.execute('BEGIN IMMEDIATE')
+    other.execute("UPDATE pokemon SET height = 99 WHERE id = 1")
+    try:
+        response = app.test_client().get('/api/pokemon/1')
+        assert response.status_code == 200
+        assert response.get_json()['data']['height'] != 99
+    finally:
+        other.execute('ROLLBACK')
+        other.close()
+
+
+def test_get_requests_read_from_the_reader(app, engine_log):
+    PokemonService().save_pokemon_batch([make_pokemon(1)])
+    db.session.remove()
+    pokemon_response_cache.clear()
+    engine_log.clear()
+
+    assert app.test_client().get('/api/pokemon/1').status_code == 200
+    assert app.test_client().get('/api/pokemon/?limit=10').status_code == 200
+
+    assert engine_log and set(engine_log) == {'reader'}
+
+
+def test_writes_in_a_get_request_go_to_the_writer(app, engine_log):
+    PokemonService().save_pokemon_batch([make_pokemon(1)])
+    db.session.remove()
+    engine_log.clear()
+
+    with app.test_request_context('/api/pokemon/1', method='GET'):
+        pokemon = db.session.get(Pokemon, 1)
+        assert engine_log == ['reader']
+
+        pokemon.height = 42
+        db.session.flush()
+        assert engine_log[-1] == 'writer'
+
+        # Later reads in the transaction see its own uncommitted rows
+        engine_log.clear()
+        assert db.session.execute(select(Pokemon.height).where(Pokemon.id == 1)).scalar() == 42
+        assert engine_log == ['writer']
+        db.session.rollback()
+
+
+def test_non_get_requests_read_from_the_writer(app, engine_log):
+    with app.test_request_context('/api/pokemon/similar', method='POST'):
+        db.session.execute(select(Pokemon.id)).all()
+
+    assert engine_log == ['writer']
+
+
+def test_reader_rejects_writes(app):
+    with db.engines['reader'].connect() as conn:
+        with pytest.raises(OperationalError, match='readonly'):
+            conn.execute(text("INSERT INTO pokemon_type (name) VALUES ('ghost')"))
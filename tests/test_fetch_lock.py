@@ -0,0 +1,39 @@
+"""
+Description: Cross-process fetch lock rows.
+Author: Bryan Vela
+Created: 2026-10-17
+"""
+from models.fetchLock import FetchLock
+from models.importCheckpoint import ImportCheckpoint
+from utils.db import db
+
+
+def test_second_acquire_fails_until_release(app):
+    owner = FetchLock.acquire('pikachu', ttl=60)
+
+    assert owner is not None
+    assert FetchLock.is_held('pikachu')
+    assert FetchLock.acquire('pikachu', ttl=60) is None
+
+    FetchLock.release('pikachu', owner)
+    assert not FetchLock.is_held('pikachu')
+
+
+def test_expired_lock_is_taken_over(app):
+    FetchLock.acquire('pikachu', ttl=-1)
+
+    assert FetchLock.acquire('pikachu', ttl=60) is not None
+
+
+def test_hold_leaves_the_callers_session_alone(app):
+    pending = ImportCheckpoint(name='unrelated', next_offset=0, imported=0, failed=0)
+    db.session.add(pending)
+
+    with FetchLock.hold('pikachu') as held:
+        assert held
+    with FetchLock.hold('pikachu', wait=0):
+        pass
+
+    assert pending in db.session.new
+    db.session.rollback()
+    assert ImportCheckpoint.query.filter_by(name='unrelated').first() is None
@@ -0,0 +1,23 @@
+"""
+Description: Request body validation of the batch fetch endpoint.
+Author: Bryan Vela
+Created: 2026-10-17
+"""
+import pytest
+
+
+@pytest.mark.parametrize('body', [['pikachu'], 'pikachu', {}, {'pokemon': 'pikachu'}, {'pokemon': []}, {'pokemon': [1]}])
+def test_fetch_batch_rejects_invalid_bodies(app, body):
+    response = app.test_client().post('/api/pokemon/fetch/batch', json=body)
+
+    assert response.status_code == 400
+    assert response.get_json()['success'] is False
+
+
+def test_fetch_batch_rejects_malformed_json(app):
+    response = app.test_client().post(
+        '/api/pokemon/fetch/batch', data='{"pokemon": [', content_type='application/json'
+    )
+
+    assert response.status_code == 400
+    assert response.get_json()['success'] is False
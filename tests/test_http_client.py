@@ -0,0 +1,52 @@
+"""
+Description: The pooled PokeAPI client reuses keep-alive connections.
+Author: Bryan Vela
+Created: 2026-10-17
+"""
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from services.http_client import PooledHTTPClient
+
+
+class _OkHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'  # keep-alive
+
+    def do_GET(self):
+        body = b'{"ok":true}'
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def stub_server():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _OkHandler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    host, port = server.server_address[:2]
+    yield f'http://{host}:{port}'
+    server.shutdown()
+    server.server_close()
+
+
+def test_sequential_requests_reuse_one_connection(stub_server):
+    client = PooledHTTPClient(pool_size=2, max_retries=0)
+
+    for number in range(5):
+        response = client.get(f'{stub_server}/pokemon/{number}', timeout=5)
+        assert response.status_code == 200
+        assert response.json() == {'ok': True}
+
+    stats = client.stats()
+    assert stats['requests'] == 5
+    assert stats['connections_opened'] == 1
+    assert stats['connections_reused'] > 0
@@ -0,0 +1,36 @@
+"""
+Description: Bulk import chunk accounting.
+Author: Bryan Vela
+Created: 2026-10-17
+"""
+from services.import_service import BulkImportService
+from tests.factories import make_pokemon
+
+
+def test_rows_left_out_by_batch_save_count_as_skipped(app, monkeypatch):
+    service = BulkImportService()
+    service.pokemon_service.save_pokemon_batch([make_pokemon(1)])
+
+    def fetch_many(names):
+        for name in names:
+            number = int(name.rsplit('-', 1)[1])
+            yield name, make_pokemon(number), 0.0
+
+    monkeypatch.setattr(service.pokemon_service, 'fetch_many', fetch_many)
+
+    # mon-1 is stored, mon-2 appears twice, 'bad name!' does not sanitize
+    entries = [{'name': 'mon-1'}, {'name': 'mon-2'}, {'name': 'mon-2'}, {'name': 'bad name!'}]
+    imported, skipped, failed = service._import_chunk(entries)
+
+    assert (imported, skipped, failed) == (1, 2, 1)
+
+
+def test_every_entry_is_counted_once(app, monkeypatch):
+    service = BulkImportService()
+    service.pokemon_service.save_pokemon_batch([make_pokemon(1)])
+    monkeypatch.setattr(service.pokemon_service, 'fetch_many', lambda names: iter(()))
+
+    # mon-1 is stored and listed twice
+    imported, skipped, failed = service._import_chunk([{'name': 'mon-1'}, {'name': 'mon-1'}])
+
+    assert (imported, skipped, failed) == (0, 2, 0)
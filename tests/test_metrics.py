@@ -0,0 +1,102 @@
+"""
+Description: /metrics exposition and the Server-Timing header.
+Author: Bryan Vela
+Created: 2026-10-17
+"""
+from services.pokemon_service import PokemonService
+from services.response_cache import pokemon_response_cache
+from tests.factories import make_pokemon
+from utils.db import db
+from utils.metrics import Histogram
+
+SINGLE_ROUTE = 'route="/api/pokemon/<int:pokemon_id>"'
+
+
+def scrape(client):
+    response = client.get('/metrics')
+    assert response.status_code == 200
+    assert response.mimetype == 'text/plain'
+    return response.get_data(as_text=True)
+
+
+def sample(text, name, *labels):
+    """Value of the first sample of name whose labels contain every label, else 0."""
+    for line in text.splitlines():
+        series, _, value = line.rpartition(' ')
+        if series.split('{')[0] == name and all(label in series for label in labels):
+            return float(value)
+    return 0.0
+
+
+def seed_one(app):
+    PokemonService().save_pokemon_batch([make_pokemon(1)])
+    db.session.remove()
+    pokemon_response_cache.clear()
+    return app.test_client()
+
+
+def test_requests_are_counted_by_route_and_status(app):
+    client = seed_one(app)
+    before = scrape(client)
+
+    assert client.get('/api/pokemon/1').status_code == 200
+    assert client.get('/api/pokemon/999').status_code == 404
+    after = scrape(client)
+
+    for status in ('200', '404'):
+        labels = ('method="GET"', SINGLE_ROUTE, f'status="{status}"')
+        assert sample(after, 'pokescouter_request_duration_seconds_count', *labels) == \
+            sample(before, 'pokescouter_request_duration_seconds_count', *labels) + 1
+    assert sample(after, 'pokescouter_request_sql_queries_count', SINGLE_ROUTE) == \
+        sample(before, 'pokescouter_request_sql_queries_count', SINGLE_ROUTE) + 2
+
+
+def test_response_cache_hits_and_misses_are_exported(app):
+    client = seed_one(app)
+    before = scrape(client)
+
+    client.get('/api/pokemon/1')  # miss, then cached
+    client.get('/api/pokemon/1')  # hit
+    after = scrape(client)
+
+    cache = 'cache="response"'
+    assert sample(after, 'pokescouter_cache_hits_total', cache) == sample(before, 'pokescouter_cache_hits_total', cache) + 1
+    assert sample(after, 'pokescouter_cache_misses_total', cache) >= sample(before, 'pokescouter_cache_misses_total', cache) + 1
+    assert sample(after, 'pokescouter_cache_entries', cache) >= 1
+    assert '# TYPE pokescouter_cache_hit_rate gauge' in after
+
+
+def test_server_timing_is_off_by_default(app):
+    client = seed_one(app)
+
+    assert 'Server-Timing' not in client.get('/api/pokemon/1').headers
+
+
+def test_server_timing_reports_app_and_db_time(app):
+    app.config['METRICS_SERVER_TIMING'] = True
+    client = seed_one(app)
+
+    header = client.get('/api/pokemon/1').headers['Server-Timing']
+
+    parts = [part.strip() for part in header.split(',')]
+    assert parts[0].startswith('app;dur=')
+    assert parts[1].startswith('db;dur=') and parts[1].endswith('desc="2 queries"')
+
+    # Served from the response cache without touching the database
+    header = client.get('/api/pokemon/1').headers['Server-Timing']
+    assert 'desc="0 queries"' in header
+
+
+def test_histogram_buckets_are_cumulative():
+    histogram = Histogram('demo_seconds', 'Demo.', labels=('route',), buckets=(0.1, 1.0))
+    histogram.observe(0.05, '/a')
+    histogram.observe(0.5, '/a')
+    histogram.observe(5.0, '/a')
+
+    lines = histogram.render()
+
+    assert 'demo_seconds_bucket{route="/a",le="0.1"} 1' in lines
+    assert 'demo_seconds_bucket{route="/a",le="1"} 2' in lines
+    assert 'demo_seconds_bucket{route="/a",le="+Inf"} 3' in lines
+    assert 'demo_seconds_sum{route="/a"} 5.550000' in lines
+    assert 'demo_seconds_count{route="/a"} 3' in lines
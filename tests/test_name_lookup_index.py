@@ -0,0 +1,29 @@
+"""
+Description: Case-insensitive name lookups are answered from ix_pokemon_name_key.
+Author: Bryan Vela
+Created: 2026-10-17
+"""
+from models.pokemon import Pokemon
+from services.pokemon_service import PokemonService
+from tests.factories import make_pokemon
+from utils.db import db
+
+
+def query_plan(statements, run):
+    """EXPLAIN QUERY PLAN of the last statement run() executes."""
+    before = len(statements)
+    run()
+    sql, params = statements[before:][-1]
+    rows = db.session.connection().exec_driver_sql(f'EXPLAIN QUERY PLAN {sql}', params).all()
+    return ' '.join(row[-1] for row in rows)
+
+
+def test_name_lookups_use_name_key_index(app, statements):
+    PokemonService().save_pokemon_batch([make_pokemon(n) for n in range(1, 6)])
+    db.session.remove()
+
+    by_name = query_plan(statements, lambda: Pokemon.get_by_name('  MON-3 '))
+    exists = query_plan(statements, lambda: Pokemon.exists('Mon-3'))
+
+    assert 'ix_pokemon_name_key' in by_name
+    assert 'ix_pokemon_name_key' in exists
@@ -0,0 +1,41 @@
+"""
+Description: PokeAPI disk cache - reads don't write, LRU order still holds.
+Author: Bryan Vela
+Created: 2026-10-17
+"""
+import sqlite3
+
+from services.pokeapi_cache import PokeAPICache
+
+
+def last_access(path, endpoint):
+    with sqlite3.connect(path) as conn:
+        return conn.execute('SELECT last_access FROM responses WHERE endpoint = ?', (endpoint,)).fetchone()[0]
+
+
+def test_get_does_not_write(tmp_path):
+    path = str(tmp_path / 'cache.db')
+    cache = PokeAPICache(path)
+    cache.put('pokemon/a', b'a')
+    stored = last_access(path, 'pokemon/a')
+    changes = cache._conn().total_changes
+
+    for _ in range(10):
+        assert cache.get('pokemon/a').body == b'a'
+
+    assert cache._conn().total_changes == changes
+    assert last_access(path, 'pokemon/a') == stored
+
+
+def test_pending_access_times_drive_eviction(tmp_path):
+    path = str(tmp_path / 'cache.db')
+    cache = PokeAPICache(path, max_bytes=2)
+    cache.put('pokemon/a', b'a')
+    cache.put('pokemon/b', b'b')
+
+    cache.get('pokemon/a')  # a is now more recent than b, in memory only
+    cache.put('pokemon/c', b'c')
+
+    assert cache.get('pokemon/a') is not None
+    assert cache.get('pokemon/b') is None
+    assert cache.get('pokemon/c') is not None
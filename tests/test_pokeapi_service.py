@@ -0,0 +1,59 @@
+"""
+Description: PokeAPI client - stale cached bodies when the upstream refuses.
+Author: Bryan Vela
+Created: 2026-10-17
+"""
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from services.pokeapi_service import PokeAPIService
+
+
+class _RateLimitedHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        self.send_response(429)
+        self.send_header('Retry-After', '0')
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def stub_server():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _RateLimitedHandler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    host, port = server.server_address[:2]
+    yield f'http://{host}:{port}'
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def config_overrides(tmp_path):
+    return {'POKEAPI_CACHE_PATH': str(tmp_path / 'pokeapi.db'), 'POKEAPI_CACHE_TTL': 0}
+
+
+def test_429_serves_stale_cached_body(app, stub_server):
+    app.config['POKEAPI_BASE_URL'] = stub_server
+    service = PokeAPIService()
+    service.cache.put('/pokemon/pikachu', b'{"name": "pikachu"}')
+
+    data, status = service._request('/pokemon/pikachu')
+
+    assert status == 429
+    assert data == {'name': 'pikachu'}
+
+
+def test_429_without_cached_body_returns_none(app, stub_server):
+    app.config['POKEAPI_BASE_URL'] = stub_server
+    service = PokeAPIService()
+
+    assert service._request('/pokemon/pikachu') == (None, 429)
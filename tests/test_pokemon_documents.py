@@ -0,0 +1,64 @@
+"""
+Description: Stored Pokemon documents match to_dict() byte for byte.
+Author: Bryan Vela
+Created: 2026-10-17
+"""
+from flask import jsonify
+
+from models.pokemon import Pokemon
+from services.pokemon_service import PokemonService
+from services.response_cache import pokemon_response_cache
+from tests.factories import make_pokemon
+from utils.db import db
+
+
+def orm_pokemon(pokemon_id):
+    """Pokemon loaded fresh through the relationships, not the stored document."""
+    db.session.remove()
+    return db.session.get(Pokemon, pokemon_id)
+
+
+def get(app, url):
+    pokemon_response_cache.clear()
+    response = app.test_client().get(url)
+    assert response.status_code == 200
+    return response.get_data()
+
+
+def test_single_response_matches_jsonify_of_to_dict(app):
+    PokemonService().save_pokemon_batch([make_pokemon(1), make_pokemon(2, types=('water',))])
+
+    for pokemon_id in (1, 2):
+        expected = jsonify({'success': True, 'data': orm_pokemon(pokemon_id).to_dict()}).get_data()
+        assert get(app, f'/api/pokemon/{pokemon_id}') == expected
+        assert get(app, f'/api/pokemon/name/mon-{pokemon_id}') == expected
+
+
+def test_list_response_matches_jsonify_of_to_dict(app):
+    PokemonService().save_pokemon_batch([make_pokemon(n) for n in range(1, 6)])
+
+    db.session.remove()
+    pokemon_list = db.session.query(Pokemon).order_by(Pokemon.id).all()
+    expected = jsonify({
+        'success': True,
+        'data': [pokemon.to_dict() for pokemon in pokemon_list],
+        'count': 5,
+        'next_cursor': None
+    }).get_data()
+
+    assert get(app, '/api/pokemon/?limit=10') == expected
+
+
+def test_orm_stat_update_refreshes_the_document(app):
+    PokemonService().save_pokemon_batch([make_pokemon(1)])
+    before = get(app, '/api/pokemon/1')
+
+    pokemon = orm_pokemon(1)
+    attack = next(stat for stat in pokemon.stats if stat.name == 'attack')
+    attack.value = 250
+    db.session.commit()
+
+    after = get(app, '/api/pokemon/1')
+    assert after != before
+    assert b'"attack":250' in after
+    assert after == jsonify({'success': True, 'data': orm_pokemon(1).to_dict()}).get_data()
@@ -0,0 +1,26 @@
+"""
+Description: Serializing a page of Pokemon costs the same queries at any page size.
+Author: Bryan Vela
+Created: 2026-10-17
+"""
+from services.pokemon_service import PokemonService
+from tests.factories import make_pokemon
+from utils.db import db
+
+
+def serialize_page(limit, statements):
+    db.session.remove()
+    before = len(statements)
+    pokemon_list, _ = PokemonService().get_all_pokemon(limit=limit)
+    page = [pokemon.to_dict() for pokemon in pokemon_list]
+    return len(page), len(statements) - before
+
+
+def test_page_query_count_does_not_grow_with_page_size(app, statements):
+    PokemonService().save_pokemon_batch([make_pokemon(n) for n in range(1, 31)])
+
+    small_rows, small_queries = serialize_page(5, statements)
+    large_rows, large_queries = serialize_page(30, statements)
+
+    assert (small_rows, large_rows) == (5, 30)
+    assert small_queries == large_queries
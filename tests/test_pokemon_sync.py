@@ -0,0 +1,35 @@
+"""
+Description: sync_pokemon_list outcome lists and their job totals.
+Author: Bryan Vela
+Created: 2026-10-17
+"""
+from models.fetchJob import FetchJob
+from services.pokemon_service import PokemonService
+from tests.factories import make_pokemon
+
+
+def test_repeated_names_are_duplicates_not_already_exists(app, monkeypatch):
+    service = PokemonService()
+    service.save_pokemon_batch([make_pokemon(1)])
+
+    def fetch_many(names):
+        for name in names:
+            yield name, make_pokemon(int(name.rsplit('-', 1)[1])), 0.0
+
+    monkeypatch.setattr(service, 'fetch_many', fetch_many)
+
+    results = service.sync_pokemon_list(['mon-1', 'mon-2', 'MON-2', 'mon-1 '])
+
+    assert results['success'] == ['mon-2']
+    assert results['already_exists'] == ['mon-1']
+    assert results['duplicates'] == ['MON-2', 'mon-1']
+    assert results['failed'] == []
+
+
+def test_job_counts_duplicates_on_results_stored_without_them(app):
+    job = FetchJob(names=['mon-1', 'mon-1'], total=2, processed=0)
+    job.results = {'success': [], 'failed': [], 'already_exists': ['mon-1'], 'timings': {}}
+
+    job.record_chunk({'success': [], 'failed': [], 'already_exists': [], 'duplicates': ['mon-1'], 'timings': {}}, 2)
+
+    assert job.to_dict()['counts'] == {'success': 0, 'failed': 0, 'already_exists': 1, 'duplicates': 1}
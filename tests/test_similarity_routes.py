@@ -0,0 +1,14 @@
+"""
+Description: Request body validation of the batch similarity endpoint.
+Author: Bryan Vela
+Created: 2026-10-17
+"""
+import pytest
+
+
+@pytest.mark.parametrize('body', [[1, 2], 'ids', 7, {'ids': [1, True]}, {'ids': [False]}, {'ids': []}])
+def test_similar_batch_rejects_invalid_bodies(app, body):
+    response = app.test_client().post('/api/pokemon/similar', json=body)
+
+    assert response.status_code == 400
+    assert response.get_json()['success'] is False
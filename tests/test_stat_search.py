@@ -0,0 +1,26 @@
+"""
+Description: Stat range search, including databases upgraded without a stat summary.
+Author: Bryan Vela
+Created: 2026-10-17
+"""
+from app import create_app
+from models.pokemonStatSummary import PokemonStatSummary
+from services.pokemon_service import PokemonService
+from tests.factories import make_pokemon
+from utils.db import db
+
+
+def test_search_after_upgrade_without_summary_rows(app, test_config):
+    PokemonService().save_pokemon_batch([make_pokemon(n) for n in range(1, 4)])
+    # As on a database created before pokemon_stat_summary existed
+    PokemonStatSummary.__table__.drop(db.engine)
+    db.session.remove()
+
+    # Restart: create_all adds the empty table, init_db fills it
+    restarted = create_app(test_config)
+    with restarted.app_context():
+        assert PokemonStatSummary.query.count() == 3
+        response = restarted.test_client().get('/api/pokemon/search?min_hp=1')
+
+    assert response.status_code == 200
+    assert response.get_json()['count'] == 3
@@ -0,0 +1,14 @@
+"""
+Description: Request body validation of the team coverage endpoint.
+Author: Bryan Vela
+Created: 2026-10-17
+"""
+import pytest
+
+
+@pytest.mark.parametrize('body', [[1, 2], 'ids', 7, {'ids': [1, True]}, {'ids': [False]}, {'ids': []}])
+def test_team_coverage_rejects_invalid_bodies(app, body):
+    response = app.test_client().post('/api/pokemon/team/coverage', json=body)
+
+    assert response.status_code == 400
+    assert response.get_json()['success'] is False
@@ -0,0 +1,29 @@
+"""
+Description: Type registry sees types other processes insert.
+Author: Bryan Vela
+Created: 2026-10-17
+"""
+import sqlite3
+
+from models.typeRegistry import type_registry
+from services.pokemon_service import PokemonService
+from tests.factories import make_pokemon
+from utils.db import db
+
+
+def test_lookup_miss_picks_up_types_inserted_elsewhere(app):
+    PokemonService().save_pokemon_batch([make_pokemon(1, types=('fire',))])
+    client = app.test_client()
+    assert client.get('/api/pokemon/type/water').status_code == 404
+
+    # Another process saves a water Pokemon after this one loaded the map
+    other = sqlite3.connect(db.engine.url.database)
+    with other:
+        other.execute(
+            "INSERT INTO pokemon_type (name, created_at, updated_at) "
+            "VALUES ('water', datetime('now'), datetime('now'))"
+        )
+    other.close()
+
+    assert type_registry.get_id(' Water ') is not None
+    assert client.get('/api/pokemon/type/water').status_code == 200
@@ -0,0 +1,82 @@
+"""
+Description: Bounded, thread-safe LRU cache with per-entry TTL.
+Author: Bryan Vela
+Created: 2026-10-17
+"""
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional
+
+
+class LRUCache:
+    """
+    In-process LRU cache with a time-to-live per entry.
+
+    Keeps hit/miss/eviction counters so the cache can be sized from
+    production traffic.
+    """
+
+    def __init__(self, max_entries: int = 1024, ttl: float = 300):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {
+            'hits': 0,
+            'misses': 0,
+            'evictions': 0,
+            'expirations': 0
+        }
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value or None if missing or expired."""
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                self._stats['misses'] += 1
+                return None
+
+            value, expires_at = item
+            if expires_at < time.monotonic():
+                del self._data[key]
+                self._stats['expirations'] += 1
+                self._stats['misses'] += 1
+                return None
+
+            self._data.move_to_end(key)
+            self._stats['hits'] += 1
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None):
+        """Store a value, evicting the least recently used entries over the bound."""
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._data[key] = (value, expires_at)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+                self._stats['evictions'] += 1
+
+    def delete(self, key: Hashable) -> bool:
+        """Remove a key. Returns True if it was present."""
+        with self._lock:
+            return self._data.pop(key, None) is not None
+
+    def clear(self):
+        """Remove every entry (counters are kept)."""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self):
+        return len(self._data)
+
+    def stats(self) -> Dict[str, Any]:
+        """Counters plus current size and hit rate."""
+        with self._lock:
+            stats = dict(self._stats)
+            stats['entries'] = len(self._data)
+        lookups = stats['hits'] + stats['misses']
+        stats['max_entries'] = self.max_entries
+        stats['hit_rate'] = round(stats['hits'] / lookups, 4) if lookups else 0.0
+        return stats
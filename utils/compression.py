@@ -0,0 +1,83 @@
+"""
+Description: Response compression helpers.
+Author: Bryan Vela
+Created: 2026-10-17
+"""
+import gzip
+import zlib
+from typing import Iterable, Iterator
+
+from flask import request
+
+
+def client_accepts_gzip() -> bool:
+    """True if the current request advertises gzip in Accept-Encoding."""
+    return request.accept_encodings['gzip'] > 0
+
+
+def gzip_stream(chunks: Iterable[bytes], level: int = 6) -> Iterator[bytes]:
+    """
+    Gzip an iterable of byte chunks on the fly.
+
+    Each input chunk is sync-flushed so the client receives data as it is
+    produced instead of when the compressor's window fills.
+    """
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 31)  # wbits 31 = gzip container
+    for chunk in chunks:
+        data = compressor.compress(chunk) + compressor.flush(zlib.Z_SYNC_FLUSH)
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+# Mimetypes worth compressing
+COMPRESSIBLE_MIMETYPES = ('application/json', 'application/x-ndjson', 'text/csv', 'text/plain', 'text/html')
+
+
+def gzip_response(response, level: int = 6, min_size: int = 1024):
+    """
+    Gzip a buffered response body in place if the client accepts it.
+
+    Skips streamed bodies (they compress themselves, see gzip_stream),
+    non-200 responses, already encoded bodies and bodies under min_size.
+    A strong ETag gets a -gzip suffix, since the encoded bytes differ.
+    """
+    from utils.http_cache import GZIP_ETAG_SUFFIX
+
+    response.vary.add('Accept-Encoding')
+    if (
+        response.status_code != 200
+        or response.is_streamed
+        or response.direct_passthrough
+        or 'Content-Encoding' in response.headers
+        or response.mimetype not in COMPRESSIBLE_MIMETYPES
+        or not client_accepts_gzip()
+    ):
+        return response
+
+    body = response.get_data()
+    if len(body) < min_size:
+        return response
+
+    response.set_data(gzip.compress(body, compresslevel=level))
+    response.headers['Content-Encoding'] = 'gzip'
+    etag, weak = response.get_etag()
+    if etag and not weak:
+        response.set_etag(etag + GZIP_ETAG_SUFFIX)
+    return response
+
+
+def init_compression(app):
+    """
+    Gzip buffered responses of every route.
+
+    Config:
+        GZIP_COMPRESSION_LEVEL (int): 1 (fastest) - 9 (smallest)
+        GZIP_MIN_SIZE (int): Bodies smaller than this many bytes are sent as is
+    """
+    level = app.config.get('GZIP_COMPRESSION_LEVEL', 6)
+    min_size = app.config.get('GZIP_MIN_SIZE', 1024)
+
+    @app.after_request
+    def _compress(response):
+        return gzip_response(response, level=level, min_size=min_size)
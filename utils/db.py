@@ -1,28 +1,216 @@
+from flask import has_request_context, request
 from flask_sqlalchemy import SQLAlchemy
+from flask_sqlalchemy.session import Session
+from sqlalchemy import event, inspect, make_url, text
+
+# Requests served by the read-only engine
+READ_METHODS = ('GET', 'HEAD')
+
+# Config key -> pragma set on every new SQLite connection
+SQLITE_PRAGMAS = (
+    ('SQLITE_JOURNAL_MODE', 'journal_mode'),
+    ('SQLITE_SYNCHRONOUS', 'synchronous'),
+    ('SQLITE_CACHE_SIZE', 'cache_size'),
+    ('SQLITE_MMAP_SIZE', 'mmap_size'),
+    ('SQLITE_BUSY_TIMEOUT', 'busy_timeout')
+)
+
+
+class RoutingSession(Session):
+    """
+    Session that sends reads in GET/HEAD requests to the 'reader' bind.
+
+    Everything else - flushes, INSERT/UPDATE/DELETE, background jobs, CLI
+    commands and non-GET requests - uses the default (writer) engine. Once a
+    transaction has written, its reads stay on the writer so they see their
+    own uncommitted rows.
+    """
+
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        if bind is None and 'reader' in self._db.engines and self._reads_from_replica(clause):
+            return self._db.engines['reader']
+        return super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+
+    def _reads_from_replica(self, clause):
+        if self._flushing or (clause is not None and not getattr(clause, 'is_select', False)):
+            self.info['wrote'] = True
+            return False
+        return (
+            not self.info.get('wrote')
+            and has_request_context()
+            and request.method in READ_METHODS
+        )
+
+    def commit(self):
+        try:
+            super().commit()
+        finally:
+            self.info.pop('wrote', None)
+
+    def rollback(self):
+        try:
+            super().rollback()
+        finally:
+            self.info.pop('wrote', None)
+
+    def close(self):
+        try:
+            super().close()
+        finally:
+            self.info.pop('wrote', None)
+
 
 # Singleton database instance
-db = SQLAlchemy()
+db = SQLAlchemy(session_options={'class_': RoutingSession})
+
+
+def _is_sqlite(url):
+    return make_url(url).get_backend_name() == 'sqlite'
+
+
+def _is_memory_sqlite(url):
+    url = make_url(url)
+    return _is_sqlite(url) and url.database in (None, '', ':memory:')
+
+
+def configure_engines(app):
+    """
+    Fill SQLALCHEMY_ENGINE_OPTIONS and the 'reader' bind from DB_* config.
+
+    Values already set in SQLALCHEMY_ENGINE_OPTIONS / SQLALCHEMY_BINDS win.
+    In-memory SQLite keeps Flask-SQLAlchemy's single static connection and
+    gets no reader, since a second engine would open a different database.
+    """
+    url = app.config.get('SQLALCHEMY_DATABASE_URI')
+    if not url or _is_memory_sqlite(url):
+        return
+
+    options = dict(app.config.get('SQLALCHEMY_ENGINE_OPTIONS') or {})
+    options.setdefault('pool_size', app.config.get('DB_POOL_SIZE', 5))
+    options.setdefault('max_overflow', app.config.get('DB_MAX_OVERFLOW', 10))
+    options.setdefault('pool_timeout', app.config.get('DB_POOL_TIMEOUT', 30))
+    options.setdefault('pool_recycle', app.config.get('DB_POOL_RECYCLE', 3600))
+    options.setdefault('pool_pre_ping', not _is_sqlite(url))
+    app.config['SQLALCHEMY_ENGINE_OPTIONS'] = options
+
+    if app.config.get('DB_READ_ENGINE', True):
+        binds = dict(app.config.get('SQLALCHEMY_BINDS') or {})
+        binds.setdefault('reader', {
+            'url': url,
+            'pool_size': app.config.get('DB_READ_POOL_SIZE', 10),
+            'max_overflow': 0
+        })
+        app.config['SQLALCHEMY_BINDS'] = binds
+
+
+def apply_sqlite_pragmas(engine, config, read_only=False):
+    """
+    Set the SQLITE_* pragmas on every new connection of engine.
+
+    The reader skips journal_mode (it is stored in the file, and changing
+    it needs a write) and adds query_only so a stray write fails loudly.
+    """
+    pragmas = [
+        (pragma, config.get(key)) for key, pragma in SQLITE_PRAGMAS
+        if config.get(key) not in (None, '') and not (read_only and pragma == 'journal_mode')
+    ]
+    if read_only:
+        pragmas.append(('query_only', 'ON'))
+
+    @event.listens_for(engine, 'connect')
+    def _set_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for pragma, value in pragmas:
+                cursor.execute(f'PRAGMA {pragma} = {value}')
+        finally:
+            cursor.close()
+
+
+def serialize_writes(engine):
+    """
+    Start every write transaction on engine with BEGIN IMMEDIATE.
+
+    pysqlite opens a transaction only before the first INSERT/UPDATE/DELETE
+    (reads before it run in autocommit), so this takes SQLite's write lock
+    at the first write and holds it until commit or rollback. The lock is
+    the database file's, so writers in other processes (app workers, CLI
+    imports) queue on it too, each waiting up to SQLITE_BUSY_TIMEOUT. A
+    writer that times out raises OperationalError ("database is locked")
+    before it has written anything.
+    """
+    @event.listens_for(engine, 'connect')
+    def _begin_immediate(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = 'IMMEDIATE'
 
 
 def init_db(app):
     """Initialize database with Flask app"""
+    configure_engines(app)
     db.init_app(app)
     
     with app.app_context():
+        if _is_sqlite(db.engine.url):
+            apply_sqlite_pragmas(db.engine, app.config)
+            if 'reader' in db.engines:
+                apply_sqlite_pragmas(db.engines['reader'], app.config, read_only=True)
+            if app.config.get('DB_SERIALIZE_WRITES', True):
+                serialize_writes(db.engine)
+        
         from models.pokemon import Pokemon
         from models.pokemonType import PokemonType
         from models.pokemonStat import PokemonStat
+        from models.pokemonStatSummary import PokemonStatSummary
         from models.pokemonAbility import PokemonAbility
+        from models.importCheckpoint import ImportCheckpoint
+        from models.fetchJob import FetchJob
+        from models.fetchLock import FetchLock
         
-        # Create all tables
-        db.create_all()
+        # Create all tables (the reader bind has no tables of its own)
+        db.create_all(bind_key=None)
+        ensure_columns()
+        ensure_indexes()
+        
+        # A summary table added to an existing database starts out empty
+        with db.engine.begin() as connection:
+            PokemonStatSummary.backfill(connection)
         
         print("Database initialized successfully!")
 
 
+def ensure_columns():
+    """
+    Add columns introduced after a table already existed.
+    
+    Columns are added as nullable; a column with info['backfill'] is filled
+    from that SQL expression (e.g. 'lower(name)').
+    """
+    inspector = inspect(db.engine)
+    with db.engine.begin() as connection:
+        for table in db.metadata.sorted_tables:
+            if not inspector.has_table(table.name):
+                continue
+            existing = {column['name'] for column in inspector.get_columns(table.name)}
+            for column in table.columns:
+                if column.name in existing:
+                    continue
+                column_type = column.type.compile(dialect=db.engine.dialect)
+                connection.execute(text(f'ALTER TABLE {table.name} ADD COLUMN {column.name} {column_type}'))
+                backfill = column.info.get('backfill')
+                if backfill:
+                    connection.execute(text(f'UPDATE {table.name} SET {column.name} = {backfill}'))
+
+
+def ensure_indexes():
+    """Create indexes added to models after their table already existed"""
+    for table in db.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=db.engine, checkfirst=True)
+
+
 def reset_db(app):
     """Reset database (drop all tables and recreate)"""
     with app.app_context():
-        db.drop_all()
-        db.create_all()
+        db.drop_all(bind_key=None)
+        db.create_all(bind_key=None)
         print("Database reset successfully!")
\ No newline at end of file
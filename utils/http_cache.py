@@ -0,0 +1,52 @@
+"""
+Description: ETags and conditional GET helpers for read endpoints.
+Author: Bryan Vela
+Created: 2026-10-17
+"""
+import hashlib
+from datetime import datetime
+from typing import Optional
+
+from flask import Response, request
+
+# Suffix of the ETag of a gzip-encoded representation (see utils.compression)
+GZIP_ETAG_SUFFIX = '-gzip'
+
+
+def _version(updated_at: Optional[datetime]) -> str:
+    return updated_at.strftime('%Y%m%d%H%M%S%f') if updated_at else '0'
+
+
+def pokemon_etag(pokemon_id: int, updated_at: Optional[datetime]) -> str:
+    """Strong (unquoted) ETag of one Pokemon: its id and last write time."""
+    return f'p{pokemon_id}-{_version(updated_at)}'
+
+
+def list_etag(count: int, max_updated_at: Optional[datetime], *params) -> str:
+    """
+    Strong ETag of a list page.
+
+    count and max(updated_at) change on every insert, update and delete
+    (writes through the ORM bump updated_at, see Pokemon.refresh_documents);
+    params are the page arguments.
+    """
+    key = '|'.join([str(count), _version(max_updated_at)] + [str(param) for param in params])
+    return 'l' + hashlib.blake2b(key.encode('utf-8'), digest_size=10).hexdigest()
+
+
+def not_modified(etag: str) -> Optional[Response]:
+    """
+    A 304 response if If-None-Match matches etag (either encoding), else None.
+
+    Called before the body is loaded or encoded.
+    """
+    if_none_match = request.if_none_match
+    if not if_none_match:
+        return None
+    for candidate in (etag, etag + GZIP_ETAG_SUFFIX):
+        if if_none_match.contains_weak(candidate):
+            response = Response(status=304)
+            response.set_etag(candidate)
+            response.headers['Vary'] = 'Accept-Encoding'
+            return response
+    return None
@@ -0,0 +1,264 @@
+"""
+Description: Request-scoped instrumentation and Prometheus text metrics.
+Author: Bryan Vela
+Created: 2026-10-17
+"""
+import logging
+import threading
+import time
+from bisect import bisect_left
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from flask import Response, g, has_request_context, request
+from sqlalchemy import event
+
+logger = logging.getLogger(__name__)
+
+# Seconds; covers cached hits (sub-ms) up to slow upstream syncs
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Statements kept per request for the slow-request log
+MAX_RECORDED_STATEMENTS = 200
+
+
+def _escape(value) -> str:
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _label_text(names: Tuple[str, ...], values: Tuple[str, ...]) -> str:
+    if not names:
+        return ''
+    return '{' + ','.join(f'{name}="{_escape(value)}"' for name, value in zip(names, values)) + '}'
+
+
+class Counter:
+    """Monotonic counter with optional labels."""
+
+    def __init__(self, name: str, help_text: str, labels: Iterable[str] = ()):
+        self.name = name
+        self.help = help_text
+        self.labels = tuple(labels)
+        self._values: Dict[Tuple[str, ...], float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, *label_values, amount: float = 1.0):
+        with self._lock:
+            self._values[label_values] = self._values.get(label_values, 0.0) + amount
+
+    def render(self) -> List[str]:
+        lines = [f'# HELP {self.name} {self.help}', f'# TYPE {self.name} counter']
+        with self._lock:
+            items = sorted(self._values.items())
+        for label_values, value in items:
+            lines.append(f'{self.name}{_label_text(self.labels, label_values)} {value:g}')
+        return lines
+
+
+class Histogram:
+    """Cumulative-bucket histogram with optional labels."""
+
+    def __init__(self, name: str, help_text: str, labels: Iterable[str] = (),
+                 buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.name = name
+        self.help = help_text
+        self.labels = tuple(labels)
+        self.buckets = tuple(buckets)
+        self._series: Dict[Tuple[str, ...], List[float]] = {}  # bucket counts..., +Inf count, sum
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, *label_values):
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(label_values)
+            if series is None:
+                series = self._series[label_values] = [0.0] * (len(self.buckets) + 2)
+            series[index] += 1
+            series[-1] += value
+
+    def render(self) -> List[str]:
+        lines = [f'# HELP {self.name} {self.help}', f'# TYPE {self.name} histogram']
+        with self._lock:
+            items = sorted((key, list(series)) for key, series in self._series.items())
+        for label_values, series in items:
+            cumulative = 0.0
+            for bound, count in zip(self.buckets + (float('inf'),), series):
+                cumulative += count
+                le = '+Inf' if bound == float('inf') else f'{bound:g}'
+                labels = _label_text(self.labels + ('le',), label_values + (le,))
+                lines.append(f'{self.name}_bucket{labels} {cumulative:g}')
+            labels = _label_text(self.labels, label_values)
+            lines.append(f'{self.name}_sum{labels} {series[-1]:.6f}')
+            lines.append(f'{self.name}_count{labels} {cumulative:g}')
+        return lines
+
+
+class MetricsRegistry:
+    """
+    Process-wide metrics plus collectors read at scrape time (cache stats).
+    """
+
+    def __init__(self):
+        self.request_duration = Histogram(
+            'pokescouter_request_duration_seconds', 'HTTP request latency by route.',
+            labels=('method', 'route', 'status')
+        )
+        self.request_queries = Histogram(
+            'pokescouter_request_sql_queries', 'SQL statements issued per HTTP request.',
+            labels=('route',), buckets=(0, 1, 2, 3, 5, 10, 20, 50, 100, 250)
+        )
+        self.sql_duration = Histogram(
+            'pokescouter_sql_duration_seconds', 'SQL statement execution time.'
+        )
+        self.pokeapi_duration = Histogram(
+            'pokescouter_pokeapi_request_duration_seconds', 'PokeAPI call latency by outcome.',
+            labels=('status',)
+        )
+        self.pokeapi_requests = Counter(
+            'pokescouter_pokeapi_requests_total', 'PokeAPI calls by outcome.', labels=('status',)
+        )
+        self._caches: Dict[str, Callable[[], Dict[str, float]]] = {}
+
+    def register_cache(self, name: str, stats: Callable[[], Optional[Dict[str, float]]]):
+        """Export a cache's stats() (hits/misses/entries, hit_rate derived if absent)."""
+        self._caches[name] = stats
+
+    def _render_caches(self) -> List[str]:
+        caches = {}
+        for name, collector in self._caches.items():
+            try:
+                stats = collector()
+            except Exception as e:
+                logger.warning("cache stats for %s failed: %s", name, e)
+                continue
+            if stats is None:
+                continue
+            stats = dict(stats)
+            if 'hit_rate' not in stats and 'hits' in stats and 'misses' in stats:
+                lookups = stats['hits'] + stats['misses']
+                stats['hit_rate'] = stats['hits'] / lookups if lookups else 0.0
+            caches[name] = stats
+
+        lines = []
+        for metric, kind, help_text in (
+            ('hits', 'counter', 'Cache hits.'),
+            ('misses', 'counter', 'Cache misses.'),
+            ('entries', 'gauge', 'Entries currently cached.'),
+            ('hit_rate', 'gauge', 'Hits / lookups since start.')
+        ):
+            name = f'pokescouter_cache_{metric}' + ('_total' if kind == 'counter' else '')
+            lines += [f'# HELP {name} {help_text}', f'# TYPE {name} {kind}']
+            for cache, stats in sorted(caches.items()):
+                if metric in stats:
+                    lines.append(f'{name}{{cache="{cache}"}} {stats[metric]:g}')
+        return lines
+
+    def render(self) -> str:
+        lines = []
+        for metric in (self.request_duration, self.request_queries, self.sql_duration,
+                       self.pokeapi_duration, self.pokeapi_requests):
+            lines += metric.render()
+        lines += self._render_caches()
+        return '\n'.join(lines) + '\n'
+
+
+# Process-wide registry
+metrics = MetricsRegistry()
+
+
+def record_pokeapi_call(seconds: float, status: str):
+    """Record one PokeAPI call (status: HTTP code, 'timeout' or 'error')."""
+    metrics.pokeapi_duration.observe(seconds, status)
+    metrics.pokeapi_requests.inc(status)
+    if has_request_context():
+        g.metrics_pokeapi_ms = getattr(g, 'metrics_pokeapi_ms', 0.0) + seconds * 1000
+        g.metrics_pokeapi_calls = getattr(g, 'metrics_pokeapi_calls', 0) + 1
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault('metrics_started', []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = conn.info.get('metrics_started')
+    if not started:
+        return
+    elapsed = time.perf_counter() - started.pop()
+    metrics.sql_duration.observe(elapsed)
+
+    if has_request_context():
+        g.metrics_sql_count = getattr(g, 'metrics_sql_count', 0) + 1
+        g.metrics_sql_ms = getattr(g, 'metrics_sql_ms', 0.0) + elapsed * 1000
+        statements = g.setdefault('metrics_sql_statements', [])
+        if len(statements) < MAX_RECORDED_STATEMENTS:
+            statements.append((elapsed * 1000, ' '.join(statement.split())))
+
+
+def _server_timing(total_ms: float) -> str:
+    parts = [
+        f'app;dur={total_ms:.2f}',
+        f'db;dur={getattr(g, "metrics_sql_ms", 0.0):.2f};desc="{getattr(g, "metrics_sql_count", 0)} queries"'
+    ]
+    if getattr(g, 'metrics_pokeapi_calls', 0):
+        parts.append(
+            f'pokeapi;dur={g.metrics_pokeapi_ms:.2f};desc="{g.metrics_pokeapi_calls} calls"'
+        )
+    return ', '.join(parts)
+
+
+def _route_label() -> str:
+    return request.url_rule.rule if request.url_rule is not None else 'unmatched'
+
+
+def init_metrics(app, engines):
+    """
+    Instrument app requests and the engines' statements, and serve GET /metrics.
+
+    Config:
+        METRICS_SERVER_TIMING (bool): Add a Server-Timing header to responses
+        SLOW_REQUEST_MS (float): Log requests slower than this with their SQL (0 disables)
+    """
+    for engine in engines:
+        if not event.contains(engine, 'before_cursor_execute', _before_cursor_execute):
+            event.listen(engine, 'before_cursor_execute', _before_cursor_execute)
+            event.listen(engine, 'after_cursor_execute', _after_cursor_execute)
+
+    @app.before_request
+    def _start_timer():
+        # g outlives the request when an app context was already pushed
+        g.metrics_sql_count = 0
+        g.metrics_sql_ms = 0.0
+        g.metrics_sql_statements = []
+        g.metrics_pokeapi_calls = 0
+        g.metrics_pokeapi_ms = 0.0
+        g.metrics_started = time.perf_counter()
+
+    @app.after_request
+    def _record_request(response):
+        started = getattr(g, 'metrics_started', None)
+        if started is None:
+            return response
+        elapsed = time.perf_counter() - started
+        route = _route_label()
+        queries = getattr(g, 'metrics_sql_count', 0)
+
+        metrics.request_duration.observe(elapsed, request.method, route, str(response.status_code))
+        metrics.request_queries.observe(queries, route)
+
+        if app.config.get('METRICS_SERVER_TIMING', False):
+            response.headers['Server-Timing'] = _server_timing(elapsed * 1000)
+
+        threshold = app.config.get('SLOW_REQUEST_MS', 500)
+        if threshold and elapsed * 1000 > threshold:
+            statements = getattr(g, 'metrics_sql_statements', [])
+            logger.warning(
+                "slow request %s %s -> %s in %.1f ms (%d queries, %.1f ms SQL)%s",
+                request.method, request.full_path.rstrip('?'), response.status_code, elapsed * 1000,
+                queries, getattr(g, 'metrics_sql_ms', 0.0),
+                ''.join(f'\n  [{ms:.2f} ms] {sql}' for ms, sql in statements)
+            )
+        return response
+
+    def metrics_endpoint():
+        return Response(metrics.render(), mimetype='text/plain; version=0.0.4')
+
+    app.add_url_rule('/metrics', 'metrics', metrics_endpoint, methods=['GET'])
@@ -0,0 +1,70 @@
+"""
+Description: In-process request coalescing (one in-flight call per key).
+Author: Bryan Vela
+Created: 2026-10-17
+"""
+import threading
+from typing import Any, Callable, Dict, Hashable, Tuple
+
+
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+        self.waiters = 0
+
+
+class SingleFlight:
+    """
+    Collapse concurrent calls for the same key into one.
+
+    The first caller for a key runs the function; callers arriving while it
+    is in flight block and receive the same result (or exception). Nothing
+    is cached: once the call finishes, the next caller runs it again.
+    """
+
+    def __init__(self):
+        self._calls: Dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+        self.stats = {'calls': 0, 'shared': 0}
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Tuple[Any, bool]:
+        """
+        Run fn once per in-flight key.
+
+        Returns:
+            tuple: (result, shared) - shared is True for callers that waited
+                on another caller's execution
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                call.waiters += 1
+                self.stats['shared'] += 1
+                leader = False
+            else:
+                call = self._calls[key] = _Call()
+                self.stats['calls'] += 1
+                leader = True
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result, True
+
+        try:
+            call.result = fn()
+        except Exception as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result, False
+
+    def in_flight(self) -> int:
+        with self._lock:
+            return len(self._calls)